@@ -24,11 +24,13 @@ from app.models.organization import (
 config = context.config
 
 # Set the SQLAlchemy URL from our settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", settings.get_database_url())
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# This line sets up loggers basically. Startup migrations keep the app's logging.
+if config.config_file_name is not None and not config.attributes.get(
+    "skip_logging_config"
+):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -48,7 +50,7 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = settings.DATABASE_URL
+    url = settings.get_database_url()
     context.configure(
         url=url,
         target_metadata=target_metadata,
@@ -68,7 +70,7 @@ def run_migrations_online() -> None:
 
     """
     configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = settings.DATABASE_URL
+    configuration["sqlalchemy.url"] = settings.get_database_url()
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
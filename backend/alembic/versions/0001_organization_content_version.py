@@ -0,0 +1,37 @@
+"""add organization content_version
+
+Revision ID: 0001_organization_content_version
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_organization_content_version"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases bootstrapped by create_all() already have the column
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("organizations"):
+        return
+    columns = [c["name"] for c in inspector.get_columns("organizations")]
+    if "content_version" not in columns:
+        op.add_column(
+            "organizations",
+            sa.Column(
+                "content_version", sa.Integer(), nullable=False, server_default="0"
+            ),
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("organizations", "content_version")
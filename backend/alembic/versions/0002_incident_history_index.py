@@ -0,0 +1,36 @@
+"""add incident history keyset index
+
+Revision ID: 0002_incident_history_index
+Revises: 0001_organization_content_version
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_incident_history_index"
+down_revision: Union[str, None] = "0001_organization_content_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases bootstrapped by create_all() already have the index
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("incidents"):
+        return
+    indexes = [i["name"] for i in inspector.get_indexes("incidents")]
+    if "ix_incidents_tenant_created_id" not in indexes:
+        op.create_index(
+            "ix_incidents_tenant_created_id",
+            "incidents",
+            ["tenant_id", "created_at", "id"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_incidents_tenant_created_id", table_name="incidents")
@@ -0,0 +1,58 @@
+"""add event outbox
+
+Revision ID: 0003_event_outbox
+Revises: 0002_incident_history_index
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_event_outbox"
+down_revision: Union[str, None] = "0002_incident_history_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases bootstrapped by create_all() already have the table
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("event_outbox"):
+        return
+
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["tenant_id"], ["organizations.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_event_outbox_id", "event_outbox", ["id"])
+    op.create_index("ix_event_outbox_created_at", "event_outbox", ["created_at"])
+    op.create_index(
+        "ix_event_outbox_undelivered",
+        "event_outbox",
+        ["id"],
+        postgresql_where=sa.text("delivered_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_outbox")
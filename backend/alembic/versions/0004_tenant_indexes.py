@@ -0,0 +1,68 @@
+"""add tenant-scoped composite and partial indexes
+
+Revision ID: 0004_tenant_indexes
+Revises: 0003_event_outbox
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_tenant_indexes"
+down_revision: Union[str, None] = "0003_event_outbox"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_INCIDENTS = sa.text("status = 'OPEN'")
+
+# (name, table, columns, extra create_index kwargs)
+INDEXES = [
+    ("ix_users_tenant_role", "users", ["tenant_id", "role"], {}),
+    ("ix_invitations_tenant_email", "invitations", ["tenant_id", "email"], {}),
+    ("ix_services_tenant_id_id", "services", ["tenant_id", "id"], {}),
+    (
+        "ix_incidents_open_tenant_created_id",
+        "incidents",
+        ["tenant_id", "created_at", "id"],
+        {"postgresql_where": OPEN_INCIDENTS, "sqlite_where": OPEN_INCIDENTS},
+    ),
+    ("ix_incident_services_service_id", "incident_services", ["service_id"], {}),
+    (
+        "ix_incident_updates_incident_id_id",
+        "incident_updates",
+        ["incident_id", "id"],
+        {},
+    ),
+    (
+        "ix_maintenances_tenant_status_start",
+        "maintenances",
+        ["tenant_id", "status", "scheduled_start"],
+        {},
+    ),
+    (
+        "ix_maintenances_tenant_start_id",
+        "maintenances",
+        ["tenant_id", "scheduled_start", "id"],
+        {},
+    ),
+    ("ix_maintenance_services_service_id", "maintenance_services", ["service_id"], {}),
+]
+
+
+def upgrade() -> None:
+    # Databases bootstrapped by create_all() already have these indexes
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns, kwargs in INDEXES:
+        if not inspector.has_table(table):
+            continue
+        if name not in [i["name"] for i in inspector.get_indexes(table)]:
+            op.create_index(name, table, columns, **kwargs)
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
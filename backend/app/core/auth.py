@@ -1,11 +1,15 @@
-from fastapi import HTTPException, status, Depends
+from typing import Optional
+import secrets
+from fastapi import HTTPException, status, Depends, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import jwt
 import requests
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.organization import User, Organization
+from app.services.slug_cache import CachedOrganization, organization_slug_cache
 
 security = HTTPBearer()
 
@@ -29,7 +33,7 @@ async def verify_clerk_token(token: str) -> dict:
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """Get current authenticated user from JWT token."""
     token = credentials.credentials
@@ -42,7 +46,7 @@ async def get_current_user(
             detail="Invalid token: missing user ID",
         )
 
-    user = db.query(User).filter(User.clerk_user_id == clerk_user_id).first()
+    user = await db.scalar(select(User).filter(User.clerk_user_id == clerk_user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -52,12 +56,11 @@ async def get_current_user(
 
 
 async def get_current_tenant(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Organization:
     """Get current user's organization/tenant."""
-    organization = (
-        db.query(Organization).filter(Organization.id == current_user.tenant_id).first()
-    )
+    organization = await db.get(Organization, current_user.tenant_id)
     if not organization:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
@@ -77,11 +80,48 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
-def get_organization_by_slug(slug: str, db: Session) -> Organization:
+async def get_organization_by_slug(slug: str, db: AsyncSession) -> CachedOrganization:
     """Get organization by slug for public endpoints."""
-    organization = db.query(Organization).filter(Organization.slug == slug).first()
+    organization = organization_slug_cache.get(slug)
+    if organization is not None:
+        # Always current: ETags and cached payloads are keyed by it
+        version = await db.scalar(
+            select(Organization.content_version).filter(
+                Organization.id == organization.id
+            )
+        )
+        if version is not None:
+            return organization.with_content_version(version)
+        organization_slug_cache.invalidate_slug(slug)  # Deleted since cached
+
+    if organization_slug_cache.is_missing(slug):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
+        )
+
+    organization = await db.scalar(
+        select(Organization).filter(Organization.slug == slug)
+    )
     if not organization:
+        organization_slug_cache.set_missing(slug)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found"
         )
-    return organization
+    return organization_slug_cache.set(organization)
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Guard operator endpoints that report on the whole process, not one tenant."""
+    if not settings.ADMIN_API_TOKEN:
+        if settings.ENVIRONMENT == "development":
+            return
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin endpoints are disabled; set ADMIN_API_TOKEN to enable them",
+        )
+    if not x_admin_token or not secrets.compare_digest(
+        x_admin_token, settings.ADMIN_API_TOKEN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token"
+        )
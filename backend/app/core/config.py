@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 import os
 
 
@@ -15,6 +15,8 @@ class Settings(BaseSettings):
     # Auth settings
     JWT_SECRET: str = "your-secret-key"  # Default for development
     CLERK_SECRET_KEY: str = ""
+    # X-Admin-Token for the /admin stats endpoints; unset, they only answer in development
+    ADMIN_API_TOKEN: str = ""
 
     # Environment settings
     ENVIRONMENT: str = "development"
@@ -30,6 +32,76 @@ class Settings(BaseSettings):
     )
     ALLOW_TEST_USERS: bool = False  # Allow test users in production
 
+    # Public status page snapshot cache
+    STATUS_CACHE_ENABLED: bool = True
+    STATUS_CACHE_MAX_ENTRIES: int = 1024
+    STATUS_CACHE_TTL_SECONDS: float = 300.0
+    STATUS_CACHE_COMPRESSION: bool = True  # Keep gzip/brotli variants per payload
+    STATUS_PAGE_SQL_JSON: bool = False  # Let Postgres build the status page JSON
+
+    # Public slug -> organization cache
+    SLUG_CACHE_MAX_ENTRIES: int = 4096
+    SLUG_CACHE_TTL_SECONDS: float = 5.0  # content_version is re-read on every request
+    SLUG_CACHE_MAX_NEGATIVE_ENTRIES: int = 10000
+    SLUG_CACHE_NEGATIVE_TTL_SECONDS: float = 30.0
+
+    # Opt-in serialize-once JSON responses for public and admin list endpoints
+    FAST_JSON_RESPONSES: bool = False
+
+    # Static status page publishing
+    STATIC_PUBLISH_ENABLED: bool = False
+    STATIC_PUBLISH_DIR: str = "static_status"
+
+    # Socket.IO fan-out across workers: "" (in-process), redis://, amqp:// or local://
+    SOCKETIO_MESSAGE_QUEUE: str = ""
+    SOCKETIO_CHANNEL: str = "status-page"
+    SOCKETIO_SEND_HIGH_WATER: int = (
+        32  # Queued packets before a client counts as lagging
+    )
+    SOCKETIO_SEND_QUEUE_MAX: int = (
+        256  # Held messages per lagging client (oldest dropped)
+    )
+    SOCKETIO_SLOW_CONSUMER_SECONDS: float = 30.0  # Disconnect clients lagging this long
+    SOCKETIO_MSGPACK_ENABLED: bool = True  # Binary packets for msgpack-parser clients
+
+    # Merge bursts of status_update events per tenant (0 sends every event at once)
+    STATUS_UPDATE_COALESCE_MS: int = 0
+    STATUS_UPDATE_MAX_DELAY_MS: int = 1000  # Upper bound on how long a burst is held
+
+    # Recent status_update events kept per tenant for replay on reconnect
+    # (single worker only; with SOCKETIO_MESSAGE_QUEUE clients always resync)
+    STATUS_EVENT_LOG_SIZE: int = 256
+    STATUS_EVENT_LOG_MAX_TENANTS: int = 10000
+
+    # Transactional outbox for real-time events
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0  # Fallback when no commit wakes it
+    OUTBOX_LEASE_SECONDS: float = 30.0  # Claimed rows are retried after this
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETENTION_HOURS: float = 24.0
+    OUTBOX_CLEANUP_INTERVAL_SECONDS: float = 300.0
+
+    # Event loop lag sampling and blocking-call detection
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_MONITOR_INTERVAL_MS: int = 100  # Heartbeat period used to measure lag
+    LOOP_BLOCK_THRESHOLD_MS: int = 100  # Stalls longer than this record a stack
+    LOOP_MONITOR_MAX_BLOCKERS: int = 100  # Distinct (route, function) offenders kept
+
+    # Read replicas for public status reads (comma-separated URLs; empty = primary only)
+    READ_REPLICA_URLS: str = ""
+    READ_YOUR_WRITES_SECONDS: float = (
+        5.0  # A tenant's reads stay on the primary after it writes
+    )
+    REPLICA_MAX_LAG_SECONDS: float = 5.0  # Replicas further behind get no traffic
+    REPLICA_HEALTH_CHECK_SECONDS: float = 2.0
+    REPLICA_CONNECT_TIMEOUT_SECONDS: float = 2.0  # Then the read falls back
+
+    # Per-request SQL query counting and timing
+    QUERY_METRICS_ENABLED: bool = True
+    QUERY_SERVER_TIMING: bool = False  # Send a Server-Timing header with the DB time
+    QUERY_LOG_COUNT_THRESHOLD: int = 20  # Requests running more queries are logged
+    QUERY_LOG_DB_MS: float = 200.0  # ...as are requests spending longer in the DB
+
     def get_database_url(self) -> str:
         """Get database URL - prioritize DATABASE_URL env var for production"""
         if self.DATABASE_URL:
@@ -37,6 +109,9 @@ class Settings(BaseSettings):
         # Fallback to constructed URL for development
         return f"postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    def get_read_replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.READ_REPLICA_URLS.split(",") if url.strip()]
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -0,0 +1,255 @@
+"""Event loop lag sampling and blocking-call detection.
+
+A heartbeat task sleeps for a fixed interval and records how late it wakes
+up; that lateness is the loop lag every other request and socket saw. A
+watchdog thread watches the heartbeat, and when the loop has not come back
+for longer than the threshold it grabs the loop thread's stack *while it is
+still blocked*. Each stall is attributed to the route of the request whose
+task held the loop (from ``LoopMonitorMiddleware``) and to the innermost
+frame in the ``app`` package, so ``/admin/loop/stats`` can list the worst
+offenders with a sample stack.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = Path(__file__).resolve().parent.parent
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Request scope served by each task; entries go away with their task
+_task_scopes: "weakref.WeakKeyDictionary[asyncio.Task, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class LoopMonitorMiddleware:
+    """ASGI middleware remembering which request each task is serving."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            task = asyncio.current_task()
+            if task is not None:
+                # The router adds the matched route to this same dict later
+                _task_scopes[task] = scope
+        await self.app(scope, receive, send)
+
+
+def _route_label(task: Optional[asyncio.Task]) -> str:
+    if task is None:
+        return "callback"  # A plain loop callback, not a task
+    scope = _task_scopes.get(task)
+    if scope is None:
+        # Socket.IO handlers and background tasks: name them by coroutine
+        coro = task.get_coro()
+        return f"task {getattr(coro, '__qualname__', task.get_name())}"
+    path = getattr(scope.get("route"), "path", None) or scope.get("path", "")
+    return f"{scope.get('method', '')} {path}".strip()
+
+
+def _function_label(stack: traceback.StackSummary) -> str:
+    """The innermost frame in our own code, else the innermost frame at all."""
+    for frame in reversed(stack):
+        path = Path(frame.filename)
+        if APP_DIR in path.parents and path.name != "loop_monitor.py":
+            location = path.relative_to(APP_DIR.parent)
+            return f"{location}:{frame.lineno} in {frame.name}"
+    if stack:
+        frame = stack[-1]
+        return f"{frame.filename}:{frame.lineno} in {frame.name}"
+    return "unknown"
+
+
+class LoopMonitor:
+    """Loop lag histogram plus the routes and functions that block the loop."""
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.1,
+        threshold_seconds: float = 0.1,
+        max_blockers: int = 100,
+        stack_limit: int = 30,
+        recent_samples: int = 1000,
+    ):
+        self.interval_seconds = interval_seconds
+        self.threshold_seconds = threshold_seconds
+        self.max_blockers = max_blockers
+        self.stack_limit = stack_limit
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._last_tick = time.monotonic()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._recent: Deque[float] = deque(maxlen=recent_samples)
+        self._bucket_counts = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self._blockers: Dict[tuple, Dict[str, Any]] = {}
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.blocks = 0
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stopped.clear()
+        self._task = self._loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            f"🩺 Event loop monitor started (block threshold "
+            f"{self.threshold_seconds * 1000:.0f} ms)"
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopped.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            started = time.monotonic()
+            self._last_tick = started
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(0.0, time.monotonic() - started - self.interval_seconds)
+            self._record_lag(lag)
+
+    def _watch(self) -> None:
+        """Runs in its own thread, so it keeps going while the loop is stuck."""
+        poll = min(self.threshold_seconds / 2, 0.05)
+        while not self._stopped.wait(poll):
+            stalled = time.monotonic() - self._last_tick - self.interval_seconds
+            if stalled < self.threshold_seconds:
+                continue
+            with self._lock:
+                if self._pending is None:
+                    self._pending = self._capture()
+
+    def _capture(self) -> Optional[Dict[str, Any]]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        stack = traceback.extract_stack(frame, limit=self.stack_limit)
+        if stack and stack[-1].name == "select" and "selectors" in stack[-1].filename:
+            return None  # Back waiting for I/O: the stall ended as we looked
+        return {
+            "route": _route_label(asyncio.current_task(self._loop)),
+            "function": _function_label(stack),
+            "stack": traceback.format_list(stack),
+        }
+
+    def _record_lag(self, lag: float) -> None:
+        self.samples += 1
+        self.total_lag += lag
+        self.max_lag = max(self.max_lag, lag)
+        self._recent.append(lag)
+        lag_ms = lag * 1000
+        for i, bound in enumerate(LAG_BUCKETS_MS):
+            if lag_ms <= bound:
+                self._bucket_counts[i] += 1
+                break
+        else:
+            self._bucket_counts[-1] += 1
+
+        with self._lock:
+            pending, self._pending = self._pending, None
+        # A capture racing the heartbeat's own wake-up is not a real stall
+        if pending is not None and lag >= self.threshold_seconds:
+            self._record_blocker(pending, lag)
+
+    def _record_blocker(self, capture: Dict[str, Any], duration: float) -> None:
+        self.blocks += 1
+        duration_ms = duration * 1000
+        key = (capture["route"], capture["function"])
+        entry = self._blockers.get(key)
+        if entry is None:
+            if len(self._blockers) >= self.max_blockers:
+                # Forget the offender that has cost the least so far
+                least = min(self._blockers, key=lambda k: self._blockers[k]["total_ms"])
+                del self._blockers[least]
+            entry = self._blockers[key] = {
+                "route": capture["route"],
+                "function": capture["function"],
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+            }
+        entry["count"] += 1
+        entry["total_ms"] = round(entry["total_ms"] + duration_ms, 3)
+        entry["max_ms"] = round(max(entry["max_ms"], duration_ms), 3)
+        entry["last_seen"] = datetime.now(timezone.utc).isoformat()
+        entry["stack"] = capture["stack"]
+        logger.warning(
+            f"🐢 Event loop blocked for {duration_ms:.0f} ms by "
+            f"{capture['function']} ({capture['route']})"
+        )
+
+    def top_blockers(self, limit: int = 10) -> List[Dict[str, Any]]:
+        ranked = sorted(
+            self._blockers.values(), key=lambda e: e["total_ms"], reverse=True
+        )
+        return ranked[:limit]
+
+    def stats(self, limit: int = 10) -> Dict[str, Any]:
+        recent = sorted(self._recent)
+
+        def pick(q: float) -> Optional[float]:
+            if not recent:
+                return None
+            return round(recent[min(len(recent) - 1, int(q * len(recent)))] * 1000, 3)
+
+        bounds = [str(bound) for bound in LAG_BUCKETS_MS] + ["+Inf"]
+        return {
+            "running": self._task is not None,
+            "interval_ms": self.interval_seconds * 1000,
+            "threshold_ms": self.threshold_seconds * 1000,
+            "lag_ms": {
+                "samples": self.samples,
+                "mean": (
+                    round(self.total_lag / self.samples * 1000, 3)
+                    if self.samples
+                    else None
+                ),
+                "max": round(self.max_lag * 1000, 3),
+                "p50": pick(0.50),
+                "p90": pick(0.90),
+                "p99": pick(0.99),
+            },
+            # Upper bound (ms) -> samples in that bucket
+            "histogram": dict(zip(bounds, self._bucket_counts)),
+            "blocks": self.blocks,
+            "top_blockers": self.top_blockers(limit),
+        }
+
+
+loop_monitor = LoopMonitor(
+    interval_seconds=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+    threshold_seconds=settings.LOOP_BLOCK_THRESHOLD_MS / 1000,
+    max_blockers=settings.LOOP_MONITOR_MAX_BLOCKERS,
+)
@@ -0,0 +1,158 @@
+"""Serialize-once JSON responses for hot read endpoints."""
+
+import gzip
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # Optional dependency: brotli variants are skipped without it
+    brotli = None
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(response_type: Any) -> TypeAdapter:
+    """Build (once) the compiled pydantic-core validator/serializer for a type."""
+    return TypeAdapter(response_type)
+
+
+def serialize_json(data: Any, response_type: Any) -> bytes:
+    """Convert ORM objects straight to JSON bytes with a precompiled adapter."""
+    adapter = get_type_adapter(response_type)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def fast_json_response(
+    data: Any, response_type: Any, headers: Optional[Mapping[str, str]] = None
+) -> Any:
+    """Return pre-encoded JSON when FAST_JSON_RESPONSES is on, else ``data`` unchanged.
+
+    Returning a ``Response`` makes FastAPI skip its own response_model pass
+    (validate, dump to dicts, ``json.dumps``); pydantic-core validates from
+    attributes and writes bytes in one go instead. Headers already set on the
+    injected response must be passed through, since FastAPI does not merge
+    them into a returned ``Response``.
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return data
+    return Response(
+        content=serialize_json(data, response_type),
+        media_type="application/json",
+        headers=dict(headers) if headers else None,
+    )
+
+
+# Server preference when the client accepts several encodings with equal weight
+PREFERRED_ENCODINGS = ("br", "gzip")
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+class EncodedPayload:
+    """Identity bytes of a response plus compressed variants built once up front."""
+
+    __slots__ = ("identity", "encodings")
+
+    def __init__(self, identity: bytes, encodings: Optional[Dict[str, bytes]] = None):
+        self.identity = identity
+        self.encodings = encodings or {}
+
+    @classmethod
+    def build(cls, identity: bytes, compress: bool = True) -> "EncodedPayload":
+        encodings: Dict[str, bytes] = {}
+        if compress:
+            # Built on the event loop on every cache miss, hence the moderate
+            # levels; mtime=0 keeps the gzip bytes identical for identical content
+            encodings["gzip"] = gzip.compress(
+                identity, compresslevel=GZIP_LEVEL, mtime=0
+            )
+            if brotli is not None:
+                encodings["br"] = brotli.compress(identity, quality=BROTLI_QUALITY)
+            # Tiny payloads can grow when compressed; only keep real savings
+            encodings = {
+                name: data
+                for name, data in encodings.items()
+                if len(data) < len(identity)
+            }
+        return cls(identity, encodings)
+
+    def select(self, accept_encoding: Optional[str]) -> Tuple[Optional[str], bytes]:
+        encoding = negotiate_encoding(accept_encoding, self.encodings)
+        if encoding is None:
+            return None, self.identity
+        return encoding, self.encodings[encoding]
+
+
+def variant_etag(etag: str, encoding: Optional[str]) -> str:
+    """Strong ETag of one content-coding: each encoding is a different byte stream."""
+    if not encoding:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def matching_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """The ETag to confirm in a 304 if If-None-Match names any encoding of ``etag``."""
+    if not if_none_match:
+        return None
+    variants = {variant_etag(etag, encoding) for encoding in PREFERRED_ENCODINGS}
+    for candidate in (tag.strip() for tag in if_none_match.split(",")):
+        if candidate == "*":
+            return etag
+        if candidate == etag or candidate in variants:
+            return candidate
+    return None
+
+
+def negotiate_encoding(
+    accept_encoding: Optional[str], available: Mapping[str, bytes]
+) -> Optional[str]:
+    """Pick the best available content-coding for an Accept-Encoding header."""
+    if not accept_encoding or not available:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for name in PREFERRED_ENCODINGS:
+        if name not in available:
+            continue
+        weight = weights.get(name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+def encoded_json_response(
+    payload: EncodedPayload,
+    accept_encoding: Optional[str],
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """Send a cached payload in the client's preferred encoding without compressing."""
+    encoding, body = payload.select(accept_encoding)
+    response_headers = dict(headers) if headers else {}
+    response_headers["Vary"] = "Accept-Encoding"
+    if encoding:
+        response_headers["Content-Encoding"] = encoding
+        if "ETag" in response_headers:
+            response_headers["ETag"] = variant_etag(response_headers["ETag"], encoding)
+    return Response(
+        content=body, media_type="application/json", headers=response_headers
+    )
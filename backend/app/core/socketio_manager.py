@@ -0,0 +1,329 @@
+"""Client managers that let several workers share Socket.IO rooms.
+
+``SOCKETIO_MESSAGE_QUEUE`` selects the backend:
+
+* empty (default) - in-process manager; only sockets in this worker are reached
+* ``redis://`` / ``rediss://`` - Redis pub/sub (needs ``redis``)
+* ``amqp://`` / ``amqps://`` - RabbitMQ (needs ``aio-pika``)
+* ``local://<name>`` - ``LocalBrokerManager``, a pure-Python broker shared by
+  every server in the same process; used to exercise multi-worker fan-out in
+  development and checks without running Redis
+
+Every variant delivers room emits through ``BroadcastManager``.
+"""
+
+import asyncio
+import logging
+import pickle
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import socketio
+from engineio import packet as eio_packet
+from socketio import packet
+from socketio.async_pubsub_manager import AsyncPubSubManager
+
+from app.core.socketio_server import to_msgpack_packet
+
+logger = logging.getLogger(__name__)
+
+
+class _Outbox:
+    """Messages held back for one connection whose transport is behind."""
+
+    __slots__ = ("sid", "eio_sid", "pending", "lagging_since", "task")
+
+    def __init__(self, sid: str, eio_sid: str, now: float):
+        self.sid = sid
+        self.eio_sid = eio_sid
+        self.pending: "OrderedDict[Hashable, list]" = OrderedDict()
+        self.lagging_since = now
+        self.task: Optional[asyncio.Task] = None
+
+
+class BroadcastManager(socketio.AsyncManager):
+    """``AsyncManager`` that fans one pre-encoded packet out without per-client tasks.
+
+    python-socketio already encodes a callback-free emit once, but then
+    creates an asyncio task per recipient and waits on all of them, which
+    dominates the cost of a large room. An engine.io send only queues the
+    packet on the client's socket, so recipients are served in a plain loop
+    with the same packet objects. Connections that negotiated MessagePack
+    get a second encoding, made once per emit when the first one is reached.
+
+    Those engine.io queues are unbounded, so a client on a bad network would
+    otherwise collect every update in memory. Once a connection has
+    ``high_water`` packets waiting, further messages go to a bounded outbox
+    drained by a writer task as the transport catches up: a newer message with
+    the same ``collapse_key`` replaces the stale one, the oldest entries are
+    dropped beyond ``max_pending``, and a connection that stays behind for
+    ``slow_consumer_seconds`` is disconnected.
+    """
+
+    collapse_key: Optional[Callable[[str, Any], Optional[Hashable]]] = None
+    high_water = 32
+    max_pending = 256
+    slow_consumer_seconds = 30.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._outboxes: Dict[str, _Outbox] = {}
+        self.collapsed = 0
+        self.dropped = 0
+        self.evicted = 0
+
+    def configure_send_queues(
+        self,
+        high_water: int,
+        max_pending: int,
+        slow_consumer_seconds: float,
+        collapse_key: Optional[Callable[[str, Any], Optional[Hashable]]] = None,
+    ) -> None:
+        self.high_water = high_water
+        self.max_pending = max_pending
+        self.slow_consumer_seconds = slow_consumer_seconds
+        self.collapse_key = collapse_key
+
+    async def emit(
+        self,
+        event,
+        data,
+        namespace,
+        room=None,
+        skip_sid=None,
+        callback=None,
+        **kwargs,
+    ):
+        if callback is not None or namespace not in self.rooms:
+            return await super().emit(
+                event,
+                data,
+                namespace,
+                room=room,
+                skip_sid=skip_sid,
+                callback=callback,
+                **kwargs,
+            )
+
+        if isinstance(room, list):
+            # Topic emits name several rooms, most of them empty on this worker
+            local_rooms = self.rooms[namespace]
+            room = [r for r in room if r in local_rooms]
+            if not room:
+                return
+            if len(room) == 1:
+                room = room[0]
+
+        if isinstance(data, tuple):
+            data = list(data)
+        elif data is not None:
+            data = [data]
+        else:
+            data = []
+        skip = set(skip_sid if isinstance(skip_sid, list) else [skip_sid])
+        key = None
+        if self.collapse_key is not None and len(data) == 1:
+            key = self.collapse_key(event, data[0])
+
+        pkt = self.server.packet_class(
+            packet.EVENT, namespace=namespace, data=[event] + data
+        )
+        eio_pkts = self._encode(pkt)
+        msgpack_sids = getattr(self.server, "msgpack_sids", ())
+        msgpack_pkts = None
+
+        for sid, eio_sid in self.get_participants(namespace, room):
+            if sid in skip:
+                continue
+            if eio_sid in msgpack_sids:
+                if msgpack_pkts is None:
+                    msgpack_pkts = self._encode(to_msgpack_packet(pkt))
+                await self._deliver(sid, eio_sid, msgpack_pkts, key)
+            else:
+                await self._deliver(sid, eio_sid, eio_pkts, key)
+
+    @staticmethod
+    def _encode(pkt) -> list:
+        encoded_packet = pkt.encode()
+        if not isinstance(encoded_packet, list):
+            encoded_packet = [encoded_packet]
+        return [eio_packet.Packet(eio_packet.MESSAGE, p) for p in encoded_packet]
+
+    async def _deliver(
+        self, sid: str, eio_sid: str, eio_pkts: list, key: Optional[Hashable]
+    ) -> None:
+        outbox = self._outboxes.get(eio_sid)
+        if outbox is None:
+            socket = self.server.eio.sockets.get(eio_sid)
+            if socket is None or socket.queue.qsize() < self.high_water:
+                await self._send(sid, eio_sid, eio_pkts)
+                return
+            outbox = _Outbox(sid, eio_sid, asyncio.get_running_loop().time())
+            self._outboxes[eio_sid] = outbox
+            outbox.task = asyncio.ensure_future(self._drain(outbox))
+
+        if key is None:
+            key = object()
+        elif key in outbox.pending:
+            del outbox.pending[key]
+            self.collapsed += 1
+        outbox.pending[key] = eio_pkts
+        while len(outbox.pending) > self.max_pending:
+            outbox.pending.popitem(last=False)
+            self.dropped += 1
+
+    async def _send(self, sid: str, eio_sid: str, eio_pkts: list) -> None:
+        for eio_pkt in eio_pkts:
+            try:
+                await self.server._send_eio_packet(eio_sid, eio_pkt)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to send to {sid}: {e}")
+
+    async def _drain(self, outbox: _Outbox) -> None:
+        """Forward held messages each time the transport has taken what it had."""
+        loop = asyncio.get_running_loop()
+        try:
+            while outbox.pending:
+                socket = self.server.eio.sockets.get(outbox.eio_sid)
+                if socket is None or socket.closed:
+                    break
+                if socket.queue.qsize():
+                    budget = (
+                        outbox.lagging_since + self.slow_consumer_seconds - loop.time()
+                    )
+                    try:
+                        await asyncio.wait_for(socket.queue.join(), max(budget, 0))
+                    except asyncio.TimeoutError:
+                        await self._evict(outbox, socket)
+                        break
+                pending = list(outbox.pending.values())
+                outbox.pending.clear()
+                for eio_pkts in pending:
+                    await self._send(outbox.sid, outbox.eio_sid, eio_pkts)
+        finally:
+            if self._outboxes.get(outbox.eio_sid) is outbox:
+                del self._outboxes[outbox.eio_sid]
+
+    async def _evict(self, outbox: _Outbox, socket) -> None:
+        self.evicted += 1
+        logger.warning(
+            f"⚠️ Disconnecting slow Socket.IO client {outbox.sid}: "
+            f"{socket.queue.qsize()} queued, {len(outbox.pending)} held"
+        )
+        outbox.pending.clear()
+        try:
+            # Don't wait for a queue the client is not draining
+            await socket.close(wait=False, abort=True)
+            socket.queue.put_nowait(None)  # stops the transport's writer
+        finally:
+            self.server.eio.sockets.pop(outbox.eio_sid, None)
+
+    def stats(self) -> Dict[str, int]:
+        depths = [len(outbox.pending) for outbox in self._outboxes.values()]
+        return {
+            "lagging_connections": len(depths),
+            "held_messages": sum(depths),
+            "max_held_messages": max(depths, default=0),
+            "collapsed": self.collapsed,
+            "dropped": self.dropped,
+            "evicted": self.evicted,
+        }
+
+
+class LocalBroker:
+    """In-memory pub/sub hub: every subscriber queue receives every message."""
+
+    def __init__(self):
+        self._channels: Dict[str, List[asyncio.Queue]] = {}
+
+    def subscribe(self, channel: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._channels.setdefault(channel, []).append(queue)
+        return queue
+
+    def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        queues = self._channels.get(channel, [])
+        if queue in queues:
+            queues.remove(queue)
+        if not queues:
+            self._channels.pop(channel, None)
+
+    def publish(self, channel: str, message: bytes) -> None:
+        for queue in self._channels.get(channel, ()):
+            queue.put_nowait(message)
+
+
+_local_brokers: Dict[str, LocalBroker] = {}
+
+
+def get_local_broker(name: str = "default") -> LocalBroker:
+    if name not in _local_brokers:
+        _local_brokers[name] = LocalBroker()
+    return _local_brokers[name]
+
+
+class RedisBroadcastManager(socketio.AsyncRedisManager, BroadcastManager):
+    pass
+
+
+class AioPikaBroadcastManager(socketio.AsyncAioPikaManager, BroadcastManager):
+    pass
+
+
+class LocalBrokerManager(AsyncPubSubManager, BroadcastManager):
+    """``AsyncPubSubManager`` backed by a ``LocalBroker`` instead of a server.
+
+    Messages are pickled on publish, just like the Redis manager does, so
+    handlers see the same copies they would get from a real queue.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        url: str = "local://",
+        channel: str = "socketio",
+        write_only: bool = False,
+        logger=None,
+    ):
+        self.broker = get_local_broker(url.split("://", 1)[-1] or "default")
+        self._queue: Optional[asyncio.Queue] = None
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+
+    async def _publish(self, data):
+        self.broker.publish(self.channel, pickle.dumps(data))
+
+    async def _listen(self):
+        self._queue = self.broker.subscribe(self.channel)
+        try:
+            while True:
+                yield await self._queue.get()
+        finally:
+            self.broker.unsubscribe(self.channel, self._queue)
+            self._queue = None
+
+
+def create_client_manager(
+    url: Optional[str], channel: str = "socketio"
+) -> socketio.AsyncManager:
+    """Build the client manager for a message queue URL (empty means in-process)."""
+    if not url:
+        return BroadcastManager()
+
+    scheme = url.split("://", 1)[0].lower()
+    if scheme in ("redis", "rediss"):
+        manager = RedisBroadcastManager(url, channel=channel)
+    elif scheme in ("amqp", "amqps"):
+        manager = AioPikaBroadcastManager(url, channel=channel)
+    elif scheme == "local":
+        manager = LocalBrokerManager(url, channel=channel)
+    else:
+        raise ValueError(f"Unsupported SOCKETIO_MESSAGE_QUEUE scheme: {scheme}")
+
+    logger.info(f"📡 Socket.IO fan-out via {manager.name} message queue")
+    return manager
+
+
+def is_shared_manager(manager: socketio.AsyncManager) -> bool:
+    """True when rooms span several workers, so local counts are incomplete."""
+    return isinstance(manager, AsyncPubSubManager)
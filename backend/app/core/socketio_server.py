@@ -0,0 +1,76 @@
+"""Socket.IO server that speaks JSON or MessagePack, chosen per connection.
+
+JSON stays the default. A client built with a MessagePack parser
+(``socket.io-msgpack-parser`` in the browser, ``serializer="msgpack"`` in
+python-socketio) announces itself with its first packet, which arrives as a
+binary frame; from then on everything sent to that connection is encoded
+with MessagePack. JSON clients only ever send binary frames as attachments
+of a text packet, so the two cannot be confused.
+"""
+
+from typing import Set
+
+import socketio
+from socketio import packet
+
+try:
+    from socketio.msgpack_packet import MsgPackPacket
+except ImportError:  # Optional dependency: every client gets JSON without msgpack
+    MsgPackPacket = None
+
+# JSON promotes packets carrying bytes to BINARY_*; MessagePack encodes them inline
+_INLINE_BINARY_TYPES = {
+    packet.BINARY_EVENT: packet.EVENT,
+    packet.BINARY_ACK: packet.ACK,
+}
+
+
+class NegotiatedPacket(packet.Packet):
+    """JSON packet that also decodes MessagePack frames."""
+
+    def decode(self, encoded_packet):
+        if isinstance(encoded_packet, bytes) and MsgPackPacket is not None:
+            return MsgPackPacket.decode(self, encoded_packet)
+        return super().decode(encoded_packet)
+
+
+def to_msgpack_packet(pkt: packet.Packet) -> packet.Packet:
+    """Re-encode a JSON packet for a MessagePack client."""
+    return MsgPackPacket(
+        _INLINE_BINARY_TYPES.get(pkt.packet_type, pkt.packet_type),
+        data=pkt.data,
+        namespace=pkt.namespace,
+        id=pkt.id,
+    )
+
+
+class NegotiatedSerializerServer(socketio.AsyncServer):
+    """``AsyncServer`` that answers MessagePack clients in MessagePack."""
+
+    def __init__(self, *args, msgpack_enabled: bool = True, **kwargs):
+        self.msgpack_enabled = msgpack_enabled and MsgPackPacket is not None
+        if self.msgpack_enabled:
+            kwargs["serializer"] = NegotiatedPacket
+        super().__init__(*args, **kwargs)
+        # Engine.IO session ids of the connections using MessagePack
+        self.msgpack_sids: Set[str] = set()
+
+    async def _handle_eio_message(self, eio_sid, data):
+        if (
+            self.msgpack_enabled
+            and isinstance(data, bytes)
+            and eio_sid not in self._binary_packet
+        ):
+            self.msgpack_sids.add(eio_sid)
+        await super()._handle_eio_message(eio_sid, data)
+
+    async def _handle_eio_disconnect(self, eio_sid):
+        try:
+            await super()._handle_eio_disconnect(eio_sid)
+        finally:
+            self.msgpack_sids.discard(eio_sid)
+
+    async def _send_packet(self, eio_sid, pkt):
+        if eio_sid in self.msgpack_sids:
+            pkt = to_msgpack_packet(pkt)
+        await super()._send_packet(eio_sid, pkt)
@@ -1,6 +1,8 @@
 """Automatic database initialization and schema management."""
 
 import logging
+from pathlib import Path
+
 from sqlalchemy import text, inspect
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
@@ -10,6 +12,8 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+
 
 def check_table_exists(table_name: str) -> bool:
     """Check if a specific table exists in the database."""
@@ -46,6 +50,7 @@ def ensure_models_loaded():
             Invitation,
             incident_services,
             maintenance_services,
+            EventOutbox,
         )
 
         logger.info("✅ All models loaded successfully")
@@ -65,7 +70,7 @@ def create_tables_if_missing():
             return False
 
         # Check if critical tables exist
-        critical_tables = ["organizations", "users", "services"]
+        critical_tables = ["organizations", "users", "services", "event_outbox"]
         existing_tables = get_existing_tables()
 
         missing_tables = [
@@ -92,6 +97,29 @@ def create_tables_if_missing():
         return False
 
 
+def run_migrations():
+    """Apply pending Alembic migrations to an existing schema.
+
+    create_all() only creates missing tables, so columns and indexes added
+    to existing tables reach deployed databases through the migrations.
+    They skip anything create_all() already built, so this is safe on a
+    fresh database too.
+    """
+    try:
+        from alembic import command
+        from alembic.config import Config
+
+        config = Config(str(BACKEND_DIR / "alembic.ini"))
+        config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+        config.attributes["skip_logging_config"] = True
+        command.upgrade(config, "head")
+        logger.info("✅ Database schema is up to date")
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to apply migrations: {e}")
+        return False
+
+
 def test_database_connection():
     """Test basic database connectivity."""
     try:
@@ -119,6 +147,11 @@ def auto_initialize_database():
             logger.error("❌ Table creation failed")
             return False
 
+        # Step 3: Add columns and indexes introduced since the tables were made
+        if not run_migrations():
+            logger.error("❌ Schema migration failed")
+            return False
+
         logger.info("✅ Automatic database initialization completed successfully")
         return True
 
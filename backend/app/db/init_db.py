@@ -93,6 +93,7 @@ def ensure_models_imported():
             Invitation,
             incident_services,
             maintenance_services,
+            EventOutbox,
         )
 
         logger.info("✅ All models imported successfully")
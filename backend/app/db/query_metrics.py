@@ -0,0 +1,208 @@
+"""Per-request SQL query counting and timing.
+
+``instrument`` hooks ``before_cursor_execute``/``after_cursor_execute`` on an
+engine. ``QueryMetricsMiddleware`` gives every HTTP request its own
+``RequestQueries`` through a context variable (which follows the request
+into the async engine's greenlets and threadpool dependencies), so each
+statement is charged to the request that ran it. When the request finishes
+its query count, total database time and slowest statement are folded into
+per-route aggregates for ``/admin/db/queries``, logged when they cross the
+configured thresholds, and optionally sent back as a ``Server-Timing``
+header.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_PREVIEW_CHARS = 300
+
+
+class RequestQueries:
+    """What one request has sent to the database so far."""
+
+    __slots__ = ("count", "total", "slowest", "slowest_statement")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed >= self.slowest:
+            self.slowest = elapsed
+            self.slowest_statement = statement
+
+
+_current: ContextVar[Optional[RequestQueries]] = ContextVar(
+    "request_queries", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[RequestQueries]:
+    """Charge statements run inside the block to a fresh ``RequestQueries``."""
+    queries = RequestQueries()
+    token = _current.set(queries)
+    try:
+        yield queries
+    finally:
+        _current.reset(token)
+
+
+def _preview(statement: str) -> str:
+    return " ".join(statement.split())[:STATEMENT_PREVIEW_CHARS]
+
+
+class QueryMetrics:
+    """Per-route query counts and database time across finished requests."""
+
+    def __init__(
+        self,
+        server_timing: bool = False,
+        log_query_count: int = 20,
+        log_db_ms: float = 200.0,
+    ):
+        self.server_timing = server_timing
+        self.log_query_count = log_query_count
+        self.log_db_ms = log_db_ms
+        self._routes: Dict[str, Dict[str, Any]] = {}
+        self.requests = 0
+        self.queries = 0
+        self.untracked_queries = 0  # Startup tasks, dispatchers and scripts
+
+    def instrument(self, engine: Engine) -> None:
+        """Time every statement this (sync or ``AsyncEngine.sync_engine``) engine runs."""
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        started = getattr(context, "_query_started", None)
+        if started is None:
+            return
+        self.queries += 1
+        current = _current.get()
+        if current is None:
+            self.untracked_queries += 1
+            return
+        current.record(statement, time.perf_counter() - started)
+
+    def record_request(self, route: str, queries: RequestQueries) -> None:
+        self.requests += 1
+        total_ms = queries.total * 1000
+        slowest_ms = queries.slowest * 1000
+
+        entry = self._routes.get(route)
+        if entry is None:
+            entry = self._routes[route] = {
+                "route": route,
+                "requests": 0,
+                "queries": 0,
+                "max_queries": 0,
+                "db_ms": 0.0,
+                "max_db_ms": 0.0,
+                "slowest_ms": 0.0,
+                "slowest_statement": None,
+            }
+        entry["requests"] += 1
+        entry["queries"] += queries.count
+        entry["max_queries"] = max(entry["max_queries"], queries.count)
+        entry["db_ms"] = round(entry["db_ms"] + total_ms, 3)
+        entry["max_db_ms"] = round(max(entry["max_db_ms"], total_ms), 3)
+        if queries.slowest_statement and slowest_ms >= entry["slowest_ms"]:
+            entry["slowest_ms"] = round(slowest_ms, 3)
+            entry["slowest_statement"] = _preview(queries.slowest_statement)
+
+        if queries.count > self.log_query_count:
+            logger.warning(
+                f"🔁 {route} ran {queries.count} queries in {total_ms:.1f} ms "
+                f"(possible N+1)"
+            )
+        elif total_ms > self.log_db_ms:
+            logger.warning(
+                f"🐌 {route} spent {total_ms:.1f} ms in {queries.count} queries; "
+                f"slowest {slowest_ms:.1f} ms: "
+                f"{_preview(queries.slowest_statement or '')[:120]}"
+            )
+
+    def top_routes(self, limit: int = 10, sort: str = "db_ms") -> List[Dict[str, Any]]:
+        routes = []
+        for entry in self._routes.values():
+            routes.append(
+                dict(
+                    entry,
+                    mean_queries=round(entry["queries"] / entry["requests"], 2),
+                    mean_db_ms=round(entry["db_ms"] / entry["requests"], 3),
+                )
+            )
+        routes.sort(key=lambda e: e[sort], reverse=True)
+        return routes[:limit]
+
+    def stats(self, limit: int = 10, sort: str = "db_ms") -> Dict[str, Any]:
+        return {
+            "server_timing": self.server_timing,
+            "requests": self.requests,
+            "queries": self.queries,
+            "untracked_queries": self.untracked_queries,
+            "routes": self.top_routes(limit, sort),
+        }
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _route_label(scope) -> str:
+    # Raw paths of unmatched requests would grow the route table without bound
+    path = getattr(scope.get("route"), "path", None) or "<unmatched>"
+    return f"{scope.get('method', '')} {path}"
+
+
+class QueryMetricsMiddleware:
+    """ASGI middleware scoping query counts to each HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and query_metrics.server_timing:
+                timing = (
+                    f'db;dur={queries.total * 1000:.1f};desc="{queries.count} queries"'
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.encode()))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                # The router has added the matched route to this same scope dict
+                query_metrics.record_request(_route_label(scope), queries)
+
+
+query_metrics = QueryMetrics(
+    server_timing=settings.QUERY_SERVER_TIMING,
+    log_query_count=settings.QUERY_LOG_COUNT_THRESHOLD,
+    log_db_ms=settings.QUERY_LOG_DB_MS,
+)
@@ -0,0 +1,298 @@
+"""Route public status reads to read replicas.
+
+``get_read_db`` hands out sessions that start on the primary. Once a public
+route knows its tenant, ``route_reads`` moves the rest of the request to a
+replica, but only when:
+
+* one is healthy: the background checker measures every replica's lag and
+  takes replicas that are down or further behind than
+  ``REPLICA_MAX_LAG_SECONDS`` out of the round-robin;
+* the tenant has not written within ``READ_YOUR_WRITES_SECONDS`` on this
+  worker;
+* the replica has already replayed the tenant's current content version, so
+  writes made through another worker are never read back stale either.
+
+A replica that fails that first query is marked down and the request stays
+on the primary.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.query_metrics import query_metrics
+from app.db.session import async_engine, get_async_database_url
+from app.models.organization import Organization
+
+logger = logging.getLogger(__name__)
+
+# Seconds since the last replayed transaction, or 0 when fully caught up
+# (an idle primary would otherwise make a healthy standby look behind)
+POSTGRES_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """)
+
+
+class Replica:
+    """One replica engine and what the health checker last saw of it."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        if settings.QUERY_METRICS_ENABLED:
+            query_metrics.instrument(engine.sync_engine)
+        self.name = engine.url.render_as_string(hide_password=True)
+        self.healthy = False  # Until the first check succeeds
+        self.lag_seconds: Optional[float] = None
+        self.last_checked: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.failures = 0
+        self.reads = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.name,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            "last_checked": (
+                self.last_checked.isoformat() if self.last_checked else None
+            ),
+            "last_error": self.last_error,
+            "failures": self.failures,
+            "reads": self.reads,
+        }
+
+
+class ReplicaRouter:
+    """Round-robin over healthy replicas plus per-tenant read-your-writes windows."""
+
+    def __init__(
+        self,
+        replicas: List[Replica],
+        sticky_seconds: float = 5.0,
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 2.0,
+    ):
+        self.replicas = replicas
+        self.sticky_seconds = sticky_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._next = itertools.cycle(range(len(replicas)))
+        self._last_write: Dict[int, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.sticky_reads = 0
+        self.stale_fallbacks = 0
+        self.unavailable_fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def mark_write(self, tenant_id: int) -> None:
+        """Keep this tenant's reads on the primary for the sticky window."""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        self._last_write[tenant_id] = now
+        # Forget windows that have closed so the map stays small
+        if len(self._last_write) > 1024:
+            cutoff = now - self.sticky_seconds
+            self._last_write = {
+                tenant: written
+                for tenant, written in self._last_write.items()
+                if written > cutoff
+            }
+
+    def is_sticky(self, tenant_id: int) -> bool:
+        written = self._last_write.get(tenant_id)
+        return written is not None and time.monotonic() - written < self.sticky_seconds
+
+    def choose(self) -> Optional[Replica]:
+        """The next healthy replica, or None to read from the primary."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._next)]
+            if replica.healthy:
+                return replica
+        if self.replicas:
+            self.unavailable_fallbacks += 1
+        return None
+
+    def mark_failed(self, replica: Replica, error: Exception) -> None:
+        # DBAPIError messages go on to quote the SQL; the first line is enough
+        message = str(error).splitlines()[0] if str(error) else repr(error)
+        if replica.healthy:
+            logger.warning(f"⚠️ Read replica {replica.name} failed: {message}")
+        replica.healthy = False
+        replica.failures += 1
+        replica.last_error = message
+
+    async def check(self, replica: Replica) -> None:
+        """Measure one replica's replication lag and update its health."""
+        try:
+            async with replica.engine.connect() as conn:
+                if conn.dialect.name == "postgresql":
+                    lag = float(await conn.scalar(POSTGRES_LAG_SQL) or 0.0)
+                else:
+                    await conn.execute(text("SELECT 1"))
+                    lag = 0.0
+        except Exception as e:
+            replica.last_checked = datetime.now(timezone.utc)
+            self.mark_failed(replica, e)
+            return
+
+        replica.last_checked = datetime.now(timezone.utc)
+        replica.lag_seconds = round(lag, 3)
+        healthy = lag <= self.max_lag_seconds
+        if healthy and not replica.healthy:
+            logger.info(f"✅ Read replica {replica.name} is serving reads")
+        elif not healthy and replica.healthy:
+            logger.warning(
+                f"⚠️ Read replica {replica.name} is {lag:.1f}s behind, skipping it"
+            )
+        replica.healthy = healthy
+        if healthy:
+            replica.last_error = None
+
+    async def check_all(self) -> None:
+        await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"📚 Routing public reads across {len(self.replicas)} replica(s)")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.check_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Replica health check failed: {e}")
+            await asyncio.sleep(self.check_interval_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sticky_seconds": self.sticky_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+            "sticky_tenants": sum(
+                1 for tenant in list(self._last_write) if self.is_sticky(tenant)
+            ),
+            "sticky_reads": self.sticky_reads,
+            "stale_fallbacks": self.stale_fallbacks,
+            "unavailable_fallbacks": self.unavailable_fallbacks,
+            "replicas": [replica.stats() for replica in self.replicas],
+        }
+
+
+def _replica_engine(url: str) -> AsyncEngine:
+    url = get_async_database_url(url)
+    connect_args = {}
+    if url.get_backend_name() == "postgresql":
+        # Fail over quickly instead of waiting out asyncpg's 60s dial timeout
+        connect_args["timeout"] = settings.REPLICA_CONNECT_TIMEOUT_SECONDS
+    return create_async_engine(
+        url,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        connect_args=connect_args,
+    )
+
+
+replica_router = ReplicaRouter(
+    [Replica(_replica_engine(url)) for url in settings.get_read_replica_urls()],
+    sticky_seconds=settings.READ_YOUR_WRITES_SECONDS,
+    max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.REPLICA_HEALTH_CHECK_SECONDS,
+)
+
+
+class RoutingSession(Session):
+    """Sends statements to the session's replica once ``route_reads`` allowed it."""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get("replica")
+        if replica is not None and not self._flushing:
+            return replica.engine.sync_engine
+        return async_engine.sync_engine
+
+
+ReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_read_db():
+    """Session for read-only public endpoints; see ``route_reads``."""
+    async with ReadSessionLocal() as db:
+        yield db
+
+
+async def route_reads(db: AsyncSession, organization) -> None:
+    """Move the rest of a public request to a replica that is fresh enough for it."""
+    if not replica_router.enabled or db.info.get("replica_checked"):
+        return
+    db.info["replica_checked"] = True
+
+    if replica_router.is_sticky(organization.id):
+        replica_router.sticky_reads += 1
+        return
+    replica = replica_router.choose()
+    if replica is None:
+        return
+
+    db.info["replica"] = replica
+    try:
+        version = await db.scalar(
+            select(Organization.content_version).filter(
+                Organization.id == organization.id
+            )
+        )
+    except (DBAPIError, OSError, asyncio.TimeoutError) as e:
+        # asyncpg raises refused connections and dial timeouts unwrapped
+        replica_router.mark_failed(replica, e)
+        db.info["replica"] = None
+        await db.rollback()
+        return
+
+    if version is None or version < organization.content_version:
+        # Not replayed up to the version this request will report yet
+        replica_router.stale_fallbacks += 1
+        db.info["replica"] = None
+        return
+    replica.reads += 1
@@ -1,7 +1,10 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.query_metrics import query_metrics
 
 # Create engine with production-ready settings
 engine = create_engine(
@@ -12,6 +15,9 @@ engine = create_engine(
     pool_recycle=300,
 )
 
+if settings.QUERY_METRICS_ENABLED:
+    query_metrics.instrument(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -21,3 +27,44 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_async_database_url(url: str) -> URL:
+    """The same database through its asyncio driver (asyncpg or aiosqlite)."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+        # asyncpg takes libpq's sslmode values under the name "ssl"
+        sslmode = url.query.get("sslmode")
+        if sslmode:
+            url = url.difference_update_query(["sslmode"]).update_query_dict(
+                {"ssl": sslmode}
+            )
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url
+
+
+# Request handlers use the async engine so queries never block the event loop;
+# the sync engine above stays for scripts, migrations and startup tasks.
+async_engine = create_async_engine(
+    get_async_database_url(settings.get_database_url()),
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=300,
+)
+if settings.QUERY_METRICS_ENABLED:
+    query_metrics.instrument(async_engine.sync_engine)
+
+# Objects stay loaded after commit: an expired attribute would need a lazy
+# load, which an AsyncSession cannot do implicitly.
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
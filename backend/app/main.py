@@ -1,12 +1,17 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
 import socketio
 import os
+import re
 import logging
 
 from app.routes import services, incidents, organizations, public, maintenance, team
 from app.websocket import sio
+from app.core.auth import require_admin_token
 from app.core.config import settings
+from app.core.loop_monitor import LoopMonitorMiddleware
+from app.db.query_metrics import QueryMetricsMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -57,6 +62,38 @@ async def startup_event():
         if settings.ENVIRONMENT != "production":
             raise
 
+    # Publish real-time events committed to the outbox
+    from app.services.event_outbox import outbox_dispatcher
+
+    outbox_dispatcher.start()
+
+    if settings.LOOP_MONITOR_ENABLED:
+        from app.core.loop_monitor import loop_monitor
+
+        loop_monitor.start()
+
+    # Health and lag checks for read replicas (no-op without READ_REPLICA_URLS)
+    from app.db.replicas import replica_router
+
+    replica_router.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Deliver outbox events and status updates still waiting in the coalescing window"""
+    from app.core.loop_monitor import loop_monitor
+    from app.db.replicas import replica_router
+    from app.db.session import async_engine
+    from app.services.event_outbox import outbox_dispatcher
+    from app.websocket import status_update_coalescer
+
+    await loop_monitor.stop()
+    await outbox_dispatcher.stop()
+    await status_update_coalescer.flush_all()
+    # Close pooled asyncpg connections while the loop is still running
+    await replica_router.stop()
+    await async_engine.dispose()
+
 
 # Configure CORS for both development and production
 allowed_origins = [
@@ -73,6 +110,10 @@ if settings.FRONTEND_URL:
 if settings.ALLOWED_ORIGINS:
     allowed_origins.extend(settings.ALLOWED_ORIGINS.split(","))
 
+# Response headers cross-origin clients need to read: the timeline cursor and
+# the validator they send back in If-None-Match
+EXPOSED_HEADERS = ["X-Next-Cursor", "ETag"]
+
 # For production, be more permissive with HTTPS origins
 if settings.ENVIRONMENT == "production":
     # Allow all HTTPS origins (more secure than wildcards)
@@ -82,6 +123,7 @@ if settings.ENVIRONMENT == "production":
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=EXPOSED_HEADERS,
     )
     logger.info("🌐 CORS configured for production with HTTPS Render domains")
 else:
@@ -92,9 +134,17 @@ else:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=EXPOSED_HEADERS,
     )
     logger.info(f"🌐 CORS allowed origins: {allowed_origins}")
 
+# Tag requests with their route so event loop stalls can be attributed
+app.add_middleware(LoopMonitorMiddleware)
+
+# Count and time each request's SQL statements
+if settings.QUERY_METRICS_ENABLED:
+    app.add_middleware(QueryMetricsMiddleware)
+
 # Include API routes
 app.include_router(services.router, prefix="/api")
 app.include_router(incidents.router, prefix="/api")
@@ -112,6 +162,31 @@ async def root():
     return {"message": "Status Page API is running"}
 
 
+@app.get("/static/status/{org_slug}")
+@app.get("/static/status/{org_slug}/{filename}")
+async def published_status_file(
+    org_slug: str, request: Request, filename: str = "index.html"
+):
+    """Serve a pre-rendered status file written by the static publisher."""
+    from app.services.static_publisher import PUBLISHED_FILES, get_publish_dir
+
+    if filename not in PUBLISHED_FILES or not re.match(r"^[a-z0-9-]+$", org_slug):
+        raise HTTPException(status_code=404, detail="Not found")
+
+    path = get_publish_dir() / org_slug / filename
+    media_type = "text/html" if filename.endswith(".html") else "application/json"
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    gzip_path = path.with_name(filename + ".gz")
+    if "gzip" in request.headers.get("accept-encoding", "") and gzip_path.exists():
+        headers["Content-Encoding"] = "gzip"
+        return FileResponse(gzip_path, media_type=media_type, headers=headers)
+
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Not found")
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+
 @app.get("/health")
 async def health_check():
     from app.db.auto_init import get_existing_tables, check_table_exists
@@ -164,12 +239,12 @@ async def manual_database_init():
 async def debug_organizations():
     """Debug endpoint to list all organizations and their slugs."""
     try:
-        from app.db.session import SessionLocal
+        from sqlalchemy import select
+        from app.db.session import AsyncSessionLocal
         from app.models.organization import Organization
 
-        db = SessionLocal()
-        try:
-            orgs = db.query(Organization).all()
+        async with AsyncSessionLocal() as db:
+            orgs = (await db.scalars(select(Organization))).all()
             return {
                 "total_organizations": len(orgs),
                 "organizations": [
@@ -184,12 +259,71 @@ async def debug_organizations():
                     for org in orgs
                 ],
             }
-        finally:
-            db.close()
     except Exception as e:
         return {"error": f"Failed to fetch organizations: {str(e)}"}
 
 
+@app.get("/admin/cache/stats", dependencies=[Depends(require_admin_token)])
+async def cache_stats():
+    """Hit/miss counters for the public status page and slug caches."""
+    from app.services.status_cache import status_page_cache
+    from app.services.slug_cache import organization_slug_cache
+
+    return {
+        "status_page": status_page_cache.stats(),
+        "organization_slug": organization_slug_cache.stats(),
+    }
+
+
+@app.get("/admin/realtime/stats", dependencies=[Depends(require_admin_token)])
+async def realtime_stats():
+    """Subscriber, send queue, event log and outbox counters for this worker."""
+    from app.services.event_outbox import outbox_dispatcher
+    from app.websocket import (
+        client_manager,
+        organization_subscriber_counts,
+        session_subscriptions,
+        sio,
+        tenant_event_log,
+    )
+
+    return {
+        "subscribed_sessions": len(session_subscriptions),
+        "msgpack_connections": len(sio.msgpack_sids),
+        "subscribed_tenants": len(organization_subscriber_counts),
+        "send_queues": client_manager.stats(),
+        "event_log": tenant_event_log.stats(),
+        "outbox": outbox_dispatcher.stats(),
+    }
+
+
+@app.get("/admin/db/replicas", dependencies=[Depends(require_admin_token)])
+async def replica_stats():
+    """Read replica health, replication lag and read routing counters."""
+    from app.db.replicas import replica_router
+
+    return replica_router.stats()
+
+
+@app.get("/admin/db/queries", dependencies=[Depends(require_admin_token)])
+async def query_stats(
+    limit: int = Query(10, ge=1, le=100),
+    sort: str = Query("db_ms", pattern="^(db_ms|queries|max_queries|max_db_ms)$"),
+):
+    """Per-route query counts, database time and slowest statements."""
+    from app.db.query_metrics import query_metrics
+
+    return query_metrics.stats(limit, sort)
+
+
+@app.get("/admin/loop/stats", dependencies=[Depends(require_admin_token)])
+async def loop_stats(limit: int = Query(10, ge=1, le=100)):
+    """Event loop lag histogram and the routes/functions that blocked it longest."""
+    from app.core.loop_monitor import loop_monitor
+
+    return loop_monitor.stats(limit)
+
+
 @app.post("/admin/setup-demo-data")
 async def setup_demo_data_endpoint():
     """Manual endpoint to create demo data."""
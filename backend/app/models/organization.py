@@ -1,5 +1,6 @@
 from sqlalchemy import (
     Column,
+    Index,
     Integer,
     String,
     ForeignKey,
@@ -7,9 +8,10 @@ from sqlalchemy import (
     Text,
     Enum,
     Boolean,
+    JSON,
 )
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.models.base import Base
 import enum
 import secrets
@@ -40,10 +42,15 @@ class MaintenanceStatus(enum.Enum):
 
 class Organization(Base):
     __tablename__ = "organizations"
+    # Read onupdate timestamps back with RETURNING too (INSERT defaults already
+    # are), so using updated_at after a flush never needs a refresh query
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     slug = Column(String, unique=True, index=True, nullable=False)
+    # Bumped by every service/incident/maintenance change; drives public ETags
+    content_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -59,6 +66,7 @@ class Organization(Base):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_tenant_role", "tenant_id", "role"),)
 
     id = Column(Integer, primary_key=True, index=True)
     clerk_user_id = Column(String, unique=True, nullable=False)
@@ -73,6 +81,7 @@ class User(Base):
 
 class Invitation(Base):
     __tablename__ = "invitations"
+    __table_args__ = (Index("ix_invitations_tenant_email", "tenant_id", "email"),)
 
     id = Column(Integer, primary_key=True, index=True)
     tenant_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -96,6 +105,8 @@ class Invitation(Base):
 
 class Service(Base):
     __tablename__ = "services"
+    __table_args__ = (Index("ix_services_tenant_id_id", "tenant_id", "id"),)
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     tenant_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -119,6 +130,20 @@ class Service(Base):
 
 class Incident(Base):
     __tablename__ = "incidents"
+    __table_args__ = (
+        # Backs keyset pagination of the public timeline and history archive
+        Index("ix_incidents_tenant_created_id", "tenant_id", "created_at", "id"),
+        # The same ordering restricted to open incidents, for the live status page
+        Index(
+            "ix_incidents_open_tenant_created_id",
+            "tenant_id",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'OPEN'"),
+            sqlite_where=text("status = 'OPEN'"),
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     tenant_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -133,10 +158,16 @@ class Incident(Base):
     # Relationships
     organization = relationship("Organization", back_populates="incidents")
     services = relationship(
-        "Service", secondary="incident_services", back_populates="incidents"
+        "Service",
+        secondary="incident_services",
+        back_populates="incidents",
+        order_by="Service.id",
     )
     updates = relationship(
-        "IncidentUpdate", back_populates="incident", cascade="all, delete-orphan"
+        "IncidentUpdate",
+        back_populates="incident",
+        cascade="all, delete-orphan",
+        order_by="IncidentUpdate.id",
     )
 
 
@@ -158,11 +189,15 @@ incident_services = Table(
         ForeignKey("services.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # The primary key serves lookups by incident; this one serves the service side
+    Index("ix_incident_services_service_id", "service_id"),
 )
 
 
 class IncidentUpdate(Base):
     __tablename__ = "incident_updates"
+    __table_args__ = (Index("ix_incident_updates_incident_id_id", "incident_id", "id"),)
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     incident_id = Column(
@@ -191,11 +226,23 @@ maintenance_services = Table(
         ForeignKey("services.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    Index("ix_maintenance_services_service_id", "service_id"),
 )
 
 
 class Maintenance(Base):
     __tablename__ = "maintenances"
+    __table_args__ = (
+        # Active windows (status IN ...) and the full list, both by start time
+        Index(
+            "ix_maintenances_tenant_status_start",
+            "tenant_id",
+            "status",
+            "scheduled_start",
+        ),
+        Index("ix_maintenances_tenant_start_id", "tenant_id", "scheduled_start", "id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     tenant_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -214,5 +261,39 @@ class Maintenance(Base):
     # Relationships
     organization = relationship("Organization", back_populates="maintenances")
     services = relationship(
-        "Service", secondary="maintenance_services", back_populates="maintenances"
+        "Service",
+        secondary="maintenance_services",
+        back_populates="maintenances",
+        order_by="Service.id",
     )
+
+
+class EventOutbox(Base):
+    """Real-time events written in the same transaction as the change they describe.
+
+    The outbox dispatcher publishes undelivered rows to websocket subscribers
+    and stamps ``delivered_at``; rows are deleted after the retention period.
+    """
+
+    __tablename__ = "event_outbox"
+    __table_args__ = (
+        # The dispatcher only ever scans undelivered rows in id order
+        Index(
+            "ix_event_outbox_undelivered",
+            "id",
+            postgresql_where=text("delivered_at IS NULL"),
+            sqlite_where=text("delivered_at IS NULL"),
+        ),
+        Index("ix_event_outbox_created_at", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    tenant_id = Column(
+        Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+    event_type = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    delivered_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.organization import Incident, IncidentUpdate, Service, User
 from app.schemas.organization import (
     IncidentCreate,
@@ -12,38 +14,69 @@ from app.schemas.organization import (
     IncidentUpdateResponse,
 )
 from app.core.auth import get_current_user
-from app.websocket import emit_incident_created, emit_incident_update
+from app.core.responses import fast_json_response
+from app.services.event_outbox import enqueue_event
+from app.services.status_page_service import (
+    bump_content_version,
+    refresh_public_status,
+)
 
 router = APIRouter(prefix="/incidents", tags=["incidents"])
 
 
+def _incidents_query(tenant_id: int):
+    """Incidents with the relationships the response serializes already loaded."""
+    return (
+        select(Incident)
+        .options(selectinload(Incident.services), selectinload(Incident.updates))
+        .filter(Incident.tenant_id == tenant_id)
+    )
+
+
+async def _get_incident(
+    db: AsyncSession, incident_id: int, tenant_id: int
+) -> Optional[Incident]:
+    # populate_existing reloads the collections of an incident already in the session
+    return await db.scalar(
+        _incidents_query(tenant_id)
+        .filter(Incident.id == incident_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def _get_services(
+    db: AsyncSession, service_ids: List[int], tenant_id: int
+) -> List[Service]:
+    return (
+        await db.scalars(
+            select(Service).filter(
+                Service.id.in_(service_ids), Service.tenant_id == tenant_id
+            )
+        )
+    ).all()
+
+
 @router.get("/", response_model=List[IncidentResponse])
 async def get_incidents(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get all incidents for the current user's tenant."""
-    incidents = (
-        db.query(Incident).filter(Incident.tenant_id == current_user.tenant_id).all()
-    )
-    return incidents
+    incidents = (await db.scalars(_incidents_query(current_user.tenant_id))).all()
+    return fast_json_response(incidents, List[IncidentResponse])
 
 
 @router.post("/", response_model=IncidentResponse, status_code=status.HTTP_201_CREATED)
 async def create_incident(
     incident_data: IncidentCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Create a new incident for the current user's tenant."""
 
     # Verify all service IDs belong to the current tenant
-    services = (
-        db.query(Service)
-        .filter(
-            Service.id.in_(incident_data.service_ids),
-            Service.tenant_id == current_user.tenant_id,
-        )
-        .all()
+    services = await _get_services(
+        db, incident_data.service_ids, current_user.tenant_id
     )
 
     if len(services) != len(incident_data.service_ids):
@@ -52,24 +85,21 @@ async def create_incident(
             detail="One or more service IDs are invalid or don't belong to your organization",
         )
 
-    # Create incident
+    # Create incident with its services associated
     incident = Incident(
         title=incident_data.title,
         description=incident_data.description,
         tenant_id=current_user.tenant_id,
+        services=services,
     )
     db.add(incident)
-    db.flush()  # Get the ID
+    await db.flush()  # Get the ID
 
-    # Associate services
-    incident.services = services
-
-    db.commit()
-    db.refresh(incident)
-
-    # Emit WebSocket event for real-time updates
-    await emit_incident_created(
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(
+        db,
         current_user.tenant_id,
+        "incident_created",
         {
             "id": incident.id,
             "title": incident.title,
@@ -80,6 +110,12 @@ async def create_incident(
             "action": "created",
         },
     )
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
+    incident = await _get_incident(db, incident.id, current_user.tenant_id)
+
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
 
     return incident
 
@@ -88,16 +124,10 @@ async def create_incident(
 async def get_incident(
     incident_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a specific incident by ID within the current user's tenant."""
-    incident = (
-        db.query(Incident)
-        .filter(
-            Incident.id == incident_id, Incident.tenant_id == current_user.tenant_id
-        )
-        .first()
-    )
+    incident = await _get_incident(db, incident_id, current_user.tenant_id)
 
     if not incident:
         raise HTTPException(
@@ -111,16 +141,10 @@ async def update_incident(
     incident_id: int,
     incident_update: IncidentUpdateSchema,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Update an incident within the current user's tenant."""
-    incident = (
-        db.query(Incident)
-        .filter(
-            Incident.id == incident_id, Incident.tenant_id == current_user.tenant_id
-        )
-        .first()
-    )
+    incident = await _get_incident(db, incident_id, current_user.tenant_id)
 
     if not incident:
         raise HTTPException(
@@ -131,13 +155,8 @@ async def update_incident(
 
     # Handle service IDs update
     if "service_ids" in update_data:
-        services = (
-            db.query(Service)
-            .filter(
-                Service.id.in_(update_data["service_ids"]),
-                Service.tenant_id == current_user.tenant_id,
-            )
-            .all()
+        services = await _get_services(
+            db, update_data["service_ids"], current_user.tenant_id
         )
 
         if len(services) != len(update_data["service_ids"]):
@@ -153,12 +172,13 @@ async def update_incident(
     for field, value in update_data.items():
         setattr(incident, field, value)
 
-    db.commit()
-    db.refresh(incident)
+    await db.flush()
 
-    # Emit WebSocket event for real-time updates
-    await emit_incident_update(
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(
+        db,
         current_user.tenant_id,
+        "incident_update",
         {
             "id": incident.id,
             "title": incident.title,
@@ -169,6 +189,12 @@ async def update_incident(
             "action": "updated",
         },
     )
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
+    incident = await _get_incident(db, incident.id, current_user.tenant_id)
+
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
 
     return incident
 
@@ -182,16 +208,10 @@ async def create_incident_update(
     incident_id: int,
     update_data: IncidentUpdateCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Create an update for an incident within the current user's tenant."""
-    incident = (
-        db.query(Incident)
-        .filter(
-            Incident.id == incident_id, Incident.tenant_id == current_user.tenant_id
-        )
-        .first()
-    )
+    incident = await _get_incident(db, incident_id, current_user.tenant_id)
 
     if not incident:
         raise HTTPException(
@@ -201,12 +221,13 @@ async def create_incident_update(
     # Create the update
     update = IncidentUpdate(incident_id=incident_id, text=update_data.text)
     db.add(update)
-    db.commit()
-    db.refresh(update)
+    await db.flush()
 
-    # Emit WebSocket event for real-time updates
-    await emit_incident_update(
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(
+        db,
         current_user.tenant_id,
+        "incident_update",
         {
             "id": incident.id,
             "title": incident.title,
@@ -224,6 +245,12 @@ async def create_incident_update(
             "action": "update_added",
         },
     )
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
+    await db.refresh(update)
+
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
 
     return update
 
@@ -232,16 +259,10 @@ async def create_incident_update(
 async def delete_incident(
     incident_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Delete an incident within the current user's tenant."""
-    incident = (
-        db.query(Incident)
-        .filter(
-            Incident.id == incident_id, Incident.tenant_id == current_user.tenant_id
-        )
-        .first()
-    )
+    incident = await _get_incident(db, incident_id, current_user.tenant_id)
 
     if not incident:
         raise HTTPException(
@@ -258,9 +279,12 @@ async def delete_incident(
         "action": "deleted",
     }
 
-    db.delete(incident)
-    db.commit()
+    await db.delete(incident)
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(db, current_user.tenant_id, "incident_update", incident_data)
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
 
-    # Emit WebSocket event for real-time updates
-    await emit_incident_update(current_user.tenant_id, incident_data)
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
     return None
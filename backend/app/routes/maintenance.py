@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional
 from datetime import datetime
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.organization import Maintenance, Service, User, MaintenanceStatus
 from app.schemas.organization import (
     MaintenanceCreate,
@@ -11,23 +13,62 @@ from app.schemas.organization import (
     Maintenance as MaintenanceResponse,
 )
 from app.core.auth import get_current_user
-from app.websocket import emit_maintenance_created, emit_maintenance_update
+from app.core.responses import fast_json_response
+from app.services.event_outbox import enqueue_event
+from app.services.status_page_service import (
+    bump_content_version,
+    refresh_public_status,
+)
 
 router = APIRouter(prefix="/maintenance", tags=["maintenance"])
 
 
+def _maintenances_query(tenant_id: int):
+    """Maintenance windows with their services already loaded for the response."""
+    return (
+        select(Maintenance)
+        .options(selectinload(Maintenance.services))
+        .filter(Maintenance.tenant_id == tenant_id)
+    )
+
+
+async def _get_maintenance(
+    db: AsyncSession, maintenance_id: int, tenant_id: int
+) -> Optional[Maintenance]:
+    # populate_existing reloads the services of a window already in the session
+    return await db.scalar(
+        _maintenances_query(tenant_id)
+        .filter(Maintenance.id == maintenance_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def _get_services(
+    db: AsyncSession, service_ids: List[int], tenant_id: int
+) -> List[Service]:
+    return (
+        await db.scalars(
+            select(Service).filter(
+                Service.id.in_(service_ids), Service.tenant_id == tenant_id
+            )
+        )
+    ).all()
+
+
 @router.get("/", response_model=List[MaintenanceResponse])
 async def get_maintenances(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get all maintenance windows for the current user's tenant."""
     maintenances = (
-        db.query(Maintenance)
-        .filter(Maintenance.tenant_id == current_user.tenant_id)
-        .order_by(Maintenance.scheduled_start.desc())
-        .all()
-    )
-    return maintenances
+        await db.scalars(
+            _maintenances_query(current_user.tenant_id).order_by(
+                Maintenance.scheduled_start.desc()
+            )
+        )
+    ).all()
+    return fast_json_response(maintenances, List[MaintenanceResponse])
 
 
 @router.post(
@@ -36,7 +77,7 @@ async def get_maintenances(
 async def create_maintenance(
     maintenance_data: MaintenanceCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Create a new maintenance window for the current user's tenant."""
 
@@ -48,13 +89,8 @@ async def create_maintenance(
         )
 
     # Verify all service IDs belong to the current tenant
-    services = (
-        db.query(Service)
-        .filter(
-            Service.id.in_(maintenance_data.service_ids),
-            Service.tenant_id == current_user.tenant_id,
-        )
-        .all()
+    services = await _get_services(
+        db, maintenance_data.service_ids, current_user.tenant_id
     )
 
     if len(services) != len(maintenance_data.service_ids):
@@ -63,26 +99,23 @@ async def create_maintenance(
             detail="One or more service IDs are invalid or don't belong to your organization",
         )
 
-    # Create maintenance
+    # Create maintenance with its services associated
     maintenance = Maintenance(
         title=maintenance_data.title,
         description=maintenance_data.description,
         scheduled_start=maintenance_data.scheduled_start,
         scheduled_end=maintenance_data.scheduled_end,
         tenant_id=current_user.tenant_id,
+        services=services,
     )
     db.add(maintenance)
-    db.flush()  # Get the ID
-
-    # Associate services
-    maintenance.services = services
-
-    db.commit()
-    db.refresh(maintenance)
+    await db.flush()  # Get the ID
 
-    # Emit WebSocket event for real-time updates
-    await emit_maintenance_created(
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(
+        db,
         current_user.tenant_id,
+        "maintenance_created",
         {
             "id": maintenance.id,
             "title": maintenance.title,
@@ -95,6 +128,12 @@ async def create_maintenance(
             "action": "created",
         },
     )
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
+    maintenance = await _get_maintenance(db, maintenance.id, current_user.tenant_id)
+
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
 
     return maintenance
 
@@ -103,17 +142,10 @@ async def create_maintenance(
 async def get_maintenance(
     maintenance_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a specific maintenance window by ID within the current user's tenant."""
-    maintenance = (
-        db.query(Maintenance)
-        .filter(
-            Maintenance.id == maintenance_id,
-            Maintenance.tenant_id == current_user.tenant_id,
-        )
-        .first()
-    )
+    maintenance = await _get_maintenance(db, maintenance_id, current_user.tenant_id)
 
     if not maintenance:
         raise HTTPException(
@@ -127,17 +159,10 @@ async def update_maintenance(
     maintenance_id: int,
     maintenance_update: MaintenanceUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Update a maintenance window within the current user's tenant."""
-    maintenance = (
-        db.query(Maintenance)
-        .filter(
-            Maintenance.id == maintenance_id,
-            Maintenance.tenant_id == current_user.tenant_id,
-        )
-        .first()
-    )
+    maintenance = await _get_maintenance(db, maintenance_id, current_user.tenant_id)
 
     if not maintenance:
         raise HTTPException(
@@ -158,13 +183,8 @@ async def update_maintenance(
 
     # Handle service IDs update
     if "service_ids" in update_data:
-        services = (
-            db.query(Service)
-            .filter(
-                Service.id.in_(update_data["service_ids"]),
-                Service.tenant_id == current_user.tenant_id,
-            )
-            .all()
+        services = await _get_services(
+            db, update_data["service_ids"], current_user.tenant_id
         )
 
         if len(services) != len(update_data["service_ids"]):
@@ -190,12 +210,13 @@ async def update_maintenance(
     for field, value in update_data.items():
         setattr(maintenance, field, value)
 
-    db.commit()
-    db.refresh(maintenance)
+    await db.flush()
 
-    # Emit WebSocket event for real-time updates
-    await emit_maintenance_update(
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(
+        db,
         current_user.tenant_id,
+        "maintenance_update",
         {
             "id": maintenance.id,
             "title": maintenance.title,
@@ -216,6 +237,12 @@ async def update_maintenance(
             "action": "updated",
         },
     )
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
+    maintenance = await _get_maintenance(db, maintenance.id, current_user.tenant_id)
+
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
 
     return maintenance
 
@@ -224,17 +251,10 @@ async def update_maintenance(
 async def delete_maintenance(
     maintenance_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Delete a maintenance window within the current user's tenant."""
-    maintenance = (
-        db.query(Maintenance)
-        .filter(
-            Maintenance.id == maintenance_id,
-            Maintenance.tenant_id == current_user.tenant_id,
-        )
-        .first()
-    )
+    maintenance = await _get_maintenance(db, maintenance_id, current_user.tenant_id)
 
     if not maintenance:
         raise HTTPException(
@@ -253,10 +273,13 @@ async def delete_maintenance(
         "action": "deleted",
     }
 
-    db.delete(maintenance)
-    db.commit()
+    await db.delete(maintenance)
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(db, current_user.tenant_id, "maintenance_update", maintenance_data)
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
 
-    # Emit WebSocket event for real-time updates
-    await emit_maintenance_update(current_user.tenant_id, maintenance_data)
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
 
     return None
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.organization import Organization, User
 from app.schemas.organization import (
     OrganizationCreate,
@@ -22,30 +22,29 @@ async def create_new_organization(
     org_data: OrganizationCreate,
     clerk_user_id: str,
     email: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Create a new organization. This endpoint is called during user onboarding."""
 
     # Check if user already exists
-    existing_user = get_user_by_clerk_id(db, clerk_user_id)
+    existing_user = await get_user_by_clerk_id(db, clerk_user_id)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already belongs to an organization",
         )
 
-    organization = create_organization(db, org_data, clerk_user_id, email)
+    organization = await create_organization(db, org_data, clerk_user_id, email)
     return organization
 
 
 @router.get("/current", response_model=OrganizationResponse)
 async def get_current_organization(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get the current user's organization."""
-    organization = (
-        db.query(Organization).filter(Organization.id == current_user.tenant_id).first()
-    )
+    organization = await db.get(Organization, current_user.tenant_id)
 
     if not organization:
         raise HTTPException(
@@ -57,16 +56,14 @@ async def get_current_organization(
 
 @router.get("/check-user/{clerk_user_id}")
 async def check_user_organization(
-    clerk_user_id: str, email: str = None, db: Session = Depends(get_db)
+    clerk_user_id: str, email: str = None, db: AsyncSession = Depends(get_async_db)
 ):
     """Check if a user exists and has an organization. Used during login flow."""
-    user = get_user_by_clerk_id(db, clerk_user_id)
+    user = await get_user_by_clerk_id(db, clerk_user_id)
 
     if user:
         # User exists, check their organization
-        organization = (
-            db.query(Organization).filter(Organization.id == user.tenant_id).first()
-        )
+        organization = await db.get(Organization, user.tenant_id)
 
         return {
             "user_exists": True,
@@ -76,16 +73,12 @@ async def check_user_organization(
 
     # User doesn't exist yet, check for pending invitation
     if email:
-        invitation = get_invitation_by_email(db, email)
+        invitation = await get_invitation_by_email(db, email)
         if invitation:
             # Auto-accept the invitation and create the user
             try:
-                new_user = accept_invitation(db, invitation, clerk_user_id)
-                organization = (
-                    db.query(Organization)
-                    .filter(Organization.id == new_user.tenant_id)
-                    .first()
-                )
+                new_user = await accept_invitation(db, invitation, clerk_user_id)
+                organization = await db.get(Organization, new_user.tenant_id)
 
                 return {
                     "user_exists": True,
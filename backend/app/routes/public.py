@@ -1,126 +1,237 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-
-from app.db.session import get_db
-from app.models.organization import (
-    Organization,
-    Service,
-    Incident,
-    IncidentStatus,
-    Maintenance,
-    MaintenanceStatus,
-)
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime, timezone
+
+from app.db.replicas import get_read_db, route_reads
 from app.schemas.organization import (
     StatusPageResponse,
+    StatusPageBootstrapResponse,
     PublicService,
     PublicIncident,
     PublicMaintenance,
     Organization as OrganizationResponse,
 )
 from app.core.auth import get_organization_by_slug
+from app.core.responses import (
+    encoded_json_response,
+    fast_json_response,
+    matching_etag,
+)
+from app.services.status_page_service import (
+    get_status_page_payload,
+    get_status_bootstrap_payload,
+    status_etag,
+    load_public_services,
+    load_public_incidents,
+    load_incident_page,
+    load_public_maintenances,
+)
 
 router = APIRouter(prefix="/status", tags=["public"])
 
+MAX_PAGE_SIZE = 100
+
+
+def _not_modified_etag(request: Request, etag: str) -> Optional[str]:
+    """Check If-None-Match against the tenant's current ETag in any encoding."""
+    return matching_etag(request.headers.get("if-none-match"), etag)
+
+
+def _not_modified_response(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"},
+    )
+
+
+def _set_validators(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+
+async def _get_organization(org_slug: str, db: AsyncSession):
+    """Resolve the tenant, then let the rest of the request read from a replica."""
+    organization = await get_organization_by_slug(org_slug, db)
+    await route_reads(db, organization)
+    return organization
+
 
 @router.get("/{org_slug}/services", response_model=List[PublicService])
-async def get_public_services(org_slug: str, db: Session = Depends(get_db)):
+async def get_public_services(
+    org_slug: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
     """Get all services for a public organization by slug."""
-    organization = get_organization_by_slug(org_slug, db)
+    organization = await _get_organization(org_slug, db)
+    etag = status_etag(organization)
+    matched = _not_modified_etag(request, etag)
+    if matched:
+        return _not_modified_response(matched)
+    _set_validators(response, etag)
 
-    services = db.query(Service).filter(Service.tenant_id == organization.id).all()
-
-    return services
+    services = await load_public_services(db, organization.id)
+    return fast_json_response(services, List[PublicService], response.headers)
 
 
 @router.get("/{org_slug}/incidents", response_model=List[PublicIncident])
 async def get_public_incidents(
-    org_slug: str, active_only: bool = True, db: Session = Depends(get_db)
+    org_slug: str,
+    request: Request,
+    response: Response,
+    active_only: bool = True,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get incidents for a public organization by slug."""
-    organization = get_organization_by_slug(org_slug, db)
-
-    query = db.query(Incident).filter(Incident.tenant_id == organization.id)
-
-    if active_only:
-        query = query.filter(Incident.status == IncidentStatus.OPEN)
-
-    incidents = query.all()
-    return incidents
+    organization = await _get_organization(org_slug, db)
+    etag = status_etag(organization)
+    matched = _not_modified_etag(request, etag)
+    if matched:
+        return _not_modified_response(matched)
+    _set_validators(response, etag)
+
+    incidents = await load_public_incidents(
+        db, organization.id, active_only=active_only
+    )
+    return fast_json_response(incidents, List[PublicIncident], response.headers)
 
 
 @router.get("/{org_slug}/timeline", response_model=List[PublicIncident])
 async def get_public_timeline(
-    org_slug: str, limit: int = 10, db: Session = Depends(get_db)
+    org_slug: str,
+    request: Request,
+    response: Response,
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get recent incident history for a public organization by slug."""
-    organization = get_organization_by_slug(org_slug, db)
-
-    incidents = (
-        db.query(Incident)
-        .filter(Incident.tenant_id == organization.id)
-        .order_by(Incident.created_at.desc())
-        .limit(limit)
-        .all()
+    """Get recent incident history for a public organization by slug.
+
+    Pass the X-Next-Cursor header from a previous response as ``cursor`` to
+    fetch the next, older page.
+    """
+    organization = await _get_organization(org_slug, db)
+    etag = status_etag(organization)
+    matched = _not_modified_etag(request, etag)
+    if matched:
+        return _not_modified_response(matched)
+    _set_validators(response, etag)
+
+    incidents, next_cursor = await load_incident_page(
+        db, organization.id, limit=limit, cursor=cursor
     )
-
-    return incidents
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return fast_json_response(incidents, List[PublicIncident], response.headers)
+
+
+@router.get("/{org_slug}/history", response_model=List[PublicIncident])
+async def get_public_history(
+    org_slug: str,
+    request: Request,
+    response: Response,
+    month: str = Query(..., pattern=r"^\d{4}-(0[1-9]|1[0-2])$"),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Get the incident archive for one calendar month (``YYYY-MM``, UTC)."""
+    organization = await _get_organization(org_slug, db)
+    etag = status_etag(organization)
+    matched = _not_modified_etag(request, etag)
+    if matched:
+        return _not_modified_response(matched)
+    _set_validators(response, etag)
+
+    year, month_number = (int(part) for part in month.split("-"))
+    month_start = datetime(year, month_number, 1, tzinfo=timezone.utc)
+    if month_number == 12:
+        month_end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    else:
+        month_end = datetime(year, month_number + 1, 1, tzinfo=timezone.utc)
+
+    incidents, next_cursor = await load_incident_page(
+        db,
+        organization.id,
+        limit=limit,
+        cursor=cursor,
+        created_from=month_start,
+        created_before=month_end,
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return fast_json_response(incidents, List[PublicIncident], response.headers)
 
 
 @router.get("/{org_slug}/maintenance", response_model=List[PublicMaintenance])
 async def get_public_maintenances(
-    org_slug: str, active_only: bool = True, db: Session = Depends(get_db)
+    org_slug: str,
+    request: Request,
+    response: Response,
+    active_only: bool = True,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get maintenance windows for a public organization by slug."""
-    organization = get_organization_by_slug(org_slug, db)
-
-    query = db.query(Maintenance).filter(Maintenance.tenant_id == organization.id)
+    organization = await _get_organization(org_slug, db)
+    etag = status_etag(organization)
+    matched = _not_modified_etag(request, etag)
+    if matched:
+        return _not_modified_response(matched)
+    _set_validators(response, etag)
+
+    maintenances = await load_public_maintenances(
+        db, organization.id, active_only=active_only
+    )
+    return fast_json_response(maintenances, List[PublicMaintenance], response.headers)
 
-    if active_only:
-        query = query.filter(
-            Maintenance.status.in_(
-                [MaintenanceStatus.SCHEDULED, MaintenanceStatus.IN_PROGRESS]
-            )
-        )
 
-    maintenances = query.order_by(Maintenance.scheduled_start.desc()).all()
-    return maintenances
+@router.get("/{org_slug}/bootstrap", response_model=StatusPageBootstrapResponse)
+async def get_status_bootstrap(
+    org_slug: str,
+    request: Request,
+    timeline_limit: int = Query(5, ge=0, le=MAX_PAGE_SIZE),
+    maintenance_limit: int = Query(5, ge=0, le=MAX_PAGE_SIZE),
+    maintenance_horizon_days: int = Query(30, ge=0, le=365),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Get the status page, incident timeline and recent maintenance in one request.
+
+    ``maintenance_horizon_days`` bounds how far back completed maintenance
+    windows are included; scheduled and in-progress windows are always present.
+    """
+    organization = await _get_organization(org_slug, db)
+    etag = status_etag(organization)
+    matched = _not_modified_etag(request, etag)
+    if matched:
+        return _not_modified_response(matched)
+
+    payload = await get_status_bootstrap_payload(
+        db, organization, timeline_limit, maintenance_limit, maintenance_horizon_days
+    )
+    return encoded_json_response(
+        payload,
+        request.headers.get("accept-encoding"),
+        {"ETag": etag, "Cache-Control": "no-cache"},
+    )
 
 
 @router.get("/{org_slug}", response_model=StatusPageResponse)
-async def get_status_page(org_slug: str, db: Session = Depends(get_db)):
+async def get_status_page(
+    org_slug: str, request: Request, db: AsyncSession = Depends(get_read_db)
+):
     """Get complete status page data for an organization."""
-    organization = get_organization_by_slug(org_slug, db)
-
-    # Get all services
-    services = db.query(Service).filter(Service.tenant_id == organization.id).all()
-
-    # Get active incidents
-    active_incidents = (
-        db.query(Incident)
-        .filter(
-            Incident.tenant_id == organization.id,
-            Incident.status == IncidentStatus.OPEN,
-        )
-        .all()
-    )
-
-    # Get active maintenance windows
-    active_maintenances = (
-        db.query(Maintenance)
-        .filter(
-            Maintenance.tenant_id == organization.id,
-            Maintenance.status.in_(
-                [MaintenanceStatus.SCHEDULED, MaintenanceStatus.IN_PROGRESS]
-            ),
-        )
-        .order_by(Maintenance.scheduled_start.asc())
-        .all()
-    )
-
-    return StatusPageResponse(
-        organization=organization,
-        services=services,
-        active_incidents=active_incidents,
-        active_maintenances=active_maintenances,
+    organization = await _get_organization(org_slug, db)
+    etag = status_etag(organization)
+    matched = _not_modified_etag(request, etag)
+    if matched:
+        return _not_modified_response(matched)
+
+    # Served from the per-tenant snapshot cache; mutations invalidate it
+    payload = await get_status_page_payload(db, organization)
+    return encoded_json_response(
+        payload,
+        request.headers.get("accept-encoding"),
+        {"ETag": etag, "Cache-Control": "no-cache"},
     )
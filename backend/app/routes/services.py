@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.organization import Service, User, Organization
 from app.schemas.organization import (
     ServiceCreate,
@@ -10,37 +12,46 @@ from app.schemas.organization import (
     Service as ServiceResponse,
 )
 from app.core.auth import get_current_user, get_current_tenant
-from app.websocket import emit_service_update
+from app.core.responses import fast_json_response
+from app.services.event_outbox import enqueue_event
+from app.services.status_page_service import (
+    bump_content_version,
+    refresh_public_status,
+)
 
 router = APIRouter(prefix="/services", tags=["services"])
 
 
 @router.get("/", response_model=List[ServiceResponse])
 async def get_services(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get all services for the current user's tenant."""
     services = (
-        db.query(Service).filter(Service.tenant_id == current_user.tenant_id).all()
-    )
-    return services
+        await db.scalars(
+            select(Service).filter(Service.tenant_id == current_user.tenant_id)
+        )
+    ).all()
+    return fast_json_response(services, List[ServiceResponse])
 
 
 @router.post("/", response_model=ServiceResponse, status_code=status.HTTP_201_CREATED)
 async def create_service(
     service_data: ServiceCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Create a new service for the current user's tenant."""
     service = Service(**service_data.dict(), tenant_id=current_user.tenant_id)
     db.add(service)
-    db.commit()
-    db.refresh(service)
+    await db.flush()
 
-    # Emit WebSocket event for real-time updates
-    await emit_service_update(
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(
+        db,
         current_user.tenant_id,
+        "service_update",
         {
             "id": service.id,
             "name": service.name,
@@ -49,6 +60,12 @@ async def create_service(
             "action": "created",
         },
     )
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
+    await db.refresh(service)
+
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
 
     return service
 
@@ -57,13 +74,13 @@ async def create_service(
 async def get_service(
     service_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a specific service by ID within the current user's tenant."""
-    service = (
-        db.query(Service)
-        .filter(Service.id == service_id, Service.tenant_id == current_user.tenant_id)
-        .first()
+    service = await db.scalar(
+        select(Service).filter(
+            Service.id == service_id, Service.tenant_id == current_user.tenant_id
+        )
     )
 
     if not service:
@@ -78,13 +95,13 @@ async def update_service(
     service_id: int,
     service_update: ServiceUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Update a service within the current user's tenant."""
-    service = (
-        db.query(Service)
-        .filter(Service.id == service_id, Service.tenant_id == current_user.tenant_id)
-        .first()
+    service = await db.scalar(
+        select(Service).filter(
+            Service.id == service_id, Service.tenant_id == current_user.tenant_id
+        )
     )
 
     if not service:
@@ -97,12 +114,13 @@ async def update_service(
     for field, value in update_data.items():
         setattr(service, field, value)
 
-    db.commit()
-    db.refresh(service)
+    await db.flush()
 
-    # Emit WebSocket event for real-time updates
-    await emit_service_update(
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(
+        db,
         current_user.tenant_id,
+        "service_update",
         {
             "id": service.id,
             "name": service.name,
@@ -111,6 +129,12 @@ async def update_service(
             "action": "updated",
         },
     )
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
+    await db.refresh(service)
+
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
 
     return service
 
@@ -119,13 +143,14 @@ async def update_service(
 async def delete_service(
     service_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Delete a service within the current user's tenant."""
-    service = (
-        db.query(Service)
+    # Deleting clears the incident/maintenance links, so load them up front
+    service = await db.scalar(
+        select(Service)
+        .options(selectinload(Service.incidents), selectinload(Service.maintenances))
         .filter(Service.id == service_id, Service.tenant_id == current_user.tenant_id)
-        .first()
     )
 
     if not service:
@@ -142,10 +167,13 @@ async def delete_service(
         "action": "deleted",
     }
 
-    db.delete(service)
-    db.commit()
+    await db.delete(service)
+    # Queue the real-time event in the same transaction as the change
+    enqueue_event(db, current_user.tenant_id, "service_update", service_data)
+    await bump_content_version(db, current_user.tenant_id)
+    await db.commit()
 
-    # Emit WebSocket event for real-time updates
-    await emit_service_update(current_user.tenant_id, service_data)
+    # Refresh cached and published public status for this tenant
+    refresh_public_status(current_user.tenant_id)
 
     return None
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.organization import Organization, User, UserRole
 from app.schemas.organization import (
     TeamMemberInvite,
@@ -30,10 +31,10 @@ router = APIRouter(prefix="/team", tags=["team"])
 async def list_team_members(
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_current_tenant),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get all team members for the current organization."""
-    members = get_team_members(db, organization.id)
+    members = await get_team_members(db, organization.id)
     return TeamMemberList(members=members, total_count=len(members))
 
 
@@ -42,7 +43,7 @@ async def invite_member(
     invite_data: TeamMemberInvite,
     current_user: User = Depends(require_admin),
     organization: Organization = Depends(get_current_tenant),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Invite a new member to the organization. Admin only."""
     member = await invite_team_member(db, organization.id, invite_data, current_user.id)
@@ -55,10 +56,10 @@ async def update_member(
     update_data: TeamMemberUpdate,
     current_user: User = Depends(require_admin),
     organization: Organization = Depends(get_current_tenant),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Update a team member's role. Admin only."""
-    member = get_team_member_by_id(db, member_id, organization.id)
+    member = await get_team_member_by_id(db, member_id, organization.id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found"
@@ -66,10 +67,10 @@ async def update_member(
 
     # Prevent admin from demoting themselves if they're the only admin
     if member.id == current_user.id and update_data.role != UserRole.ADMIN:
-        admin_count = (
-            db.query(User)
+        admin_count = await db.scalar(
+            select(func.count())
+            .select_from(User)
             .filter(User.tenant_id == organization.id, User.role == UserRole.ADMIN)
-            .count()
         )
 
         if admin_count <= 1:
@@ -78,7 +79,7 @@ async def update_member(
                 detail="Cannot remove admin role from the last admin",
             )
 
-    updated_member = update_team_member(db, member, update_data)
+    updated_member = await update_team_member(db, member, update_data)
     return updated_member
 
 
@@ -87,17 +88,17 @@ async def remove_member(
     member_id: int,
     current_user: User = Depends(require_admin),
     organization: Organization = Depends(get_current_tenant),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Remove a team member or cancel invitation. Admin only."""
     # Handle pending invitations (negative IDs)
     if member_id < 0:
         invitation_id = -member_id
-        cancel_invitation(db, invitation_id, organization.id)
+        await cancel_invitation(db, invitation_id, organization.id)
         return
 
     # Handle actual users
-    member = get_team_member_by_id(db, member_id, organization.id)
+    member = await get_team_member_by_id(db, member_id, organization.id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Team member not found"
@@ -105,10 +106,10 @@ async def remove_member(
 
     # Prevent admin from removing themselves if they're the only admin
     if member.id == current_user.id:
-        admin_count = (
-            db.query(User)
+        admin_count = await db.scalar(
+            select(func.count())
+            .select_from(User)
             .filter(User.tenant_id == organization.id, User.role == UserRole.ADMIN)
-            .count()
         )
 
         if admin_count <= 1:
@@ -117,7 +118,7 @@ async def remove_member(
                 detail="Cannot remove the last admin from the organization",
             )
 
-    remove_team_member(db, member)
+    await remove_team_member(db, member)
 
 
 @router.get("/members/me", response_model=TeamMember)
@@ -139,15 +140,15 @@ async def get_my_profile(
 async def leave_organization(
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_current_tenant),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Leave the current organization."""
     # Prevent admin from leaving if they're the only admin
     if current_user.role == UserRole.ADMIN:
-        admin_count = (
-            db.query(User)
+        admin_count = await db.scalar(
+            select(func.count())
+            .select_from(User)
             .filter(User.tenant_id == organization.id, User.role == UserRole.ADMIN)
-            .count()
         )
 
         if admin_count <= 1:
@@ -156,17 +157,17 @@ async def leave_organization(
                 detail="Cannot leave organization as the last admin. Transfer admin role to another member first.",
             )
 
-    remove_team_member(db, current_user)
+    await remove_team_member(db, current_user)
 
 
 # Invitation endpoints (public routes for accepting invitations)
 @router.get("/invitation/{token}")
 async def get_invitation_details(
     token: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get invitation details by token (for invitation acceptance page)."""
-    invitation = get_invitation_by_token(db, token)
+    invitation = await get_invitation_by_token(db, token)
     if not invitation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -185,10 +186,10 @@ async def get_invitation_details(
 async def accept_team_invitation(
     token: str,
     clerk_user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Accept a team invitation and create user account."""
-    invitation = get_invitation_by_token(db, token)
+    invitation = await get_invitation_by_token(db, token)
     if not invitation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -196,13 +197,15 @@ async def accept_team_invitation(
         )
 
     # Check if user already exists
-    existing_user = db.query(User).filter(User.clerk_user_id == clerk_user_id).first()
+    existing_user = await db.scalar(
+        select(User).filter(User.clerk_user_id == clerk_user_id)
+    )
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="User already exists"
         )
 
-    user = accept_invitation(db, invitation, clerk_user_id)
+    user = await accept_invitation(db, invitation, clerk_user_id)
 
     return {
         "message": "Invitation accepted successfully",
@@ -268,8 +268,18 @@ class StatusPageResponse(BaseModel):
     active_maintenances: List[PublicMaintenance] = []
 
 
+class StatusPageBootstrapResponse(StatusPageResponse):
+    """Status page plus the recent-activity sections, fetched in one request."""
+
+    timeline: List[PublicIncident] = []
+    recent_maintenances: List[PublicMaintenance] = []
+
+
 # WebSocket message schemas
 class WebSocketMessage(BaseModel):
     type: str  # "service_update", "incident_update", "incident_created"
     data: dict
     tenant_id: int
+    seq: Optional[int] = None  # Per-tenant sequence, for resume after reconnect
+    epoch: Optional[str] = None  # Sequences only compare within one epoch
+    event_id: Optional[int] = None  # Outbox row id; a redelivery repeats it
@@ -0,0 +1,139 @@
+"""Per-tenant coalescing of real-time status events.
+
+Bursts of writes (an admin flipping several services, automation posting
+incident updates) each produce a websocket event, and every event makes public
+clients refetch the status page. ``EventCoalescer`` holds a tenant's events
+for a short quiet window, keeps only the latest state per entity, and flushes
+them together. Each new event restarts the window, but a batch is never held
+longer than ``max_delay_seconds`` after its first event. ``add`` returns a
+future that settles once the batch holding the event has been sent (or has
+failed), so callers with delivery guarantees know when it left.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FlushCallback = Callable[[int, List[Dict[str, Any]]], Awaitable[None]]
+
+_unkeyed = itertools.count()
+
+
+def entity_key(event: str, data: Dict[str, Any]) -> Tuple[str, Any]:
+    """Identify the entity an event describes, e.g. ("incident", 42).
+
+    Events without an ``id`` are never merged with anything else.
+    """
+    kind = event.rsplit("_", 1)[0]
+    entity_id = data.get("id")
+    if entity_id is None:
+        return kind, ("unkeyed", next(_unkeyed))
+    return kind, entity_id
+
+
+class _PendingBatch:
+    __slots__ = ("first_at", "last_at", "events", "task", "waiters")
+
+    def __init__(self, now: float):
+        self.first_at = now
+        self.last_at = now
+        self.events: "OrderedDict[Tuple[str, Any], Dict[str, Any]]" = OrderedDict()
+        self.task: Optional[asyncio.Task] = None
+        # Superseded events settle with the batch: their newer state went out
+        self.waiters: List[asyncio.Future] = []
+
+    def add(
+        self, event: str, data: Dict[str, Any], event_id: Optional[int], now: float
+    ) -> None:
+        key = entity_key(event, data)
+        previous = self.events.get(key)
+        # "created" stays the headline until the entity is deleted, so clients
+        # still learn it is new even if it was edited within the same window
+        if (
+            previous is not None
+            and previous["type"].endswith("_created")
+            and data.get("action") != "deleted"
+        ):
+            event = previous["type"]
+        self.events[key] = {"type": event, "data": data, "event_id": event_id}
+        self.last_at = now
+
+
+class EventCoalescer:
+    """Debounce events per tenant and hand the merged batch to ``flush``."""
+
+    def __init__(
+        self,
+        window_seconds: float,
+        max_delay_seconds: float,
+        flush: FlushCallback,
+    ):
+        self.window_seconds = window_seconds
+        self.max_delay_seconds = max(max_delay_seconds, window_seconds)
+        self._flush = flush
+        self._pending: Dict[int, _PendingBatch] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_seconds > 0
+
+    def add(
+        self,
+        tenant_id: int,
+        event: str,
+        data: Dict[str, Any],
+        event_id: Optional[int] = None,
+    ) -> asyncio.Future:
+        """Queue an event; must be called from the running event loop."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        batch = self._pending.get(tenant_id)
+        if batch is None:
+            batch = _PendingBatch(now)
+            self._pending[tenant_id] = batch
+            batch.task = loop.create_task(self._wait_and_flush(tenant_id, batch))
+        batch.add(event, data, event_id, now)
+        waiter = loop.create_future()
+        batch.waiters.append(waiter)
+        return waiter
+
+    async def _wait_and_flush(self, tenant_id: int, batch: _PendingBatch) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            deadline = min(
+                batch.last_at + self.window_seconds,
+                batch.first_at + self.max_delay_seconds,
+            )
+            delay = deadline - loop.time()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        await self._send(tenant_id, batch)
+
+    async def _send(self, tenant_id: int, batch: _PendingBatch) -> None:
+        if self._pending.get(tenant_id) is batch:
+            del self._pending[tenant_id]
+        try:
+            await self._flush(tenant_id, list(batch.events.values()))
+        except Exception as e:
+            logger.error(
+                f"❌ Failed to flush status events for tenant {tenant_id}: {e}"
+            )
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+        for waiter in batch.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def flush_all(self) -> None:
+        """Send every pending batch now (used on shutdown)."""
+        for tenant_id, batch in list(self._pending.items()):
+            if batch.task is not None:
+                batch.task.cancel()
+            await self._send(tenant_id, batch)
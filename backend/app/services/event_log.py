@@ -0,0 +1,104 @@
+"""Sequenced, bounded log of the real-time events sent to each tenant.
+
+Every ``status_update`` broadcast gets the next per-tenant sequence number and
+is kept in a fixed-size ring buffer, so a client that reconnects with the last
+sequence it saw can be sent just the events it missed. Each tenant log also
+has an epoch token: sequences only compare within one epoch, and a new epoch
+(process restart, tenant log evicted, client talking to another worker) tells
+the client to resync from the HTTP API instead.
+
+Replay is single-worker only. Sequences and buffers live in this process and
+only cover the events this worker emitted. With a shared message queue the
+other workers' events reach clients through the queue without entering this
+log, so a resumed client could be handed an incomplete replay. Logs created
+with ``replay=False`` (see ``app.websocket``) still stamp positions, so
+clients can drop overlaps, but every resume gets a resync.
+"""
+
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class _TenantLog:
+    __slots__ = ("epoch", "seq", "events")
+
+    def __init__(self, capacity: int):
+        self.epoch = uuid.uuid4().hex[:12]
+        self.seq = 0
+        # (message, rooms it was sent to)
+        self.events: Deque[Tuple[Dict[str, Any], Set[str]]] = deque(maxlen=capacity)
+
+
+class TenantEventLog:
+    """Per-tenant ring buffers of sent messages, LRU-bounded by tenant count."""
+
+    def __init__(
+        self, capacity: int = 256, max_tenants: int = 10000, replay: bool = True
+    ):
+        self.capacity = capacity
+        self.max_tenants = max_tenants
+        self.replay = replay
+        self._logs: "OrderedDict[int, _TenantLog]" = OrderedDict()
+        self.replays = 0
+        self.resyncs = 0
+
+    def _log(self, tenant_id: int) -> _TenantLog:
+        log = self._logs.get(tenant_id)
+        if log is None:
+            log = _TenantLog(self.capacity)
+            self._logs[tenant_id] = log
+            while len(self._logs) > self.max_tenants:
+                self._logs.popitem(last=False)
+        self._logs.move_to_end(tenant_id)
+        return log
+
+    def position(self, tenant_id: int) -> Dict[str, Any]:
+        """Current ``{"epoch", "seq"}`` for a tenant, to hand to new subscribers."""
+        log = self._log(tenant_id)
+        return {"epoch": log.epoch, "seq": log.seq}
+
+    def append(
+        self, tenant_id: int, message: Dict[str, Any], rooms: Iterable[str]
+    ) -> Dict[str, Any]:
+        """Stamp ``message`` with the tenant's next sequence and remember it."""
+        log = self._log(tenant_id)
+        log.seq += 1
+        message["seq"] = log.seq
+        message["epoch"] = log.epoch
+        log.events.append((message, set(rooms)))
+        return message
+
+    def since(
+        self, tenant_id: int, epoch: Optional[str], last_seq: int, rooms: Set[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Messages after ``last_seq`` that were sent to any of ``rooms``.
+
+        Returns None when the gap cannot be replayed.
+        """
+        log = self._log(tenant_id)
+        if not self.replay or epoch != log.epoch or last_seq > log.seq:
+            self.resyncs += 1
+            return None
+        if last_seq == log.seq:
+            return []
+        oldest = log.events[0][0]["seq"] if log.events else log.seq + 1
+        if last_seq + 1 < oldest:
+            self.resyncs += 1
+            return None
+        self.replays += 1
+        return [
+            message
+            for message, sent_to in log.events
+            if message["seq"] > last_seq and not sent_to.isdisjoint(rooms)
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "tenants": len(self._logs),
+            "capacity": self.capacity,
+            "replay": self.replay,
+            "buffered_events": sum(len(log.events) for log in self._logs.values()),
+            "replays": self.replays,
+            "resyncs": self.resyncs,
+        }
@@ -0,0 +1,305 @@
+"""Transactional outbox for real-time websocket events.
+
+Mutations call ``enqueue_event`` before ``db.commit()``, so the event row is
+committed atomically with the change it describes. ``OutboxDispatcher`` runs
+as a background task: it claims undelivered rows in id order, hands them to
+``app.websocket.emit_to_organization`` and marks them delivered. Events held
+in the coalescing window are only marked once their batch has been sent. A
+crash between publishing and marking means the row is published again once
+its claim expires (at-least-once delivery). Every event carries its row id as
+``event_id`` so clients can drop the repeats.
+
+Events of one tenant are published in id order even with several
+dispatchers: a claim locks the tenants' organization rows (``SKIP LOCKED``,
+so other workers take other tenants), and a tenant is not claimed while an
+earlier row of its is still leased. If a row fails to publish, the rest of
+that tenant's batch waits for the retry instead of overtaking it.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, event, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.organization import EventOutbox, Organization
+
+logger = logging.getLogger(__name__)
+
+ClaimedEvent = Tuple[int, int, str, Dict[str, Any]]
+
+
+def enqueue_event(
+    db: AsyncSession, tenant_id: int, event_type: str, payload: Dict[str, Any]
+) -> None:
+    """Add an outbox row to the caller's transaction; it is sent after commit."""
+    db.add(EventOutbox(tenant_id=tenant_id, event_type=event_type, payload=payload))
+    if not db.info.get("outbox_notify"):
+        db.info["outbox_notify"] = True
+        # Session events are only dispatched by the sync session an AsyncSession wraps
+        event.listen(db.sync_session, "after_commit", _notify_after_commit, once=True)
+
+
+def _notify_after_commit(session: Session) -> None:
+    session.info.pop("outbox_notify", None)
+    outbox_dispatcher.notify()
+
+
+class OutboxDispatcher:
+    """Background task publishing committed outbox rows to websocket subscribers."""
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        poll_interval_seconds: float = 1.0,
+        lease_seconds: float = 30.0,
+        max_attempts: int = 5,
+        retention_seconds: float = 86400.0,
+        cleanup_interval_seconds: float = 300.0,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds
+        self.cleanup_interval_seconds = cleanup_interval_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._marking: Set[asyncio.Task] = set()
+        self._last_cleanup = 0.0
+        self.delivered = 0
+        self.failed = 0
+        self.cleaned = 0
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+        logger.info("📬 Event outbox dispatcher started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        # Publish whatever was committed while shutting down
+        await self.dispatch_once()
+        # Send what the coalescer still holds so those rows can be marked too
+        from app.websocket import status_update_coalescer
+
+        await status_update_coalescer.flush_all()
+        if self._marking:
+            await asyncio.gather(*self._marking, return_exceptions=True)
+
+    def notify(self) -> None:
+        """Wake the dispatcher early; safe to call from any thread."""
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                published = await self.dispatch_once()
+                await self._cleanup_if_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Event outbox dispatch failed: {e}")
+                published = 0
+
+            if published >= self.batch_size:
+                continue  # More rows are probably waiting
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), timeout=self.poll_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def dispatch_once(self) -> int:
+        """Claim, publish and mark one batch; returns the number of rows claimed."""
+        from app.websocket import emit_to_organization
+
+        claimed = await self._claim_batch()
+        if not claimed:
+            return 0
+
+        delivered_ids, held_ids = [], []
+        coalescing: List[Tuple[int, asyncio.Future]] = []
+        held_tenants = set()
+        for event_id, tenant_id, event_type, payload in claimed:
+            if tenant_id in held_tenants:
+                held_ids.append(event_id)
+                continue
+            try:
+                sent = await emit_to_organization(
+                    tenant_id, event_type, payload, event_id=event_id
+                )
+            except Exception as e:
+                self.failed += 1
+                held_tenants.add(tenant_id)
+                logger.error(f"❌ Failed to publish outbox event {event_id}: {e}")
+                continue
+            if sent is None:
+                delivered_ids.append(event_id)
+            else:
+                coalescing.append((event_id, sent))
+
+        if coalescing:
+            # The row stays leased (and its tenant's later rows wait) until then
+            task = asyncio.ensure_future(self._mark_when_sent(coalescing))
+            self._marking.add(task)
+            task.add_done_callback(self._marking.discard)
+        if held_ids:
+            await self._release(held_ids)
+        if delivered_ids:
+            await self._mark_delivered(delivered_ids)
+            self.delivered += len(delivered_ids)
+        return len(claimed)
+
+    async def _mark_when_sent(self, waiting: List[Tuple[int, asyncio.Future]]) -> None:
+        """Mark coalesced events delivered once their batch has gone out."""
+        results = await asyncio.gather(
+            *(sent for _, sent in waiting), return_exceptions=True
+        )
+        delivered_ids = []
+        for (event_id, _), result in zip(waiting, results):
+            if isinstance(result, BaseException):
+                # Left leased: published again once the claim expires
+                self.failed += 1
+                logger.error(f"❌ Failed to publish outbox event {event_id}: {result}")
+            else:
+                delivered_ids.append(event_id)
+        if delivered_ids:
+            try:
+                await self._mark_delivered(delivered_ids)
+            except Exception as e:
+                logger.error(f"❌ Failed to mark outbox events delivered: {e}")
+                return
+            self.delivered += len(delivered_ids)
+
+    async def _claim_batch(self) -> List[ClaimedEvent]:
+        """Lease the oldest undelivered rows of tenants no other worker is sending."""
+        async with AsyncSessionLocal() as db:
+            now = datetime.now(timezone.utc)
+            earlier = aliased(EventOutbox)
+            claimable = (
+                EventOutbox.delivered_at.is_(None),
+                EventOutbox.attempts < self.max_attempts,
+                or_(
+                    EventOutbox.locked_until.is_(None),
+                    EventOutbox.locked_until < now,
+                ),
+                # Sending now would overtake a row another worker is publishing
+                ~select(earlier.id)
+                .filter(
+                    earlier.tenant_id == EventOutbox.tenant_id,
+                    earlier.id < EventOutbox.id,
+                    earlier.delivered_at.is_(None),
+                    earlier.locked_until >= now,
+                )
+                .exists(),
+            )
+            waiting = (
+                select(EventOutbox.tenant_id)
+                .filter(*claimable)
+                .group_by(EventOutbox.tenant_id)
+                .order_by(func.min(EventOutbox.id))
+                .limit(self.batch_size)
+            )
+            # Held until commit, so concurrent claims never split a tenant
+            tenant_ids = await db.scalars(
+                select(Organization.id)
+                .filter(Organization.id.in_(waiting.scalar_subquery()))
+                .with_for_update(skip_locked=True)
+            )
+            tenant_ids = tenant_ids.all()
+            if not tenant_ids:
+                return []
+
+            rows = await db.scalars(
+                select(EventOutbox)
+                .filter(EventOutbox.tenant_id.in_(tenant_ids), *claimable)
+                .order_by(EventOutbox.id)
+                .limit(self.batch_size)
+            )
+            lease = now + timedelta(seconds=self.lease_seconds)
+            claimed = []
+            for row in rows.all():
+                row.attempts += 1
+                row.locked_until = lease
+                claimed.append((row.id, row.tenant_id, row.event_type, row.payload))
+            await db.commit()
+            return claimed
+
+    async def _mark_delivered(self, event_ids: List[int]) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(EventOutbox)
+                .filter(EventOutbox.id.in_(event_ids))
+                .values(delivered_at=datetime.now(timezone.utc))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    async def _release(self, event_ids: List[int]) -> None:
+        """Hand back claimed rows that were not attempted, without using a retry."""
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(EventOutbox)
+                .filter(EventOutbox.id.in_(event_ids))
+                .values(locked_until=None, attempts=EventOutbox.attempts - 1)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    async def _cleanup_if_due(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop.time() - self._last_cleanup < self.cleanup_interval_seconds:
+            return
+        self._last_cleanup = loop.time()
+        removed = await self.cleanup()
+        if removed:
+            logger.info(f"🧹 Removed {removed} expired outbox events")
+
+    async def cleanup(self) -> int:
+        """Delete rows older than the retention period, delivered or not."""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.retention_seconds)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                delete(EventOutbox)
+                .filter(EventOutbox.created_at < cutoff)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            self.cleaned += result.rowcount
+            return result.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "cleaned": self.cleaned,
+        }
+
+
+outbox_dispatcher = OutboxDispatcher(
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval_seconds=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+    lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    retention_seconds=settings.OUTBOX_RETENTION_HOURS * 3600,
+    cleanup_interval_seconds=settings.OUTBOX_CLEANUP_INTERVAL_SECONDS,
+)
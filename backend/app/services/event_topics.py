@@ -0,0 +1,111 @@
+"""Topic rooms for clients that only follow some services or event types.
+
+A tenant-wide subscriber sits in ``org:<tenant>``. A filtered subscriber sits
+in one room per (service, event type) pair it asked for, with ``*`` standing
+for "any", e.g. ``org:7:service:12:*`` or ``org:7:service:*:incident_update``.
+Every event names the rooms it belongs to from its own payload, so each room
+is the service→subscribers index for its topic and emits stay plain room
+emits that work across workers. A coalesced batch only goes to the tenant
+room: its events can belong to different topics, so topic rooms are sent
+each event on its own instead.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Event types a subscription may filter on (what the routes queue)
+EVENT_TYPES = frozenset(
+    {
+        "service_update",
+        "incident_created",
+        "incident_update",
+        "maintenance_created",
+        "maintenance_update",
+    }
+)
+
+MAX_TOPIC_SERVICES = 100
+ANY = "*"
+
+
+def organization_room(tenant_id: int) -> str:
+    """Name of the Socket.IO room holding a tenant's unfiltered subscribers"""
+    return f"org:{tenant_id}"
+
+
+def topic_room(tenant_id: int, service_id: Any, event_type: str) -> str:
+    return f"org:{tenant_id}:service:{service_id}:{event_type}"
+
+
+def event_service_ids(event: str, data: Dict[str, Any]) -> Set[int]:
+    """Services an event is about: the service itself, or those it affects."""
+    if event == "service_update":
+        return {data["id"]} if data.get("id") is not None else set()
+    return {
+        service["id"]
+        for service in data.get("services") or ()
+        if isinstance(service, dict) and service.get("id") is not None
+    }
+
+
+def event_rooms(tenant_id: int, event: str, data: Dict[str, Any]) -> List[str]:
+    """Topic rooms following one event (the tenant room not included)."""
+    rooms = {topic_room(tenant_id, ANY, event)}
+    for service_id in event_service_ids(event, data):
+        rooms.add(topic_room(tenant_id, service_id, ANY))
+        rooms.add(topic_room(tenant_id, service_id, event))
+    return sorted(rooms)
+
+
+def message_rooms(tenant_id: int, message: Dict[str, Any]) -> List[str]:
+    """Every room a status_update message should reach."""
+    if message["type"] == "batch":
+        return [organization_room(tenant_id)]
+    return [organization_room(tenant_id)] + event_rooms(
+        tenant_id, message["type"], message["data"]
+    )
+
+
+def parse_topics(
+    data: Dict[str, Any],
+) -> Tuple[Optional[List[int]], Optional[List[str]]]:
+    """Validate ``service_ids`` / ``event_types`` from a subscribe request.
+
+    Missing or empty lists mean "all". Raises ``ValueError`` on bad input.
+    """
+    service_ids = data.get("service_ids") or None
+    event_types = data.get("event_types") or None
+
+    if service_ids is not None:
+        if not isinstance(service_ids, list) or not all(
+            isinstance(service_id, int) and service_id > 0 for service_id in service_ids
+        ):
+            raise ValueError("service_ids must be a list of positive integers")
+        if len(service_ids) > MAX_TOPIC_SERVICES:
+            raise ValueError(
+                f"At most {MAX_TOPIC_SERVICES} service_ids per subscription"
+            )
+        service_ids = sorted(set(service_ids))
+
+    if event_types is not None:
+        if not isinstance(event_types, list) or not set(event_types) <= EVENT_TYPES:
+            raise ValueError(
+                f"event_types must be a list of: {', '.join(sorted(EVENT_TYPES))}"
+            )
+        event_types = sorted(set(event_types))
+
+    return service_ids, event_types
+
+
+def subscription_rooms(
+    tenant_id: int,
+    service_ids: Optional[Iterable[int]],
+    event_types: Optional[Iterable[str]],
+) -> Set[str]:
+    """Rooms to join for a subscription (``None`` means "all")."""
+    if service_ids is None and event_types is None:
+        return {organization_room(tenant_id)}
+    return {
+        topic_room(tenant_id, service_id, event_type)
+        for service_id in (service_ids or [ANY])
+        for event_type in (event_types or [ANY])
+    }
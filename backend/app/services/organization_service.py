@@ -1,13 +1,18 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.models.organization import Organization, User, UserRole
 from app.schemas.organization import OrganizationCreate, UserCreate
+from app.services.slug_cache import organization_slug_cache
 import re
 
 
-def create_organization(
-    db: Session, org_data: OrganizationCreate, creator_clerk_id: str, creator_email: str
+async def create_organization(
+    db: AsyncSession,
+    org_data: OrganizationCreate,
+    creator_clerk_id: str,
+    creator_email: str,
 ) -> Organization:
     """Create a new organization and assign the creator as admin."""
 
@@ -22,7 +27,7 @@ def create_organization(
         # Create organization
         organization = Organization(name=org_data.name, slug=org_data.slug)
         db.add(organization)
-        db.flush()  # Get the ID without committing
+        await db.flush()  # Get the ID without committing
 
         # Create admin user
         admin_user = User(
@@ -32,13 +37,16 @@ def create_organization(
             role=UserRole.ADMIN,
         )
         db.add(admin_user)
-        db.commit()
-        db.refresh(organization)
+        await db.commit()
+        await db.refresh(organization)
+
+        # Clear any negative cache entry left by earlier lookups of this slug
+        organization_slug_cache.invalidate_slug(organization.slug)
 
         return organization
 
     except IntegrityError as e:
-        db.rollback()
+        await db.rollback()
         if "slug" in str(e):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -54,27 +62,27 @@ def create_organization(
         )
 
 
-def get_user_by_clerk_id(db: Session, clerk_user_id: str) -> User:
+async def get_user_by_clerk_id(db: AsyncSession, clerk_user_id: str) -> User:
     """Get user by Clerk ID."""
-    return db.query(User).filter(User.clerk_user_id == clerk_user_id).first()
+    return await db.scalar(select(User).filter(User.clerk_user_id == clerk_user_id))
 
 
-def create_user(db: Session, user_data: UserCreate) -> User:
+async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
     """Create a new user."""
     try:
         user = User(**user_data.dict())
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
         return user
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email or Clerk ID already exists",
         )
 
 
-def get_organization_by_slug(db: Session, slug: str) -> Organization:
+async def get_organization_by_slug(db: AsyncSession, slug: str) -> Organization:
     """Get organization by slug."""
-    return db.query(Organization).filter(Organization.slug == slug).first()
+    return await db.scalar(select(Organization).filter(Organization.slug == slug))
@@ -0,0 +1,148 @@
+"""In-process cache resolving public slugs to organizations.
+
+Only the slug→organization mapping is cached. ``content_version`` changes on
+every write and a write on another worker cannot reach this cache, so
+``get_organization_by_slug`` re-reads it from the database on each request;
+the cached value is just what the snapshot saw.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.models.organization import Organization
+
+
+@dataclass(frozen=True)
+class CachedOrganization:
+    """Detached snapshot of the organization columns public endpoints need."""
+
+    id: int
+    name: str
+    slug: str
+    content_version: int
+    created_at: datetime
+    updated_at: datetime
+
+    def with_content_version(self, content_version: int) -> "CachedOrganization":
+        return replace(self, content_version=content_version)
+
+    @classmethod
+    def from_model(cls, organization: Organization) -> "CachedOrganization":
+        return cls(
+            id=organization.id,
+            name=organization.name,
+            slug=organization.slug,
+            content_version=organization.content_version,
+            created_at=organization.created_at,
+            updated_at=organization.updated_at,
+        )
+
+
+class SlugCache:
+    """TTL+LRU slug lookups, plus a negative cache so unknown slugs skip the DB."""
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_seconds: float = 5.0,
+        max_negative_entries: int = 10000,
+        negative_ttl_seconds: float = 30.0,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_negative_entries = max_negative_entries
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._missing: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(self, slug: str) -> Optional[CachedOrganization]:
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is not None:
+                organization, stored_at = entry
+                if time.monotonic() - stored_at <= self.ttl_seconds:
+                    self._entries.move_to_end(slug)
+                    self.hits += 1
+                    return organization
+                self._remove(slug)
+            self.misses += 1
+            return None
+
+    def is_missing(self, slug: str) -> bool:
+        """True when the slug recently resolved to no organization."""
+        with self._lock:
+            stored_at = self._missing.get(slug)
+            if stored_at is None:
+                return False
+            if time.monotonic() - stored_at > self.negative_ttl_seconds:
+                del self._missing[slug]
+                return False
+            self.negative_hits += 1
+            return True
+
+    def set(self, organization: Organization) -> CachedOrganization:
+        cached = CachedOrganization.from_model(organization)
+        with self._lock:
+            self._missing.pop(cached.slug, None)
+            self._entries[cached.slug] = (cached, time.monotonic())
+            self._entries.move_to_end(cached.slug)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return cached
+
+    def set_missing(self, slug: str) -> None:
+        with self._lock:
+            self._missing[slug] = time.monotonic()
+            self._missing.move_to_end(slug)
+            while len(self._missing) > self.max_negative_entries:
+                self._missing.popitem(last=False)
+
+    def invalidate_slug(self, slug: str) -> None:
+        """Forget a slug, e.g. after an organization is created or renamed."""
+        with self._lock:
+            self._missing.pop(slug, None)
+            if slug in self._entries:
+                self._remove(slug)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._missing.clear()
+
+    def _remove(self, slug: str) -> None:
+        del self._entries[slug]
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "negative_entries": len(self._missing),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "negative_hits": self.negative_hits,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+
+organization_slug_cache = SlugCache(
+    max_entries=settings.SLUG_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SLUG_CACHE_TTL_SECONDS,
+    max_negative_entries=settings.SLUG_CACHE_MAX_NEGATIVE_ENTRIES,
+    negative_ttl_seconds=settings.SLUG_CACHE_NEGATIVE_TTL_SECONDS,
+)
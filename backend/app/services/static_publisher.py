@@ -0,0 +1,215 @@
+"""Publish pre-rendered public status pages as static files.
+
+Each tenant gets a directory under ``settings.STATIC_PUBLISH_DIR`` named after
+its slug, containing ``status.json``, ``timeline.json``, ``maintenance.json``
+and ``index.html`` plus a gzip variant of each. Any static file server (or the
+``/static/status`` route in ``app.main``) can serve them without touching the
+database.
+"""
+
+import asyncio
+import gzip
+import html
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.organization import Organization
+from app.schemas.organization import PublicIncident, PublicMaintenance
+from app.services.status_page_service import (
+    build_status_page,
+    load_incident_page,
+    load_public_maintenances,
+)
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_LIMIT = 10
+VERSION_FILE = "version"
+PUBLISHED_FILES = ("status.json", "timeline.json", "maintenance.json", "index.html")
+
+_incident_list = TypeAdapter(List[PublicIncident])
+_maintenance_list = TypeAdapter(List[PublicMaintenance])
+
+# One background publish per tenant; holding them stops them being garbage
+# collected. A change landing mid-publish queues exactly one more run, so an
+# older render can never finish after (and overwrite) a newer one.
+_publish_tasks: Dict[int, asyncio.Task] = {}
+_republish: Set[int] = set()
+
+
+def get_publish_dir() -> Path:
+    return Path(settings.STATIC_PUBLISH_DIR)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write to a temp file in the target directory, then rename it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _write_with_variants(path: Path, data: bytes) -> None:
+    # mtime=0 keeps the gzip bytes stable for identical content
+    _atomic_write(path.with_name(path.name + ".gz"), gzip.compress(data, mtime=0))
+    _atomic_write(path, data)
+
+
+def render_status_html(page) -> str:
+    """Render a minimal, dependency-free HTML status page."""
+    esc = html.escape
+    services = "".join(
+        f"<li>{esc(s.name)} &mdash; {esc(s.status.value.replace('_', ' '))}</li>"
+        for s in page.services
+    )
+    incidents = "".join(
+        f"<li><strong>{esc(i.title)}</strong> ({esc(i.status.value)})"
+        f"<p>{esc(i.description or '')}</p></li>"
+        for i in page.active_incidents
+    )
+    maintenances = "".join(
+        f"<li><strong>{esc(m.title)}</strong> "
+        f"{esc(m.scheduled_start.isoformat())} &ndash; {esc(m.scheduled_end.isoformat())}</li>"
+        for m in page.active_maintenances
+    )
+    name = esc(page.organization.name)
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>{name} Status</title></head><body>"
+        f"<h1>{name} Status</h1>"
+        f"<h2>Services</h2><ul>{services or '<li>No services</li>'}</ul>"
+        f"<h2>Active Incidents</h2><ul>{incidents or '<li>No active incidents</li>'}</ul>"
+        f"<h2>Scheduled Maintenance</h2><ul>{maintenances or '<li>None scheduled</li>'}</ul>"
+        "</body></html>\n"
+    )
+
+
+def _read_version(target: Path) -> Optional[int]:
+    try:
+        return int((target / VERSION_FILE).read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def read_published_version(slug: str) -> Optional[int]:
+    return _read_version(get_publish_dir() / slug)
+
+
+def _write_published_files(target: Path, files: Dict[str, bytes], version: int) -> None:
+    # Another worker (or the publish script) already wrote newer content
+    published = _read_version(target)
+    if published is not None and published > version:
+        return
+    target.mkdir(parents=True, exist_ok=True)
+    for name, data in files.items():
+        _write_with_variants(target / name, data)
+
+    # Written last so an interrupted publish is retried by incremental runs
+    _atomic_write(target / VERSION_FILE, str(version).encode())
+
+
+async def publish_organization(db: AsyncSession, organization: Organization) -> None:
+    """Render and atomically write every static file for one organization."""
+    page = await build_status_page(db, organization)
+    timeline, _ = await load_incident_page(db, organization.id, limit=TIMELINE_LIMIT)
+    maintenances = await load_public_maintenances(db, organization.id)
+
+    files = {
+        "status.json": page.model_dump_json().encode(),
+        "timeline.json": _incident_list.dump_json(
+            _incident_list.validate_python(timeline, from_attributes=True)
+        ),
+        "maintenance.json": _maintenance_list.dump_json(
+            _maintenance_list.validate_python(maintenances, from_attributes=True)
+        ),
+        "index.html": render_status_html(page).encode(),
+    }
+    # The writes fsync, so they run in a worker thread rather than on the loop
+    await asyncio.get_running_loop().run_in_executor(
+        None,
+        _write_published_files,
+        get_publish_dir() / organization.slug,
+        files,
+        organization.content_version,
+    )
+
+
+async def publish_all(db: AsyncSession, incremental: bool = False) -> Dict[str, int]:
+    """Publish every organization, or only those whose content version changed."""
+    published = skipped = failed = 0
+
+    # Ids only: a rollback after a failure expires every loaded organization
+    tenant_ids = await db.scalars(select(Organization.id).order_by(Organization.id))
+    for tenant_id in tenant_ids.all():
+        organization = await db.get(Organization, tenant_id)
+        if organization is None:
+            continue
+        slug = organization.slug
+        if incremental and read_published_version(slug) == organization.content_version:
+            skipped += 1
+            continue
+        try:
+            await publish_organization(db, organization)
+            published += 1
+        except Exception as e:
+            failed += 1
+            logger.error(f"Failed to publish status page for {slug}: {e}")
+            # Leave the failed transaction so the next organization can query
+            await db.rollback()
+
+    return {"published": published, "skipped": skipped, "failed": failed}
+
+
+async def publish_tenant(tenant_id: int) -> None:
+    """Publish one tenant using a dedicated session."""
+    async with AsyncSessionLocal() as db:
+        try:
+            organization = await db.get(Organization, tenant_id)
+            if organization:
+                await publish_organization(db, organization)
+        except Exception as e:
+            logger.error(f"Failed to publish status page for tenant {tenant_id}: {e}")
+
+
+def schedule_publish(tenant_id: int) -> None:
+    """Republish a tenant in the background without delaying the HTTP response."""
+    if not settings.STATIC_PUBLISH_ENABLED:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(publish_tenant(tenant_id))
+        return
+    if tenant_id in _publish_tasks:
+        _republish.add(tenant_id)
+        return
+    _publish_tasks[tenant_id] = loop.create_task(_publish_until_current(tenant_id))
+
+
+async def _publish_until_current(tenant_id: int) -> None:
+    try:
+        while True:
+            _republish.discard(tenant_id)
+            await publish_tenant(tenant_id)
+            if tenant_id not in _republish:
+                return
+    finally:
+        del _publish_tasks[tenant_id]
@@ -0,0 +1,133 @@
+"""In-process cache of serialized public status pages."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.responses import EncodedPayload
+
+STATUS_PAGE_VARIANT = "status_page"
+
+
+class _TenantEntry:
+    __slots__ = ("version", "stored_at", "variants")
+
+    def __init__(self, version: int):
+        self.version = version
+        self.stored_at = time.monotonic()
+        self.variants: "OrderedDict[str, EncodedPayload]" = OrderedDict()
+
+
+class StatusPageCache:
+    """Bounded LRU store of pre-serialized status page payloads keyed by tenant.
+
+    Each tenant entry holds one payload per variant (the status page itself,
+    bootstrap documents with different options, ...) for a single content
+    version; a version change or invalidation drops every variant at once.
+    Payloads carry their gzip/brotli encodings, so hits never compress.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 30.0,
+        max_variants_per_tenant: int = 8,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_variants_per_tenant = max_variants_per_tenant
+        self._entries: "OrderedDict[int, _TenantEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(
+        self, tenant_id: int, version: int, variant: str = STATUS_PAGE_VARIANT
+    ) -> Optional[EncodedPayload]:
+        """Return the cached payload for a tenant's content version, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is not None and (
+                entry.version != version
+                or (
+                    self.ttl_seconds
+                    and time.monotonic() - entry.stored_at > self.ttl_seconds
+                )
+            ):
+                # Another worker changed the tenant, or the entry simply aged out
+                del self._entries[tenant_id]
+                entry = None
+
+            payload = entry.variants.get(variant) if entry is not None else None
+            if payload is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(tenant_id)
+            entry.variants.move_to_end(variant)
+            self.hits += 1
+            return payload
+
+    def set(
+        self,
+        tenant_id: int,
+        version: int,
+        payload: EncodedPayload,
+        variant: str = STATUS_PAGE_VARIANT,
+    ) -> EncodedPayload:
+        """Store a freshly built payload, evicting the least recently used tenant."""
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is None or entry.version != version:
+                entry = _TenantEntry(version)
+                self._entries[tenant_id] = entry
+            self._entries.move_to_end(tenant_id)
+
+            entry.variants[variant] = payload
+            entry.variants.move_to_end(variant)
+            while len(entry.variants) > self.max_variants_per_tenant:
+                entry.variants.popitem(last=False)
+            self.rebuilds += 1
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return payload
+
+    def invalidate(self, tenant_id: int) -> None:
+        """Drop a tenant's payloads after its services, incidents or maintenance change."""
+        with self._lock:
+            if self._entries.pop(tenant_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "variants": sum(len(e.variants) for e in self._entries.values()),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "rebuilds": self.rebuilds,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+
+status_page_cache = StatusPageCache(
+    max_entries=settings.STATUS_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.STATUS_CACHE_TTL_SECONDS,
+)
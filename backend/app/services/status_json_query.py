@@ -0,0 +1,188 @@
+"""Build the public status page document inside Postgres.
+
+``fetch_status_page_json`` asks Postgres for the complete ``StatusPageResponse``
+as compact JSON text (assembled with ``to_json`` and ``string_agg``), so no ORM
+objects, pydantic models or Python JSON parsing are involved. Field order,
+list ordering, enum values and timestamp formatting all mirror the ORM path
+in ``status_page_service`` so both produce the same bytes, whatever the
+server's ``TimeZone``.
+"""
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.organization import IncidentStatus, MaintenanceStatus
+
+
+def _ts(column: str) -> str:
+    """SQL rendering a timestamptz the way pydantic serializes aware datetimes.
+
+    asyncpg hands the ORM path UTC datetimes whatever the session ``TimeZone``,
+    which pydantic writes with a ``Z`` suffix, so the value is converted to UTC
+    here rather than printed in the session's zone. Fractional seconds are
+    printed only when non-zero.
+    """
+    utc = f"({column} AT TIME ZONE 'UTC')"
+    return (
+        f"CASE WHEN {column} IS NULL THEN NULL ELSE "
+        f"to_char({utc}, 'YYYY-MM-DD\"T\"HH24:MI:SS')"
+        f" || CASE WHEN to_char({utc}, 'US') = '000000' THEN ''"
+        f" ELSE to_char({utc}, '.US') END || 'Z' END"
+    )
+
+
+def _value(expr: str) -> str:
+    """A scalar as JSON text; to_json escapes strings the way pydantic does."""
+    return f"COALESCE(to_json({expr})::text, 'null')"
+
+
+def _object(*fields: Tuple[str, str]) -> str:
+    """Compact JSON object text from (key, JSON-text expression) pairs, in order.
+
+    Concatenated by hand because json_build_object/json_agg pad their output
+    (``"id" : 1, ``) and Postgres has no compact rendering.
+    """
+    members = " || ',' || ".join(f"'\"{key}\":' || {expr}" for key, expr in fields)
+    return f"('{{' || {members} || '}}')"
+
+
+def _array(element: str, source: str, order: str) -> str:
+    """Compact JSON array text of ``element`` over the rows of ``source``."""
+    return (
+        f"COALESCE((SELECT '[' || string_agg({element}, ',' ORDER BY {order}) || ']' "
+        f"{source}), '[]')"
+    )
+
+
+def _service(alias: str) -> str:
+    return _object(
+        ("id", _value(f"{alias}.id")),
+        ("name", _value(f"{alias}.name")),
+        ("description", _value(f"{alias}.description")),
+        ("status", _value(f"lower({alias}.status::text)")),
+    )
+
+
+def _timestamps(alias: str, *columns: str) -> List[Tuple[str, str]]:
+    return [(column, _value(_ts(f"{alias}.{column}"))) for column in columns]
+
+
+# SQLAlchemy stores enum *names*; the API exposes the lower-case values.
+# Statuses are inlined and compared uncast so the planner can use the
+# open-incident partial index and the (tenant_id, status, ...) indexes.
+ACTIVE_MAINTENANCE_SQL = ", ".join(
+    f"'{s.name}'" for s in (MaintenanceStatus.SCHEDULED, MaintenanceStatus.IN_PROGRESS)
+)
+
+_ORGANIZATION = _object(
+    ("name", _value("o.name")),
+    ("slug", _value("o.slug")),
+    ("id", _value("o.id")),
+    *_timestamps("o", "created_at", "updated_at"),
+)
+
+_INCIDENT = _object(
+    ("id", _value("i.id")),
+    ("title", _value("i.title")),
+    ("description", _value("i.description")),
+    ("status", _value("lower(i.status::text)")),
+    *_timestamps("i", "created_at", "updated_at"),
+    (
+        "services",
+        _array(
+            _service("s"),
+            "FROM incident_services isv JOIN services s ON s.id = isv.service_id "
+            "WHERE isv.incident_id = i.id",
+            "s.id",
+        ),
+    ),
+    (
+        "updates",
+        _array(
+            _object(
+                ("text", _value("u.text")),
+                ("id", _value("u.id")),
+                ("incident_id", _value("u.incident_id")),
+                *_timestamps("u", "created_at"),
+            ),
+            "FROM incident_updates u WHERE u.incident_id = i.id",
+            "u.id",
+        ),
+    ),
+)
+
+_MAINTENANCE = _object(
+    ("id", _value("m.id")),
+    ("title", _value("m.title")),
+    ("description", _value("m.description")),
+    ("status", _value("lower(m.status::text)")),
+    *_timestamps(
+        "m",
+        "scheduled_start",
+        "scheduled_end",
+        "actual_start",
+        "actual_end",
+        "created_at",
+        "updated_at",
+    ),
+    (
+        "services",
+        _array(
+            _service("s"),
+            "FROM maintenance_services msv JOIN services s ON s.id = msv.service_id "
+            "WHERE msv.maintenance_id = m.id",
+            "s.id",
+        ),
+    ),
+)
+
+STATUS_PAGE_SQL = text(
+    "SELECT "
+    + _object(
+        (
+            "organization",
+            f"(SELECT {_ORGANIZATION} FROM organizations o WHERE o.id = :tenant_id)",
+        ),
+        (
+            "services",
+            _array(
+                _service("s"),
+                "FROM services s WHERE s.tenant_id = :tenant_id",
+                "s.id",
+            ),
+        ),
+        (
+            "active_incidents",
+            _array(
+                _INCIDENT,
+                "FROM incidents i WHERE i.tenant_id = :tenant_id "
+                f"AND i.status = '{IncidentStatus.OPEN.name}'",
+                "i.created_at DESC, i.id DESC",
+            ),
+        ),
+        (
+            "active_maintenances",
+            _array(
+                _MAINTENANCE,
+                "FROM maintenances m WHERE m.tenant_id = :tenant_id "
+                f"AND m.status IN ({ACTIVE_MAINTENANCE_SQL})",
+                "m.scheduled_start ASC, m.id ASC",
+            ),
+        ),
+    )
+)
+
+
+async def fetch_status_page_json(db: AsyncSession, tenant_id: int) -> Optional[bytes]:
+    """Return the serialized status page for a tenant, built entirely in SQL."""
+    raw = await db.scalar(STATUS_PAGE_SQL, {"tenant_id": tenant_id})
+    if raw is None:
+        return None
+    # Already compact and in schema order: no parse/re-encode round trip
+    return raw.encode()
+
+
+def supports_sql_json(db: AsyncSession) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
@@ -0,0 +1,368 @@
+import asyncio
+import base64
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import literal, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.organization import (
+    Organization,
+    Service,
+    Incident,
+    IncidentStatus,
+    Maintenance,
+    MaintenanceStatus,
+)
+from app.schemas.organization import StatusPageResponse, StatusPageBootstrapResponse
+from app.services.status_cache import STATUS_PAGE_VARIANT, status_page_cache
+from app.services.status_json_query import fetch_status_page_json, supports_sql_json
+from app.core.config import settings
+from app.core.responses import EncodedPayload
+
+ACTIVE_MAINTENANCE_STATUSES = [
+    MaintenanceStatus.SCHEDULED,
+    MaintenanceStatus.IN_PROGRESS,
+]
+
+# Inlined rather than bound: a prepared statement's generic plan can only use
+# the ix_incidents_open_tenant_created_id partial index for a literal status
+INCIDENT_IS_OPEN = Incident.status == literal(
+    IncidentStatus.OPEN, Incident.status.type, literal_execute=True
+)
+
+
+# Public loaders: each fetches its object graph in a fixed number of queries
+# (one per table) regardless of how many incidents or maintenances a tenant has.
+async def load_public_services(db: AsyncSession, tenant_id: int) -> List[Service]:
+    """Load all services for a tenant."""
+    services = await db.scalars(
+        select(Service).filter(Service.tenant_id == tenant_id).order_by(Service.id)
+    )
+    return services.all()
+
+
+async def load_public_incidents(
+    db: AsyncSession, tenant_id: int, active_only: bool = False
+) -> List[Incident]:
+    """Load incidents with their services and updates eagerly attached."""
+    query = (
+        select(Incident)
+        .options(selectinload(Incident.services), selectinload(Incident.updates))
+        .filter(Incident.tenant_id == tenant_id)
+    )
+
+    if active_only:
+        query = query.filter(INCIDENT_IS_OPEN)
+
+    incidents = await db.scalars(
+        query.order_by(Incident.created_at.desc(), Incident.id.desc())
+    )
+    return incidents.all()
+
+
+def encode_incident_cursor(incident: Incident) -> str:
+    """Opaque keyset cursor pointing just past the given incident."""
+    raw = f"{incident.created_at.isoformat()}|{incident.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_incident_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, incident_id = (
+            base64.urlsafe_b64decode(padded.encode()).decode().rsplit("|", 1)
+        )
+        return datetime.fromisoformat(created_at), int(incident_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+async def load_incident_page(
+    db: AsyncSession,
+    tenant_id: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+) -> Tuple[List[Incident], Optional[str]]:
+    """Load one page of incident history, newest first, using keyset pagination.
+
+    Pages are addressed by (created_at, id) so deep pages walk the
+    ix_incidents_tenant_created_id index instead of scanning with OFFSET.
+    Returns the incidents and the cursor for the next page, if any.
+    """
+    query = (
+        select(Incident)
+        .options(selectinload(Incident.services), selectinload(Incident.updates))
+        .filter(Incident.tenant_id == tenant_id)
+    )
+
+    if created_from is not None:
+        query = query.filter(Incident.created_at >= created_from)
+    if created_before is not None:
+        query = query.filter(Incident.created_at < created_before)
+    if cursor:
+        query = query.filter(
+            tuple_(Incident.created_at, Incident.id)
+            < tuple_(*decode_incident_cursor(cursor))
+        )
+
+    incidents = (
+        await db.scalars(
+            query.order_by(Incident.created_at.desc(), Incident.id.desc()).limit(
+                limit + 1
+            )
+        )
+    ).all()
+
+    next_cursor = None
+    if len(incidents) > limit:
+        incidents = incidents[:limit]
+        next_cursor = encode_incident_cursor(incidents[-1])
+    return incidents, next_cursor
+
+
+async def load_public_maintenances(
+    db: AsyncSession,
+    tenant_id: int,
+    active_only: bool = False,
+    newest_first: bool = True,
+) -> List[Maintenance]:
+    """Load maintenance windows with their services eagerly attached."""
+    query = (
+        select(Maintenance)
+        .options(selectinload(Maintenance.services))
+        .filter(Maintenance.tenant_id == tenant_id)
+    )
+
+    if active_only:
+        query = query.filter(Maintenance.status.in_(ACTIVE_MAINTENANCE_STATUSES))
+
+    if newest_first:
+        query = query.order_by(
+            Maintenance.scheduled_start.desc(), Maintenance.id.desc()
+        )
+    else:
+        query = query.order_by(Maintenance.scheduled_start.asc(), Maintenance.id.asc())
+    return (await db.scalars(query)).all()
+
+
+async def build_status_page(
+    db: AsyncSession, organization: Organization
+) -> StatusPageResponse:
+    """Assemble the complete public status page for an organization."""
+    return StatusPageResponse(
+        organization=organization,
+        services=await load_public_services(db, organization.id),
+        active_incidents=await load_public_incidents(
+            db, organization.id, active_only=True
+        ),
+        active_maintenances=await load_public_maintenances(
+            db, organization.id, active_only=True, newest_first=False
+        ),
+    )
+
+
+async def build_status_bootstrap(
+    db: AsyncSession,
+    organization: Organization,
+    timeline_limit: int,
+    maintenance_limit: int,
+    maintenance_horizon_days: int,
+) -> StatusPageBootstrapResponse:
+    """Assemble the status page, timeline and recent maintenance in shared queries.
+
+    Open incidents and the newest ``timeline_limit`` incidents come back from a
+    single incident query, and active plus recent maintenance windows from a
+    single maintenance query; each section is then carved out in Python.
+    """
+    services = await load_public_services(db, organization.id)
+
+    newest_incident_ids = (
+        select(Incident.id)
+        .filter(Incident.tenant_id == organization.id)
+        .order_by(Incident.created_at.desc(), Incident.id.desc())
+        .limit(timeline_limit)
+        .scalar_subquery()
+    )
+    incidents = (
+        await db.scalars(
+            select(Incident)
+            .options(selectinload(Incident.services), selectinload(Incident.updates))
+            .filter(
+                Incident.tenant_id == organization.id,
+                or_(
+                    INCIDENT_IS_OPEN,
+                    Incident.id.in_(newest_incident_ids),
+                ),
+            )
+            .order_by(Incident.created_at.desc(), Incident.id.desc())
+        )
+    ).all()
+
+    horizon = datetime.now(timezone.utc) - timedelta(days=maintenance_horizon_days)
+    maintenances = (
+        await db.scalars(
+            select(Maintenance)
+            .options(selectinload(Maintenance.services))
+            .filter(
+                Maintenance.tenant_id == organization.id,
+                or_(
+                    Maintenance.status.in_(ACTIVE_MAINTENANCE_STATUSES),
+                    Maintenance.scheduled_start >= horizon,
+                ),
+            )
+            .order_by(Maintenance.scheduled_start.desc(), Maintenance.id.desc())
+        )
+    ).all()
+
+    return StatusPageBootstrapResponse(
+        organization=organization,
+        services=services,
+        active_incidents=[i for i in incidents if i.status == IncidentStatus.OPEN],
+        active_maintenances=[
+            m for m in reversed(maintenances) if m.status in ACTIVE_MAINTENANCE_STATUSES
+        ],
+        timeline=incidents[:timeline_limit],
+        recent_maintenances=maintenances[:maintenance_limit],
+    )
+
+
+def _encode(payload: bytes) -> EncodedPayload:
+    return EncodedPayload.build(payload, compress=settings.STATUS_CACHE_COMPRESSION)
+
+
+# Cache misses being built, per (tenant, content version, variant). Requests
+# missing on the same key await the first one's payload instead of each
+# loading and serializing the page themselves.
+_pending_builds: Dict[Tuple[int, int, str], "asyncio.Future[EncodedPayload]"] = {}
+
+
+async def _build_once(
+    key: Tuple[int, int, str], build: Callable[[], Awaitable[EncodedPayload]]
+) -> EncodedPayload:
+    """Run ``build`` for a cache miss unless another request is already building ``key``."""
+    while True:
+        pending = _pending_builds.get(key)
+        if pending is None:
+            break
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            # The build failed or its request went away: the next waiter retries
+
+    future = asyncio.get_running_loop().create_future()
+    _pending_builds[key] = future
+    try:
+        payload = await build()
+    except BaseException:
+        # Errors stay with their own request; waiters retry rather than share them
+        future.cancel()
+        raise
+    finally:
+        del _pending_builds[key]
+    future.set_result(payload)
+    return payload
+
+
+async def get_status_bootstrap_payload(
+    db: AsyncSession,
+    organization: Organization,
+    timeline_limit: int,
+    maintenance_limit: int,
+    maintenance_horizon_days: int,
+) -> EncodedPayload:
+    """Get the serialized bootstrap document, cached per tenant and option set."""
+    variant = (
+        f"bootstrap:{timeline_limit}:{maintenance_limit}:{maintenance_horizon_days}"
+    )
+    options = (timeline_limit, maintenance_limit, maintenance_horizon_days)
+    if not settings.STATUS_CACHE_ENABLED:
+        bootstrap = await build_status_bootstrap(db, organization, *options)
+        return EncodedPayload(bootstrap.model_dump_json().encode())
+
+    version = organization.content_version
+    payload = status_page_cache.get(organization.id, version, variant)
+    if payload is not None:
+        return payload
+
+    async def build() -> EncodedPayload:
+        bootstrap = await build_status_bootstrap(db, organization, *options)
+        return status_page_cache.set(
+            organization.id,
+            version,
+            _encode(bootstrap.model_dump_json().encode()),
+            variant,
+        )
+
+    return await _build_once((organization.id, version, variant), build)
+
+
+async def render_status_page(db: AsyncSession, organization: Organization) -> bytes:
+    """Serialize the status page, letting Postgres build it when STATUS_PAGE_SQL_JSON is on."""
+    if settings.STATUS_PAGE_SQL_JSON and supports_sql_json(db):
+        payload = await fetch_status_page_json(db, organization.id)
+        if payload is not None:
+            return payload
+    return (await build_status_page(db, organization)).model_dump_json().encode()
+
+
+async def get_status_page_payload(
+    db: AsyncSession, organization: Organization
+) -> EncodedPayload:
+    """Get the serialized status page, served from the snapshot cache when possible."""
+    if not settings.STATUS_CACHE_ENABLED:
+        return EncodedPayload(await render_status_page(db, organization))
+
+    version = organization.content_version
+    payload = status_page_cache.get(organization.id, version)
+    if payload is not None:
+        return payload
+
+    async def build() -> EncodedPayload:
+        return status_page_cache.set(
+            organization.id,
+            version,
+            _encode(await render_status_page(db, organization)),
+        )
+
+    return await _build_once((organization.id, version, STATUS_PAGE_VARIANT), build)
+
+
+def refresh_public_status(tenant_id: int) -> None:
+    """Drop cached and republish static status pages after a committed change."""
+    from app.db.replicas import replica_router
+    from app.services.static_publisher import schedule_publish
+
+    # Read the tenant's own writes back from the primary for a while
+    replica_router.mark_write(tenant_id)
+    status_page_cache.invalidate(tenant_id)
+    schedule_publish(tenant_id)
+
+
+async def bump_content_version(db: AsyncSession, tenant_id: int) -> None:
+    """Increment a tenant's public content version inside the caller's transaction."""
+    await db.execute(
+        update(Organization)
+        .filter(Organization.id == tenant_id)
+        .values(
+            {
+                Organization.content_version: Organization.content_version + 1,
+                # Keep the organization's own updated_at untouched
+                Organization.updated_at: Organization.updated_at,
+            }
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def status_etag(organization: Organization) -> str:
+    """Strong ETag of a tenant's content; encoded variants add a suffix (see variant_etag)."""
+    return f'"{organization.id}-{organization.content_version}"'
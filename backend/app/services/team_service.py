@@ -1,5 +1,7 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 from typing import List, Optional
 from datetime import datetime, timedelta
@@ -17,21 +19,23 @@ from app.services.organization_service import (
 from app.core.config import settings
 
 
-def get_team_members(db: Session, organization_id: int) -> List[TeamMember]:
+async def get_team_members(db: AsyncSession, organization_id: int) -> List[TeamMember]:
     """Get all team members for an organization, including pending invitations."""
     # Get actual users
-    users = db.query(User).filter(User.tenant_id == organization_id).all()
+    users = (
+        await db.scalars(select(User).filter(User.tenant_id == organization_id))
+    ).all()
 
     # Get pending invitations
     pending_invitations = (
-        db.query(Invitation)
-        .filter(
-            Invitation.tenant_id == organization_id,
-            Invitation.is_accepted == False,
-            Invitation.expires_at > datetime.utcnow(),
+        await db.scalars(
+            select(Invitation).filter(
+                Invitation.tenant_id == organization_id,
+                Invitation.is_accepted == False,
+                Invitation.expires_at > datetime.utcnow(),
+            )
         )
-        .all()
-    )
+    ).all()
 
     team_members = []
 
@@ -64,19 +68,17 @@ def get_team_members(db: Session, organization_id: int) -> List[TeamMember]:
     return team_members
 
 
-def get_team_member_by_id(
-    db: Session, member_id: int, organization_id: int
+async def get_team_member_by_id(
+    db: AsyncSession, member_id: int, organization_id: int
 ) -> Optional[User]:
     """Get a specific team member by ID within an organization."""
-    return (
-        db.query(User)
-        .filter(User.id == member_id, User.tenant_id == organization_id)
-        .first()
+    return await db.scalar(
+        select(User).filter(User.id == member_id, User.tenant_id == organization_id)
     )
 
 
 async def invite_team_member(
-    db: Session,
+    db: AsyncSession,
     organization_id: int,
     invite_data: TeamMemberInvite,
     invited_by_user_id: int,
@@ -84,10 +86,10 @@ async def invite_team_member(
     """Create an invitation for a new team member."""
 
     # Check if user with this email already exists in the organization
-    existing_user = (
-        db.query(User)
-        .filter(User.email == invite_data.email, User.tenant_id == organization_id)
-        .first()
+    existing_user = await db.scalar(
+        select(User).filter(
+            User.email == invite_data.email, User.tenant_id == organization_id
+        )
     )
 
     if existing_user:
@@ -97,15 +99,15 @@ async def invite_team_member(
         )
 
     # Check if there's already a pending invitation for this email
-    existing_invitation = (
-        db.query(Invitation)
+    existing_invitation = await db.scalar(
+        select(Invitation)
         .filter(
             Invitation.email == invite_data.email,
             Invitation.tenant_id == organization_id,
             Invitation.is_accepted == False,
             Invitation.expires_at > datetime.utcnow(),
         )
-        .first()
+        .limit(1)
     )
 
     if existing_invitation:
@@ -125,8 +127,8 @@ async def invite_team_member(
         )
 
         db.add(invitation)
-        db.commit()
-        db.refresh(invitation)
+        await db.commit()
+        await db.refresh(invitation)
 
         # Send invitation "email" (console log for now)
         await send_invitation_email(invitation.email, invitation.token, organization_id)
@@ -141,22 +143,22 @@ async def invite_team_member(
         )
 
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to create team member invitation",
         )
 
 
-def update_team_member(
-    db: Session, user: User, update_data: TeamMemberUpdate
+async def update_team_member(
+    db: AsyncSession, user: User, update_data: TeamMemberUpdate
 ) -> TeamMember:
     """Update a team member's role."""
     user.role = update_data.role
 
     try:
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
 
         return TeamMember(
             id=user.id,
@@ -168,37 +170,37 @@ def update_team_member(
         )
 
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to update team member",
         )
 
 
-def remove_team_member(db: Session, user: User) -> None:
+async def remove_team_member(db: AsyncSession, user: User) -> None:
     """Remove a team member from the organization."""
     try:
-        db.delete(user)
-        db.commit()
+        await db.delete(user)
+        await db.commit()
 
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to remove team member",
         )
 
 
-def cancel_invitation(db: Session, invitation_id: int, organization_id: int) -> None:
+async def cancel_invitation(
+    db: AsyncSession, invitation_id: int, organization_id: int
+) -> None:
     """Cancel a pending invitation."""
-    invitation = (
-        db.query(Invitation)
-        .filter(
+    invitation = await db.scalar(
+        select(Invitation).filter(
             Invitation.id == invitation_id,
             Invitation.tenant_id == organization_id,
             Invitation.is_accepted == False,
         )
-        .first()
     )
 
     if not invitation:
@@ -207,43 +209,45 @@ def cancel_invitation(db: Session, invitation_id: int, organization_id: int) ->
         )
 
     try:
-        db.delete(invitation)
-        db.commit()
+        await db.delete(invitation)
+        await db.commit()
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to cancel invitation",
         )
 
 
-def get_invitation_by_token(db: Session, token: str) -> Optional[Invitation]:
-    """Get invitation by token."""
-    return (
-        db.query(Invitation)
+async def get_invitation_by_token(db: AsyncSession, token: str) -> Optional[Invitation]:
+    """Get invitation by token, with its organization loaded."""
+    return await db.scalar(
+        select(Invitation)
+        .options(selectinload(Invitation.organization))
         .filter(
             Invitation.token == token,
             Invitation.is_accepted == False,
             Invitation.expires_at > datetime.utcnow(),
         )
-        .first()
     )
 
 
-def get_invitation_by_email(db: Session, email: str) -> Optional[Invitation]:
+async def get_invitation_by_email(db: AsyncSession, email: str) -> Optional[Invitation]:
     """Get pending invitation by email."""
-    return (
-        db.query(Invitation)
+    return await db.scalar(
+        select(Invitation)
         .filter(
             Invitation.email == email,
             Invitation.is_accepted == False,
             Invitation.expires_at > datetime.utcnow(),
         )
-        .first()
+        .limit(1)
     )
 
 
-def accept_invitation(db: Session, invitation: Invitation, clerk_user_id: str) -> User:
+async def accept_invitation(
+    db: AsyncSession, invitation: Invitation, clerk_user_id: str
+) -> User:
     """Accept an invitation and create the user account."""
     try:
         # Create the user
@@ -259,22 +263,22 @@ def accept_invitation(db: Session, invitation: Invitation, clerk_user_id: str) -
         # Mark invitation as accepted
         invitation.is_accepted = True
 
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
 
         return new_user
 
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to accept invitation",
         )
 
 
-def get_user_by_clerk_id(db: Session, clerk_user_id: str) -> Optional[User]:
+async def get_user_by_clerk_id(db: AsyncSession, clerk_user_id: str) -> Optional[User]:
     """Get user by Clerk user ID."""
-    return _get_user_by_clerk_id(db, clerk_user_id)
+    return await _get_user_by_clerk_id(db, clerk_user_id)
 
 
 # TODO: Implement email sending
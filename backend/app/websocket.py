@@ -1,18 +1,102 @@
-import socketio
-from typing import Dict, Set
-import json
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set
+from app.core.config import settings
+from app.core.socketio_manager import create_client_manager, is_shared_manager
+from app.core.socketio_server import NegotiatedSerializerServer
 from app.schemas.organization import WebSocketMessage
+from app.services.event_coalescer import EventCoalescer, entity_key
+from app.services.event_log import TenantEventLog
+from app.services.event_topics import (
+    event_rooms,
+    message_rooms,
+    organization_room,
+    parse_topics,
+    subscription_rooms,
+)
 
-sio = socketio.AsyncServer(async_mode="asgi", cors_allowed_origins="*")
+logger = logging.getLogger(__name__)
 
-# Store organization subscriptions: {tenant_id: {session_id}}
-organization_subscribers: Dict[int, Set[str]] = {}
+
+def _status_update_collapse_key(event: str, message) -> Optional[tuple]:
+    """Status updates about the same entity supersede each other in send queues"""
+    if event != "status_update" or not isinstance(message, dict):
+        return None
+    if message.get("type") == "batch" or not isinstance(message.get("data"), dict):
+        return None
+    return (message.get("tenant_id"),) + entity_key(message["type"], message["data"])
+
+
+client_manager = create_client_manager(
+    settings.SOCKETIO_MESSAGE_QUEUE, channel=settings.SOCKETIO_CHANNEL
+)
+client_manager.configure_send_queues(
+    high_water=settings.SOCKETIO_SEND_HIGH_WATER,
+    max_pending=settings.SOCKETIO_SEND_QUEUE_MAX,
+    slow_consumer_seconds=settings.SOCKETIO_SLOW_CONSUMER_SECONDS,
+    collapse_key=_status_update_collapse_key,
+)
+
+# JSON by default; clients using a MessagePack parser get binary packets
+sio = NegotiatedSerializerServer(
+    async_mode="asgi",
+    cors_allowed_origins="*",
+    client_manager=client_manager,
+    msgpack_enabled=settings.SOCKETIO_MSGPACK_ENABLED,
+)
+
+# Subscriptions live in Socket.IO rooms: one per tenant, plus topic rooms for
+# clients that only follow some services or event types. Alongside them we keep
+# a reverse index {session_id: {tenant_id: rooms}} so a disconnect only touches
+# the client's own tenants, and live subscriber counts {tenant_id: count} whose
+# entries are dropped as soon as the last subscriber leaves. Both only cover
+# this worker's clients; with a message queue other workers may still have
+# subscribers, so emits always go out through the shared manager.
+session_subscriptions: Dict[str, Dict[int, Set[str]]] = {}
+organization_subscriber_counts: Dict[int, int] = {}
+# Of those, the ones following topics; tenants without any emit to one room
+topic_subscriber_counts: Dict[int, int] = {}
+
+# Recent status_update messages per tenant, for replay to reconnecting clients.
+# Only this worker's emits are logged, so with a message queue every resume
+# resyncs instead of replaying a partial history.
+tenant_event_log = TenantEventLog(
+    capacity=settings.STATUS_EVENT_LOG_SIZE,
+    max_tenants=settings.STATUS_EVENT_LOG_MAX_TENANTS,
+    replay=not is_shared_manager(client_manager),
+)
+
+
+def _parse_tenant_id(data) -> Optional[int]:
+    try:
+        tenant_id = int(data.get("tenant_id"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return tenant_id if tenant_id > 0 else None
+
+
+def _decrement(counts: Dict[int, int], tenant_id: int) -> None:
+    remaining = counts.get(tenant_id, 0) - 1
+    if remaining > 0:
+        counts[tenant_id] = remaining
+    else:
+        counts.pop(tenant_id, None)
+
+
+def _is_topic_subscription(tenant_id: int, rooms: Set[str]) -> bool:
+    return organization_room(tenant_id) not in rooms
+
+
+def _release_subscription(tenant_id: int, rooms: Set[str]) -> None:
+    _decrement(organization_subscriber_counts, tenant_id)
+    if _is_topic_subscription(tenant_id, rooms):
+        _decrement(topic_subscriber_counts, tenant_id)
 
 
 @sio.event
 async def connect(sid, environ):
     """Handle client connection"""
-    print(f"Client connected: {sid}")
+    logger.debug("Client connected: %s", sid)
     await sio.emit(
         "connected", {"message": "Connected to status page updates"}, room=sid
     )
@@ -21,35 +105,79 @@ async def connect(sid, environ):
 @sio.event
 async def disconnect(sid):
     """Handle client disconnection"""
-    print(f"Client disconnected: {sid}")
-    # Remove client from all organization subscriptions
-    for subscribers in organization_subscribers.values():
-        subscribers.discard(sid)
+    logger.debug("Client disconnected: %s", sid)
+    # Socket.IO removes the sid from its rooms; only our own indexes need care
+    for tenant_id, rooms in session_subscriptions.pop(sid, {}).items():
+        _release_subscription(tenant_id, rooms)
 
 
 @sio.event
 async def subscribe_organization(sid, data):
     """Subscribe a client to an organization's updates"""
     try:
-        tenant_id = data.get("tenant_id")
+        tenant_id = _parse_tenant_id(data)
         if not tenant_id:
             await sio.emit("error", {"message": "tenant_id is required"}, room=sid)
             return
 
-        if tenant_id not in organization_subscribers:
-            organization_subscribers[tenant_id] = set()
-        organization_subscribers[tenant_id].add(sid)
+        try:
+            service_ids, event_types = parse_topics(data)
+        except ValueError as e:
+            await sio.emit("error", {"message": str(e)}, room=sid)
+            return
+
+        # Subscribing again to the same tenant replaces the previous topics
+        rooms = subscription_rooms(tenant_id, service_ids, event_types)
+        tenants = session_subscriptions.setdefault(sid, {})
+        previous = tenants.get(tenant_id)
+        if previous is None:
+            previous = set()
+            organization_subscriber_counts[tenant_id] = (
+                organization_subscriber_counts.get(tenant_id, 0) + 1
+            )
+        for room in rooms - previous:
+            await sio.enter_room(sid, room)
+        for room in previous - rooms:
+            await sio.leave_room(sid, room)
+        tenants[tenant_id] = rooms
+        was_topic = bool(previous) and _is_topic_subscription(tenant_id, previous)
+        if _is_topic_subscription(tenant_id, rooms) and not was_topic:
+            topic_subscriber_counts[tenant_id] = (
+                topic_subscriber_counts.get(tenant_id, 0) + 1
+            )
+        elif was_topic and not _is_topic_subscription(tenant_id, rooms):
+            _decrement(topic_subscriber_counts, tenant_id)
+
+        # Resuming client: replay what it missed, or ask it to refetch
+        missed = []
+        last_seq = data.get("last_seq")
+        if isinstance(last_seq, int):
+            missed = tenant_event_log.since(
+                tenant_id, data.get("epoch"), last_seq, rooms
+            )
+        position = tenant_event_log.position(tenant_id)
+
+        if missed is None:
+            await sio.emit(
+                "resync_required", {"tenant_id": tenant_id, **position}, room=sid
+            )
+        else:
+            for message in missed:
+                await sio.emit("status_update", message, room=sid)
 
         await sio.emit(
             "subscribed",
             {
                 "message": f"Subscribed to organization {tenant_id}",
                 "tenant_id": tenant_id,
+                "service_ids": service_ids,
+                "event_types": event_types,
+                **position,
             },
             room=sid,
         )
 
-        print(f"Client {sid} subscribed to organization {tenant_id}")
+        logger.debug("Client %s subscribed to organization %s", sid, tenant_id)
     except Exception as e:
         await sio.emit("error", {"message": str(e)}, room=sid)
 
@@ -58,13 +186,19 @@ async def subscribe_organization(sid, data):
 async def unsubscribe_organization(sid, data):
     """Unsubscribe a client from an organization's updates"""
     try:
-        tenant_id = data.get("tenant_id")
+        tenant_id = _parse_tenant_id(data)
         if not tenant_id:
             await sio.emit("error", {"message": "tenant_id is required"}, room=sid)
             return
 
-        if tenant_id in organization_subscribers:
-            organization_subscribers[tenant_id].discard(sid)
+        tenants = session_subscriptions.get(sid)
+        if tenants and tenant_id in tenants:
+            rooms = tenants.pop(tenant_id)
+            for room in rooms:
+                await sio.leave_room(sid, room)
+            if not tenants:
+                del session_subscriptions[sid]
+            _release_subscription(tenant_id, rooms)
             await sio.emit(
                 "unsubscribed",
                 {
@@ -73,24 +207,91 @@ async def unsubscribe_organization(sid, data):
                 },
                 room=sid,
             )
-            print(f"Client {sid} unsubscribed from organization {tenant_id}")
+            logger.debug("Client %s unsubscribed from organization %s", sid, tenant_id)
     except Exception as e:
         await sio.emit("error", {"message": str(e)}, room=sid)
 
 
-async def emit_to_organization(tenant_id: int, event: str, data: dict):
-    """Emit an event to all clients subscribed to an organization"""
-    if tenant_id in organization_subscribers and organization_subscribers[tenant_id]:
-        message = WebSocketMessage(type=event, data=data, tenant_id=tenant_id)
+def _has_subscribers(tenant_id: int) -> bool:
+    return tenant_id in organization_subscriber_counts or is_shared_manager(sio.manager)
 
-        await sio.emit(
-            "status_update",
-            message.dict(),
-            room=list(organization_subscribers[tenant_id]),
-        )
-        print(
-            f"Emitted {event} to {len(organization_subscribers[tenant_id])} clients for tenant {tenant_id}"
-        )
+
+def _has_topic_subscribers(tenant_id: int) -> bool:
+    return tenant_id in topic_subscriber_counts or is_shared_manager(sio.manager)
+
+
+def _message(tenant_id: int, event: str, data: dict, event_id: Optional[int]):
+    message = {
+        "type": event,
+        "data": data,
+        "tenant_id": tenant_id,
+        "seq": None,
+        "epoch": None,
+        "event_id": event_id,
+    }
+    # Checked once here, before the single encode shared by every recipient.
+    # The dict itself is sent: dumping the model again would copy the payload.
+    WebSocketMessage.model_validate(message)
+    return message
+
+
+async def _send(tenant_id: int, message: dict, rooms: List[str], topics: bool):
+    # Logged with every room it is meant for, so a topic client resuming later
+    # is replayed it even if nobody followed the topic when it was sent
+    tenant_event_log.append(tenant_id, message, rooms)
+    if topics:
+        await sio.emit("status_update", message, room=rooms)
+        return
+    # Nobody follows topics here, so only the tenant room can have members
+    room = organization_room(tenant_id)
+    if room in rooms:
+        await sio.emit("status_update", message, room=room)
+
+
+async def _broadcast(
+    tenant_id: int, event: str, data: dict, event_id: Optional[int] = None
+):
+    topics = _has_topic_subscribers(tenant_id)
+    message = _message(tenant_id, event, data, event_id)
+    await _send(tenant_id, message, message_rooms(tenant_id, message), topics)
+    if event == "batch":
+        # Topic rooms only get the events they follow, each on its own
+        for item in data["events"]:
+            single = _message(tenant_id, item["type"], item["data"], item["event_id"])
+            rooms = event_rooms(tenant_id, item["type"], item["data"])
+            await _send(tenant_id, single, rooms, topics)
+
+
+async def _flush_coalesced(tenant_id: int, events: List[dict]):
+    """Send a coalesced burst; several events go out as one "batch" update"""
+    if len(events) == 1:
+        event = events[0]
+        await _broadcast(tenant_id, event["type"], event["data"], event["event_id"])
+    else:
+        await _broadcast(tenant_id, "batch", {"events": events})
+
+
+status_update_coalescer = EventCoalescer(
+    window_seconds=settings.STATUS_UPDATE_COALESCE_MS / 1000,
+    max_delay_seconds=settings.STATUS_UPDATE_MAX_DELAY_MS / 1000,
+    flush=_flush_coalesced,
+)
+
+
+async def emit_to_organization(
+    tenant_id: int, event: str, data: dict, event_id: Optional[int] = None
+) -> Optional[asyncio.Future]:
+    """Emit an event to all clients subscribed to an organization
+
+    With coalescing on, returns a future that settles once the event's batch
+    has actually been sent; otherwise the event is sent before returning.
+    """
+    if not _has_subscribers(tenant_id):
+        return None
+    if status_update_coalescer.enabled:
+        return status_update_coalescer.add(tenant_id, event, data, event_id)
+    await _broadcast(tenant_id, event, data, event_id)
+    return None
 
 
 async def emit_service_update(tenant_id: int, service_data: dict):
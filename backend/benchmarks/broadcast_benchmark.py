@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Per-event CPU cost of a status_update broadcast at different room sizes.
+
+Compares python-socketio's stock ``AsyncManager`` (one asyncio task per
+recipient) with ``BroadcastManager`` (one encoded packet pushed to every
+recipient in a loop). Recipients are real engine.io socket objects, so each
+send ends in the same per-client queue a connected browser would drain; the
+queues are emptied between rounds.
+
+    python benchmarks/broadcast_benchmark.py --sizes 1 100 10000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import socketio  # noqa: E402
+from engineio.async_socket import AsyncSocket  # noqa: E402
+
+from app.core.socketio_manager import BroadcastManager  # noqa: E402
+from app.schemas.organization import WebSocketMessage  # noqa: E402
+
+ROOM = "org:1"
+
+
+def make_event(i: int) -> dict:
+    return WebSocketMessage(
+        type="incident_update",
+        data={
+            "id": i,
+            "title": "Elevated error rates on the public API",
+            "description": "We are investigating elevated error rates. " * 3,
+            "status": "investigating",
+            "services": [{"id": s, "name": f"Service {s}"} for s in range(3)],
+            "action": "updated",
+        },
+        tenant_id=1,
+        seq=i,
+        epoch="benchmark",
+    ).model_dump()
+
+
+async def build_server(manager: socketio.AsyncManager, subscribers: int):
+    server = socketio.AsyncServer(async_mode="asgi", client_manager=manager)
+    server.manager_initialized = True
+    manager.initialize()
+    sockets = []
+    for i in range(subscribers):
+        eio_sid = f"eio-{i}"
+        sock = AsyncSocket(server.eio, eio_sid)
+        server.eio.sockets[eio_sid] = sock
+        sockets.append(sock)
+        sid = await manager.connect(eio_sid, "/")
+        await manager.enter_room(sid, "/", ROOM)
+    return server, sockets
+
+
+async def measure(manager, subscribers: int, events: int) -> float:
+    server, sockets = await build_server(manager, subscribers)
+    payloads = [make_event(i) for i in range(events)]
+
+    cpu = 0.0
+    for payload in payloads:
+        start = time.process_time()
+        await server.emit("status_update", payload, room=ROOM)
+        cpu += time.process_time() - start
+        for sock in sockets:
+            sock.queue = asyncio.Queue()
+    return cpu / events
+
+
+async def run(sizes, events: int):
+    print(f"{'subscribers':>11} {'stock manager':>15} {'broadcast':>12} {'speedup':>8}")
+    for size in sizes:
+        rounds = max(3, min(events, 200_000 // max(size, 1)))
+        stock = await measure(socketio.AsyncManager(), size, rounds)
+        fast = await measure(BroadcastManager(), size, rounds)
+        print(
+            f"{size:>11} {stock * 1e3:>12.3f} ms {fast * 1e3:>9.3f} ms "
+            f"{stock / fast:>7.1f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10000])
+    parser.add_argument("--events", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.sizes, args.events))
+
+
+if __name__ == "__main__":
+    main()
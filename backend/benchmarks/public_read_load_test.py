@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Measure public status read throughput under concurrent clients.
+
+Seeds a scratch database with tenants, services and incidents, starts
+``app.main:socket_app`` under uvicorn and keeps ``--concurrency`` clients
+busy with the public list endpoints (services, incidents, timeline and
+maintenance) for ``--duration`` seconds, reporting requests/second and
+latency percentiles. These endpoints query the database on every request,
+so they show whether database work holds up the event loop.
+
+With ``--ref`` the same load also runs against a git worktree of that
+commit on the same database, giving a before/after comparison.
+
+    python benchmarks/public_read_load_test.py --ref HEAD~1 --concurrency 100 \\
+        --database-url postgresql://localhost/status_bench
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx  # noqa: E402
+
+from benchmarks.socketio_scalability import (  # noqa: E402
+    git_commit,
+    percentiles,
+    seed_database,
+    wait_for_server,
+)
+
+PUBLIC_PATHS = (
+    "services",
+    "incidents?active_only=false",
+    "timeline",
+    "maintenance?active_only=false",
+)
+
+
+def seed_incidents(tenant_ids: List[int], per_tenant: int) -> None:
+    """Give every tenant some incident history with updates."""
+    from app.db.session import SessionLocal
+    from app.models.organization import Incident, IncidentUpdate, Service
+
+    db = SessionLocal()
+    try:
+        for tenant_id in tenant_ids:
+            services = db.query(Service).filter(Service.tenant_id == tenant_id).all()
+            for n in range(per_tenant):
+                incident = Incident(
+                    title=f"Incident {n}",
+                    description="Elevated error rates",
+                    tenant_id=tenant_id,
+                    services=services,
+                )
+                incident.updates = [
+                    IncidentUpdate(text="Investigating"),
+                    IncidentUpdate(text="Resolved"),
+                ]
+                db.add(incident)
+        db.commit()
+    finally:
+        db.close()
+
+
+def start_server(tree: Path, port: int, database_url: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:socket_app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=tree,
+        env=dict(os.environ, DATABASE_URL=database_url),
+        stdout=subprocess.DEVNULL,
+    )
+
+
+async def run_load(
+    base_url: str, slugs: List[str], concurrency: int, duration: float
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    urls = [f"/api/status/{slug}/{path}" for slug in slugs for path in PUBLIC_PATHS]
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as http:
+        # One untimed pass warms the slug cache and connection pools
+        for url in urls:
+            await http.get(url)
+
+        deadline = time.perf_counter() + duration
+
+        async def client(offset: int) -> None:
+            nonlocal errors
+            n = offset
+            while time.perf_counter() < deadline:
+                url = urls[n % len(urls)]
+                n += 1
+                start = time.perf_counter()
+                try:
+                    response = await http.get(url)
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_ms": percentiles(latencies),
+    }
+
+
+def measure(tree: Path, args, database_url: str, slugs: List[str]) -> Dict[str, Any]:
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = start_server(tree, args.port, database_url)
+    try:
+        asyncio.run(wait_for_server(base_url))
+        return asyncio.run(run_load(base_url, slugs, args.concurrency, args.duration))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenants", type=int, default=10)
+    parser.add_argument("--incidents", type=int, default=20, help="per tenant")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--ref", help="also measure this git ref, e.g. HEAD~1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument(
+        "--database-url",
+        help="defaults to a fresh SQLite file; use a scratch Postgres for real runs",
+    )
+    parser.add_argument("--output", default="public_read_load_test.json")
+    args = parser.parse_args()
+
+    scratch = None
+    database_url = args.database_url
+    if not database_url:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        database_url = f"sqlite:///{scratch.name}"
+
+    seeded = seed_database(database_url, args.tenants)
+    seed_incidents([tenant_id for tenant_id, _, _ in seeded], args.incidents)
+    slugs = [f"bench-{i}" for i in range(args.tenants)]
+
+    runs = {}
+    worktree = None
+    try:
+        if args.ref:
+            worktree = Path(tempfile.mkdtemp(prefix="status-bench-"))
+            subprocess.run(
+                ["git", "worktree", "add", "--detach", str(worktree), args.ref],
+                cwd=backend_dir,
+                check=True,
+                capture_output=True,
+            )
+            # The worktree holds the whole repository, not just the backend
+            prefix = subprocess.run(
+                ["git", "rev-parse", "--show-prefix"],
+                cwd=backend_dir,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+            runs[args.ref] = measure(worktree / prefix, args, database_url, slugs)
+        runs["current"] = measure(backend_dir, args, database_url, slugs)
+    finally:
+        if worktree is not None:
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", str(worktree)],
+                cwd=backend_dir,
+                capture_output=True,
+            )
+        if scratch is not None:
+            os.unlink(scratch.name)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "parameters": {
+            "tenants": args.tenants,
+            "incidents_per_tenant": args.incidents,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "database": database_url.split(":", 1)[0],
+        },
+        "runs": runs,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(json.dumps(runs, indent=2))
+    print(f"📄 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
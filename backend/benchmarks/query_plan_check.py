@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Fail when a hot API query stops using an index.
+
+Seeds a scratch database, calls the public status endpoints and the tenant
+admin lists in-process, and records every SELECT they send (selectinload
+follow-ups included). Each statement is then run through ``EXPLAIN`` with
+the parameters it was sent with:
+
+* PostgreSQL: ``EXPLAIN (FORMAT JSON)`` with ``enable_seqscan`` off, so a
+  ``Seq Scan`` left in the plan means no index can serve the query at all;
+* SQLite: ``EXPLAIN QUERY PLAN``, where a bare ``SCAN <table>`` is a full
+  table scan.
+
+Any sequential scan fails the check (exit code 1). With ``--baseline`` the
+plans are also compared against a previous ``--write-baseline`` run and any
+query whose plan changed is reported as a regression.
+
+    python benchmarks/query_plan_check.py --database-url postgresql://localhost/plans \\
+        --baseline query_plans.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx  # noqa: E402
+import jwt  # noqa: E402
+
+from benchmarks.public_read_load_test import seed_incidents  # noqa: E402
+from benchmarks.socketio_scalability import seed_database  # noqa: E402
+
+# (method, path) pairs; the placeholders are filled in from the seed, while
+# plans stay keyed by the template so baselines survive a different seed
+PUBLIC_REQUESTS = [
+    ("GET", "/api/status/{slug}"),
+    ("GET", "/api/status/{slug}/services"),
+    ("GET", "/api/status/{slug}/incidents"),
+    ("GET", "/api/status/{slug}/incidents?active_only=false"),
+    ("GET", "/api/status/{slug}/timeline"),
+    ("GET", "/api/status/{slug}/history?month={month}"),
+    ("GET", "/api/status/{slug}/maintenance"),
+    ("GET", "/api/status/{slug}/maintenance?active_only=false"),
+    ("GET", "/api/status/{slug}/bootstrap"),
+]
+ADMIN_REQUESTS = [
+    ("GET", "/api/services/"),
+    ("GET", "/api/incidents/"),
+    ("GET", "/api/incidents/{incident}"),
+    ("GET", "/api/maintenance/"),
+    ("GET", "/api/team/members"),
+    ("GET", "/api/organizations/current"),
+    # Loads the service's incidents and maintenances through the link tables
+    ("DELETE", "/api/services/{service}"),
+]
+
+SQLITE_TABLE_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+def seed_maintenances(tenant_ids: List[int], per_tenant: int) -> None:
+    """Give every tenant a mix of past, running and upcoming maintenance."""
+    from app.db.session import SessionLocal
+    from app.models.organization import Maintenance, MaintenanceStatus, Service
+
+    now = datetime.now(timezone.utc)
+    statuses = list(MaintenanceStatus)
+    db = SessionLocal()
+    try:
+        for tenant_id in tenant_ids:
+            services = db.query(Service).filter(Service.tenant_id == tenant_id).all()
+            for n in range(per_tenant):
+                start = now + timedelta(days=n - per_tenant // 2)
+                db.add(
+                    Maintenance(
+                        title=f"Maintenance {n}",
+                        tenant_id=tenant_id,
+                        status=statuses[n % len(statuses)],
+                        scheduled_start=start,
+                        scheduled_end=start + timedelta(hours=2),
+                        services=services,
+                    )
+                )
+        db.commit()
+    finally:
+        db.close()
+
+
+async def capture_queries(
+    requests: List[Tuple[str, str]], values: Dict[str, Any], token: str
+) -> List[Dict[str, Any]]:
+    """Call each endpoint in-process and collect the SELECTs it executes."""
+    from sqlalchemy import event
+
+    from app.db.session import async_engine
+    from app.main import app
+
+    captured: List[Dict[str, Any]] = []
+    label = {"request": None}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if not many and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append(
+                {
+                    "request": label["request"],
+                    "statement": statement,
+                    "parameters": parameters,
+                }
+            )
+
+    event.listen(
+        async_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+    )
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://plans"
+        ) as http:
+            for method, path in requests:
+                label["request"] = f"{method} {path}"
+                url = path.format(**values)
+                response = await http.request(method, url, headers=headers)
+                if response.status_code >= 400:
+                    raise RuntimeError(
+                        f"{method} {url} returned {response.status_code}: "
+                        f"{response.text[:200]}"
+                    )
+    finally:
+        event.remove(
+            async_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+        )
+    return captured
+
+
+def _postgres_nodes(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(_postgres_nodes(child))
+    return nodes
+
+
+async def explain(conn, statement: str, parameters) -> Tuple[List[str], List[str]]:
+    """The plan as a list of steps, and the tables it reads sequentially."""
+    if conn.dialect.name == "postgresql":
+        raw = (
+            await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        ).scalar()
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+        steps, scans = [], []
+        for node in _postgres_nodes(plan):
+            step = node["Node Type"]
+            if "Relation Name" in node:
+                step += f" on {node['Relation Name']}"
+            if "Index Name" in node:
+                step += f" using {node['Index Name']}"
+            steps.append(step)
+            if node["Node Type"] == "Seq Scan":
+                scans.append(node["Relation Name"])
+        return steps, scans
+
+    rows = (
+        await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    ).all()
+    steps = [row[-1] for row in rows]
+    scans = [m.group(1) for m in map(SQLITE_TABLE_SCAN.match, steps) if m]
+    return steps, scans
+
+
+async def explain_all(captured: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    from app.db.session import async_engine
+
+    plans: Dict[str, Dict[str, Any]] = {}
+    seen: Dict[str, int] = {}
+    async with async_engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+        for query in captured:
+            n = seen[query["request"]] = seen.get(query["request"], 0) + 1
+            steps, scans = await explain(conn, query["statement"], query["parameters"])
+            plans[f"{query['request']} #{n}"] = {
+                "sql": " ".join(query["statement"].split())[:200],
+                "plan": steps,
+                "seq_scans": scans,
+            }
+    await async_engine.dispose()
+    return plans
+
+
+def compare(
+    plans: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]
+) -> List[str]:
+    changed = []
+    for key, expected in baseline.items():
+        actual = plans.get(key)
+        if actual is None:
+            changed.append(f"{key}: query no longer issued")
+        elif actual["plan"] != expected["plan"]:
+            changed.append(
+                f"{key}: plan changed\n"
+                f"    was: {' | '.join(expected['plan'])}\n"
+                f"    now: {' | '.join(actual['plan'])}"
+            )
+    for key in plans.keys() - baseline.keys():
+        changed.append(f"{key}: new query ({plans[key]['sql'][:80]})")
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenants", type=int, default=3)
+    parser.add_argument("--incidents", type=int, default=50, help="per tenant")
+    parser.add_argument("--maintenances", type=int, default=20, help="per tenant")
+    parser.add_argument(
+        "--database-url",
+        help="defaults to a fresh SQLite file; must be an empty scratch database",
+    )
+    parser.add_argument("--baseline", help="fail if plans differ from this file")
+    parser.add_argument("--write-baseline", help="save the plans to this file")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    scratch = None
+    database_url = args.database_url
+    if not database_url:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        database_url = f"sqlite:///{scratch.name}"
+
+    try:
+        seeded = seed_database(database_url, args.tenants)
+        tenant_ids = [tenant_id for tenant_id, _, _ in seeded]
+        seed_incidents(tenant_ids, args.incidents)
+        seed_maintenances(tenant_ids, args.maintenances)
+
+        # Query the middle tenant so filters on tenant_id are not trivially true
+        tenant_id, service_id, clerk_user_id = seeded[len(seeded) // 2]
+        from app.db.session import SessionLocal
+        from app.models.organization import Incident, Organization
+
+        with SessionLocal() as db:
+            slug = db.get(Organization, tenant_id).slug
+            incident_id = (
+                db.query(Incident.id).filter(Incident.tenant_id == tenant_id).first()[0]
+            )
+        values = {
+            "slug": slug,
+            "month": datetime.now(timezone.utc).strftime("%Y-%m"),
+            "incident": incident_id,
+            "service": service_id,
+        }
+        token = jwt.encode({"sub": clerk_user_id}, "plans", algorithm="HS256")
+
+        async def run() -> Dict[str, Dict[str, Any]]:
+            captured = await capture_queries(
+                PUBLIC_REQUESTS + ADMIN_REQUESTS, values, token
+            )
+            return await explain_all(captured)
+
+        plans = asyncio.run(run())
+    finally:
+        if scratch is not None:
+            os.unlink(scratch.name)
+
+    failures = []
+    for key, entry in plans.items():
+        if entry["seq_scans"]:
+            failures.append(
+                f"{key}: sequential scan of {', '.join(entry['seq_scans'])}\n"
+                f"    {entry['sql']}"
+            )
+        print(f"{key}\n    {' | '.join(entry['plan'])}")
+
+    regressions: List[str] = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(plans, baseline["plans"])
+
+    if args.write_baseline:
+        report = {
+            "database": database_url.split(":", 1)[0],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "plans": plans,
+        }
+        Path(args.write_baseline).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"📄 Plans written to {args.write_baseline}")
+
+    print(f"\n🔎 {len(plans)} queries explained")
+    for failure in failures:
+        print(f"❌ {failure}")
+    for regression in regressions:
+        print(f"⚠️ {regression}")
+    if failures or regressions:
+        sys.exit(1)
+    print("✅ Every query is served by an index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Check that public reads fall back to the primary when a replica is down.
+
+Points ``READ_REPLICA_URLS`` at a port nothing listens on, marks that
+replica healthy (as if it died between two health checks) and calls every
+public status endpoint in-process. Each must still answer 200 from the
+primary, and the replica must be taken out of rotation after the first
+failed read. Exits 1 otherwise.
+
+    python benchmarks/replica_fallback_check.py --replica-url postgresql://127.0.0.1:1/x
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx  # noqa: E402
+
+PUBLIC_PATHS = [
+    "/api/status/{slug}",
+    "/api/status/{slug}/services",
+    "/api/status/{slug}/incidents",
+    "/api/status/{slug}/timeline",
+    "/api/status/{slug}/maintenance",
+    "/api/status/{slug}/bootstrap",
+]
+
+
+async def call_public_endpoints(slug: str) -> int:
+    from app.db.replicas import replica_router
+    from app.main import app
+
+    replica = replica_router.replicas[0]
+    failures = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://check") as http:
+        for path in PUBLIC_PATHS:
+            # Healthy as far as the router knows: the next read tries it first
+            replica.healthy = True
+            url = path.format(slug=slug)
+            response = await http.get(url)
+            ok = response.status_code == 200 and not replica.healthy
+            failures += not ok
+            print(
+                f"{'✅' if ok else '❌'} GET {url}: {response.status_code}, "
+                f"replica {'still healthy' if replica.healthy else 'marked down'}"
+                f" ({replica.last_error})"
+            )
+    await replica_router.stop()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replica-url", default="postgresql://127.0.0.1:1/replica")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    os.environ["READ_REPLICA_URLS"] = args.replica_url
+    try:
+        from benchmarks.socketio_scalability import seed_database
+
+        seed_database(f"sqlite:///{scratch.name}", 1)
+        from app.db.session import async_engine
+
+        async def run() -> int:
+            try:
+                return await call_public_endpoints("bench-0")
+            finally:
+                await async_engine.dispose()
+
+        failures = asyncio.run(run())
+    finally:
+        os.unlink(scratch.name)
+
+    if failures:
+        sys.exit(1)
+    print("✅ Every read fell back to the primary")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Compare FastAPI's default response_model path with the serialize-once path.
+
+Builds synthetic ORM-like incidents (no database needed) and times both ways
+of turning them into response bytes.
+
+    python benchmarks/serialization_benchmark.py --incidents 200 --rounds 50
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import serialize_json
+from app.models.organization import IncidentStatus, ServiceStatus
+from app.schemas.organization import PublicIncident
+
+
+def make_incidents(count: int, services_per_incident: int, updates_per_incident: int):
+    now = datetime.now(timezone.utc)
+    services = [
+        SimpleNamespace(
+            id=i,
+            name=f"Service {i}",
+            description="Customer facing API",
+            status=ServiceStatus.DEGRADED,
+        )
+        for i in range(services_per_incident)
+    ]
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"Elevated error rates #{i}",
+            description="We are investigating elevated error rates. " * 5,
+            status=IncidentStatus.OPEN,
+            created_at=now,
+            updated_at=now,
+            services=services,
+            updates=[
+                SimpleNamespace(
+                    id=i * 100 + u,
+                    incident_id=i,
+                    text="Mitigation is rolling out to all regions. " * 3,
+                    created_at=now,
+                )
+                for u in range(updates_per_incident)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+async def default_path(field, incidents) -> bytes:
+    content = await serialize_response(field=field, response_content=incidents)
+    return JSONResponse(content).body
+
+
+def fast_path(incidents) -> bytes:
+    return serialize_json(incidents, List[PublicIncident])
+
+
+def time_it(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--incidents", type=int, default=200)
+    parser.add_argument("--services", type=int, default=3)
+    parser.add_argument("--updates", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    incidents = make_incidents(args.incidents, args.services, args.updates)
+    field = create_model_field(
+        name="Response", type_=List[PublicIncident], mode="serialization"
+    )
+    loop = asyncio.new_event_loop()
+
+    # Warm up adapters and check both paths agree on content
+    import json
+
+    assert json.loads(
+        loop.run_until_complete(default_path(field, incidents))
+    ) == json.loads(fast_path(incidents))
+
+    default_ms = time_it(
+        lambda: loop.run_until_complete(default_path(field, incidents)), args.rounds
+    )
+    fast_ms = time_it(lambda: fast_path(incidents), args.rounds)
+
+    print(f"incidents={args.incidents} rounds={args.rounds}")
+    print(f"default response_model path: {default_ms:8.2f} ms/response")
+    print(f"serialize-once path:         {fast_ms:8.2f} ms/response")
+    print(f"speedup:                     {default_ms / fast_ms:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Check that status updates fan out to subscribers on every worker.
+
+Loads ``app.websocket`` once per simulated worker, each copy with its own
+``AsyncServer`` and client manager, all joined through the same message queue
+(the in-process ``local://`` broker by default, or Redis/AMQP when a URL is
+given). Synthetic sessions subscribe to tenants on every worker through the
+real handlers; one worker then emits per tenant and the script verifies that
+every subscriber on every worker got exactly one packet, and nobody else did.
+
+    python benchmarks/socketio_multiworker_check.py --workers 4
+    python benchmarks/socketio_multiworker_check.py --queue redis://localhost:6379/0
+
+Passing ``--queue ""`` runs the in-process manager, where only worker 0's own
+subscribers are reached.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+
+def load_worker(index: int, queue: str):
+    """Import a fresh copy of app.websocket, as a separate worker process would."""
+    os.environ["SOCKETIO_MESSAGE_QUEUE"] = queue
+    import app.core.config as config
+
+    config.settings = config.Settings()
+    spec = importlib.util.spec_from_file_location(
+        f"websocket_worker_{index}", backend_dir / "app" / "websocket.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def run(workers: int, tenants: int, clients_per_worker: int, queue: str) -> bool:
+    deliveries = Counter()
+    modules = [load_worker(i, queue) for i in range(workers)]
+
+    for index, module in enumerate(modules):
+
+        async def record(eio_sid, eio_pkt, index=index):
+            if "status_update" in str(eio_pkt.data):
+                deliveries[(index, eio_sid)] += 1
+
+        module.sio._send_eio_packet = record
+        # Normally done on the first engine.io connection
+        module.sio.manager_initialized = True
+        module.sio.manager.initialize()
+    await asyncio.sleep(0.1)  # let every listener subscribe to the queue
+
+    expected = Counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for index, module in enumerate(modules):
+            for client in range(clients_per_worker):
+                eio_sid = f"w{index}-c{client}"
+                sid = await module.sio.manager.connect(eio_sid, "/")
+                tenant_id = client % (tenants + 1)  # tenant 0 never emits
+                if tenant_id:
+                    await module.subscribe_organization(sid, {"tenant_id": tenant_id})
+                    expected[(index, eio_sid)] = 1
+
+        # Writes all land on worker 0, like a request routed to one process
+        for tenant_id in range(1, tenants + 1):
+            await modules[0].emit_service_update(tenant_id, {"id": tenant_id})
+
+    for _ in range(100):
+        if deliveries == expected:
+            break
+        await asyncio.sleep(0.05)
+
+    missing = sum((expected - deliveries).values())
+    unexpected = sum((deliveries - expected).values())
+    for index in range(workers):
+        received = sum(n for (w, _), n in deliveries.items() if w == index)
+        wanted = sum(n for (w, _), n in expected.items() if w == index)
+        print(f"worker {index}: {received}/{wanted} updates delivered")
+    print(f"missing: {missing}, unexpected: {unexpected}")
+
+    for module in modules:
+        listener = getattr(module.sio.manager, "thread", None)
+        if listener is not None:
+            listener.cancel()
+    return missing == 0 and unexpected == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--tenants", type=int, default=20)
+    parser.add_argument("--clients-per-worker", type=int, default=200)
+    parser.add_argument("--queue", default="local://multiworker-check")
+    args = parser.parse_args()
+
+    ok = asyncio.run(
+        run(args.workers, args.tenants, args.clients_per_worker, args.queue)
+    )
+    print("✅ Fan-out reached every worker" if ok else "❌ Fan-out check failed")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""Find where real-time fan-out tops out.
+
+Starts ``app.main:socket_app`` under uvicorn in a subprocess, connects N
+python-socketio clients spread over M tenants, drives service updates through
+the REST API and measures:
+
+* fan-out latency (REST request sent -> status_update received) percentiles
+* REST mutation latency percentiles
+* server RSS and CPU time (from /proc, so Linux only)
+* server event-loop lag, probed by timing ``GET /`` during the run
+* this process's own loop lag, to tell when the clients are the bottleneck
+
+Results are written as JSON (with the git commit) so runs can be compared.
+The client side needs aiohttp (``pip install "python-socketio[asyncio_client]"``).
+
+    python benchmarks/socketio_scalability.py --clients 20000 --tenants 2000 \\
+        --mutations 200 --rate 20 --output results/fanout-20k.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx  # noqa: E402
+import jwt  # noqa: E402
+import socketio  # noqa: E402
+
+
+def percentiles(samples: List[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"count": 0, "p50": None, "p90": None, "p99": None, "max": None}
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": round(ordered[-1] * 1000, 3),
+    }
+
+
+def seed_database(database_url: str, tenants: int) -> List[Tuple[int, int, str]]:
+    """Create one organization, admin and service per tenant; returns (tenant, service, user)."""
+    os.environ["DATABASE_URL"] = database_url
+    from app.db.session import SessionLocal, engine
+    from app.models.base import Base
+    from app.models.organization import Organization, Service, User, UserRole
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        seeded = []
+        for i in range(tenants):
+            organization = Organization(name=f"Bench {i}", slug=f"bench-{i}")
+            db.add(organization)
+            db.flush()
+            user = User(
+                clerk_user_id=f"bench-user-{i}",
+                email=f"bench-{i}@example.com",
+                tenant_id=organization.id,
+                role=UserRole.ADMIN,
+            )
+            service = Service(name="API", tenant_id=organization.id)
+            db.add_all([user, service])
+            db.flush()
+            seeded.append((organization.id, service.id, user.clerk_user_id))
+        db.commit()
+        return seeded
+    finally:
+        db.close()
+
+
+def read_process_stats(pid: int) -> Dict[str, float]:
+    """RSS (MiB) and total CPU seconds of a process, from /proc."""
+    with open(f"/proc/{pid}/status") as status:
+        rss_kb = next(
+            int(line.split()[1]) for line in status if line.startswith("VmRSS:")
+        )
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    ticks = os.sysconf("SC_CLK_TCK")
+    cpu_seconds = (int(fields[11]) + int(fields[12])) / ticks
+    return {"rss_mb": round(rss_kb / 1024, 1), "cpu_seconds": cpu_seconds}
+
+
+class Harness:
+    def __init__(self, args, base_url: str, server_pid: int):
+        self.args = args
+        self.base_url = base_url
+        self.server_pid = server_pid
+        self.clients: List[socketio.AsyncClient] = []
+        self.sent_at: Dict[str, float] = {}
+        self.subscribers: Dict[int, int] = {}
+        self.fanout: List[float] = []
+        self.received = 0
+        self.mutation_latency: List[float] = []
+        self.server_lag: List[float] = []
+        self.client_lag: List[float] = []
+        self.rss_samples: List[float] = []
+        self.connect_failures = 0
+
+    def on_status_update(self, message):
+        now = time.perf_counter()
+        marker = (message.get("data") or {}).get("description")
+        sent = self.sent_at.get(marker)
+        if sent is not None:
+            self.received += 1
+            self.fanout.append(now - sent)
+
+    async def connect_client(self, tenant_id: int, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            client = socketio.AsyncClient(reconnection=False)
+            subscribed = asyncio.Event()
+            client.on("status_update", self.on_status_update)
+            client.on("subscribed", lambda data: subscribed.set())
+            try:
+                await client.connect(self.base_url, transports=["websocket"])
+                await client.emit("subscribe_organization", {"tenant_id": tenant_id})
+                await asyncio.wait_for(subscribed.wait(), timeout=30)
+            except Exception:
+                self.connect_failures += 1
+                return
+            self.clients.append(client)
+            self.subscribers[tenant_id] = self.subscribers.get(tenant_id, 0) + 1
+
+    async def probe(self, stop: asyncio.Event):
+        """Sample server loop lag (GET / latency), our own loop lag and server RSS."""
+        loop = asyncio.get_running_loop()
+        async with httpx.AsyncClient(base_url=self.base_url) as http:
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    await http.get("/")
+                    self.server_lag.append(time.perf_counter() - start)
+                except httpx.HTTPError:
+                    pass
+                self.rss_samples.append(read_process_stats(self.server_pid)["rss_mb"])
+
+                expected = loop.time() + 0.1
+                await asyncio.sleep(0.1)
+                self.client_lag.append(max(0.0, loop.time() - expected))
+
+    async def mutate(self, seeded: List[Tuple[int, int, str]]):
+        interval = 1.0 / self.args.rate
+        tasks = []
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=60) as http:
+            for n in range(self.args.mutations):
+                tenant_id, service_id, clerk_user_id = seeded[n % len(seeded)]
+                token = jwt.encode({"sub": clerk_user_id}, "bench", algorithm="HS256")
+                tasks.append(
+                    asyncio.ensure_future(
+                        self.update_service(http, token, service_id, f"bench-{n}")
+                    )
+                )
+                await asyncio.sleep(interval)
+            await asyncio.gather(*tasks)
+
+    async def update_service(self, http, token: str, service_id: int, marker: str):
+        self.sent_at[marker] = time.perf_counter()
+        response = await http.put(
+            f"/api/services/{service_id}",
+            json={"description": marker},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        self.mutation_latency.append(time.perf_counter() - self.sent_at[marker])
+        response.raise_for_status()
+
+    def expected_deliveries(self, seeded) -> int:
+        return sum(
+            self.subscribers.get(seeded[n % len(seeded)][0], 0)
+            for n in range(self.args.mutations)
+        )
+
+    async def run(self, seeded) -> dict:
+        tenants = [tenant_id for tenant_id, _, _ in seeded]
+        semaphore = asyncio.Semaphore(self.args.connect_concurrency)
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                self.connect_client(tenants[i % len(tenants)], semaphore)
+                for i in range(self.args.clients)
+            )
+        )
+        connect_seconds = time.perf_counter() - start
+        idle = read_process_stats(self.server_pid)
+
+        stop = asyncio.Event()
+        prober = asyncio.ensure_future(self.probe(stop))
+        cpu_before = read_process_stats(self.server_pid)["cpu_seconds"]
+        start = time.perf_counter()
+        await self.mutate(seeded)
+
+        expected = self.expected_deliveries(seeded)
+        deadline = time.perf_counter() + self.args.drain_timeout
+        while self.received < expected and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        cpu_used = read_process_stats(self.server_pid)["cpu_seconds"] - cpu_before
+        stop.set()
+        await prober
+
+        await asyncio.gather(
+            *(client.disconnect() for client in self.clients), return_exceptions=True
+        )
+
+        return {
+            "connections": {
+                "requested": self.args.clients,
+                "connected": len(self.clients),
+                "failed": self.connect_failures,
+                "seconds": round(connect_seconds, 2),
+            },
+            "deliveries": {
+                "expected": expected,
+                "received": self.received,
+                "missing": max(0, expected - self.received),
+                "per_second": round(self.received / elapsed, 1) if elapsed else None,
+            },
+            "fanout_latency_ms": percentiles(self.fanout),
+            "mutation_latency_ms": percentiles(self.mutation_latency),
+            "server": {
+                "idle_rss_mb": idle["rss_mb"],
+                "peak_rss_mb": max(self.rss_samples, default=idle["rss_mb"]),
+                "cpu_seconds": round(cpu_used, 3),
+                "cpu_percent": round(100 * cpu_used / elapsed, 1) if elapsed else None,
+                "loop_lag_probe_ms": percentiles(self.server_lag),
+            },
+            "client_loop_lag_ms": percentiles(self.client_lag),
+        }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=backend_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def start_server(args, database_url: str) -> subprocess.Popen:
+    env = dict(os.environ, DATABASE_URL=database_url)
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:socket_app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(args.port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=backend_dir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+async def wait_for_server(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as http:
+        while time.perf_counter() < deadline:
+            try:
+                if (await http.get("/")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not start within {timeout}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--tenants", type=int, default=100)
+    parser.add_argument("--mutations", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=20.0, help="mutations/second")
+    parser.add_argument("--connect-concurrency", type=int, default=200)
+    parser.add_argument("--drain-timeout", type=float, default=30.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--database-url",
+        help="defaults to a fresh SQLite file; use a scratch Postgres for real runs",
+    )
+    parser.add_argument("--output", default="socketio_scalability.json")
+    args = parser.parse_args()
+
+    scratch = None
+    database_url = args.database_url
+    if not database_url:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        database_url = f"sqlite:///{scratch.name}"
+
+    seeded = seed_database(database_url, args.tenants)
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = start_server(args, database_url)
+    try:
+        asyncio.run(wait_for_server(base_url))
+        harness = Harness(args, base_url, server.pid)
+        results = asyncio.run(harness.run(seeded))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+        if scratch is not None:
+            os.unlink(scratch.name)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "parameters": {
+            "clients": args.clients,
+            "tenants": args.tenants,
+            "mutations": args.mutations,
+            "rate": args.rate,
+            "database": database_url.split(":", 1)[0],
+        },
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(json.dumps(report["results"], indent=2))
+    print(f"📄 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
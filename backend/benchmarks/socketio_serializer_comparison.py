@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Wire size and encode time of status_update packets: JSON vs MessagePack.
+
+Builds the same ``incident_update`` messages the routes queue (full
+description text plus the affected services) and encodes them the way the
+Socket.IO server does for each kind of client. Sizes are for one packet, as
+sent to every subscriber of the tenant.
+
+    python benchmarks/socketio_serializer_comparison.py --services 1 5 20 --rounds 2000
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from socketio import packet  # noqa: E402
+from socketio.msgpack_packet import MsgPackPacket  # noqa: E402
+
+from app.core.socketio_server import to_msgpack_packet  # noqa: E402
+from app.schemas.organization import WebSocketMessage  # noqa: E402
+
+
+def make_message(services: int, description_repeat: int) -> dict:
+    return WebSocketMessage(
+        type="incident_update",
+        data={
+            "id": 4821,
+            "title": "Elevated error rates on the public API",
+            "description": (
+                "We are investigating elevated error rates affecting a subset of "
+                "requests in the EU region. "
+            )
+            * description_repeat,
+            "status": "investigating",
+            "services": [
+                {"id": 1000 + s, "name": f"Payments API ({s})"} for s in range(services)
+            ],
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "action": "updated",
+        },
+        tenant_id=37,
+        seq=1532,
+        epoch="5f0c2d9e41ab",
+    ).model_dump()
+
+
+def time_encode(make_packet, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        make_packet().encode()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--services", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--description-repeat", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(
+        f"{'services':>8} {'json bytes':>10} {'msgpack bytes':>13} {'saved':>6} "
+        f"{'json encode':>12} {'msgpack encode':>15}"
+    )
+    for services in args.services:
+        message = make_message(services, args.description_repeat)
+
+        def json_packet():
+            return packet.Packet(
+                packet.EVENT, namespace="/", data=["status_update", message]
+            )
+
+        def msgpack_packet():
+            return MsgPackPacket(
+                packet.EVENT, namespace="/", data=["status_update", message]
+            )
+
+        json_size = len(json_packet().encode().encode("utf-8"))
+        msgpack_size = len(to_msgpack_packet(json_packet()).encode())
+        json_time = time_encode(json_packet, args.rounds)
+        msgpack_time = time_encode(msgpack_packet, args.rounds)
+        print(
+            f"{services:>8} {json_size:>10} {msgpack_size:>13} "
+            f"{1 - msgpack_size / json_size:>6.0%} "
+            f"{json_time * 1e6:>9.1f} us {msgpack_time * 1e6:>12.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
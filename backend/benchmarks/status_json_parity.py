@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Check that the Postgres JSON status page matches the ORM path byte for byte.
+
+Runs both renderers for every organization in DATABASE_URL, once per session
+``TimeZone`` (UTC and a half-hour offset by default, so timestamps rendered in
+SQL cannot follow the server's zone), reports any mismatch (exit code 1) and
+the average time of each path.
+
+    python benchmarks/status_json_parity.py --rounds 20 --time-zone Asia/Kolkata
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import select, text
+
+from app.db.session import AsyncSessionLocal, async_engine
+from app.models.organization import Organization
+from app.services.status_json_query import fetch_status_page_json, supports_sql_json
+from app.services.status_page_service import build_status_page
+
+
+async def orm_payload(db, organization) -> bytes:
+    return (await build_status_page(db, organization)).model_dump_json().encode()
+
+
+async def sql_payload(db, organization) -> bytes:
+    return await fetch_status_page_json(db, organization.id)
+
+
+async def average_ms(fn, db, organization, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await fn(db, organization)
+        db.expunge_all()  # Do not let the identity map flatter the ORM path
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+async def compare(rounds: int, time_zone: str) -> int:
+    async with AsyncSessionLocal() as db:
+        if not supports_sql_json(db):
+            print("The JSON aggregation mode requires PostgreSQL")
+            sys.exit(2)
+
+        # Local to this session's transaction, so the pool is left untouched
+        await db.execute(
+            text("SELECT set_config('TimeZone', :zone, true)"), {"zone": time_zone}
+        )
+        print(f"TimeZone {time_zone}")
+        mismatches = 0
+        organizations = await db.scalars(select(Organization).order_by(Organization.id))
+        for organization in organizations.all():
+            expected = await orm_payload(db, organization)
+            actual = await sql_payload(db, organization)
+            if expected != actual:
+                mismatches += 1
+                print(f"MISMATCH {organization.slug}")
+                print(f"  orm: {expected[:300]!r}")
+                print(f"  sql: {actual[:300]!r}")
+                continue
+
+            orm_ms = await average_ms(orm_payload, db, organization, rounds)
+            sql_ms = await average_ms(sql_payload, db, organization, rounds)
+            print(
+                f"ok {organization.slug:<30} {len(expected):>8} bytes  "
+                f"orm {orm_ms:7.2f} ms  sql {sql_ms:7.2f} ms"
+            )
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument(
+        "--time-zone",
+        action="append",
+        dest="time_zones",
+        help="session TimeZone to compare under (repeatable)",
+    )
+    args = parser.parse_args()
+    time_zones = args.time_zones or ["UTC", "America/St_Johns"]
+
+    async def run() -> int:
+        try:
+            mismatches = 0
+            for time_zone in time_zones:
+                mismatches += await compare(args.rounds, time_zone)
+            return mismatches
+        finally:
+            await async_engine.dispose()
+
+    mismatches = asyncio.run(run())
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
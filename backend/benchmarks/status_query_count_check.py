@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Check that public status loaders issue the same number of queries at any size.
+
+Seeds two tenants in a scratch database, one with ``--size`` services,
+incidents and maintenance windows and one with ten times as many (every
+incident carrying updates and linked services), then runs each public
+loader for both tenants while counting statements with
+``app.db.query_metrics.track_queries``. Any loader whose statement count
+grows with the data has an N+1 and fails the check (exit code 1).
+
+Keep ``--size`` * 10 below 500: selectinload batches its IN lookups in
+chunks of 500 parent rows, so larger tenants legitimately add queries.
+
+    python benchmarks/status_query_count_check.py --size 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+
+def seed_tenant(slug: str, size: int) -> int:
+    """Create one tenant with ``size`` services, incidents and maintenances."""
+    from app.db.session import SessionLocal
+    from app.models.organization import (
+        Incident,
+        IncidentStatus,
+        IncidentUpdate,
+        Maintenance,
+        MaintenanceStatus,
+        Organization,
+        Service,
+    )
+
+    now = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        organization = Organization(name=slug, slug=slug)
+        db.add(organization)
+        db.flush()
+        services = [
+            Service(name=f"Service {n}", tenant_id=organization.id) for n in range(size)
+        ]
+        db.add_all(services)
+        for n in range(size):
+            linked = [services[(n + k) % size] for k in range(3)]
+            incident = Incident(
+                title=f"Incident {n}",
+                tenant_id=organization.id,
+                # Half stay open so the active-only loaders have work too
+                status=IncidentStatus.OPEN if n % 2 else IncidentStatus.RESOLVED,
+                services=linked,
+            )
+            incident.updates = [
+                IncidentUpdate(text="Investigating"),
+                IncidentUpdate(text="Monitoring"),
+            ]
+            start = now + timedelta(hours=n - size // 2)
+            maintenance = Maintenance(
+                title=f"Maintenance {n}",
+                tenant_id=organization.id,
+                status=list(MaintenanceStatus)[n % len(MaintenanceStatus)],
+                scheduled_start=start,
+                scheduled_end=start + timedelta(hours=1),
+                services=linked,
+            )
+            db.add_all([incident, maintenance])
+        db.commit()
+        return organization.id
+    finally:
+        db.close()
+
+
+async def count_queries(tenant_id: int) -> Dict[str, Tuple[int, int]]:
+    """Statements issued and rows returned by each loader for one tenant."""
+    from app.db.query_metrics import track_queries
+    from app.db.session import AsyncSessionLocal
+    from app.models.organization import Organization
+    from app.services import status_page_service as loaders
+
+    loads = {
+        "services": lambda db, org: loaders.load_public_services(db, org.id),
+        "active incidents": lambda db, org: loaders.load_public_incidents(
+            db, org.id, active_only=True
+        ),
+        "all incidents": lambda db, org: loaders.load_public_incidents(db, org.id),
+        "timeline page": lambda db, org: loaders.load_incident_page(
+            db, org.id, limit=100
+        ),
+        "active maintenance": lambda db, org: loaders.load_public_maintenances(
+            db, org.id, active_only=True
+        ),
+        "all maintenance": lambda db, org: loaders.load_public_maintenances(db, org.id),
+        "status page": loaders.build_status_page,
+        "bootstrap": lambda db, org: loaders.build_status_bootstrap(
+            db, org, 100, 100, 365
+        ),
+    }
+
+    counts = {}
+    for name, load in loads.items():
+        # A fresh session each time so nothing is served from the identity map
+        async with AsyncSessionLocal() as db:
+            organization = await db.get(Organization, tenant_id)
+            with track_queries() as queries:
+                result = await load(db, organization)
+        if isinstance(result, tuple):
+            result = result[0]
+        rows = len(result) if isinstance(result, list) else 1
+        counts[name] = (queries.count, rows)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=20)
+    args = parser.parse_args()
+
+    scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    os.environ["DATABASE_URL"] = f"sqlite:///{scratch.name}"
+    try:
+        from app.db.session import async_engine, engine
+        from app.models import organization  # noqa: F401  (registers the tables)
+        from app.models.base import Base
+
+        Base.metadata.create_all(bind=engine)
+        small = seed_tenant("small", args.size)
+        large = seed_tenant("large", args.size * 10)
+
+        async def run():
+            try:
+                return await count_queries(small), await count_queries(large)
+            finally:
+                await async_engine.dispose()
+
+        small_counts, large_counts = asyncio.run(run())
+    finally:
+        os.unlink(scratch.name)
+
+    failures = 0
+    for name, (queries, rows) in small_counts.items():
+        large_queries, large_rows = large_counts[name]
+        ok = queries == large_queries
+        failures += not ok
+        print(
+            f"{'✅' if ok else '❌'} {name}: {queries} queries for {rows} rows, "
+            f"{large_queries} queries for {large_rows} rows"
+        )
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Check that concurrent misses on a cached status document build it only once.
+
+Seeds one tenant in a scratch SQLite database, then for each cached public
+endpoint empties the snapshot cache and fires ``--requests`` concurrent GETs
+in-process. Every response must be a 200 with the same body, and the cache
+must record a single rebuild per endpoint. Exits 1 otherwise.
+
+    python benchmarks/status_single_flight_check.py --requests 50
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx  # noqa: E402
+
+CACHED_PATHS = [
+    "/api/status/{slug}",
+    "/api/status/{slug}/bootstrap",
+]
+
+
+async def stampede(slug: str, requests: int) -> int:
+    from app.main import app
+    from app.services.status_cache import status_page_cache
+
+    failures = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://check") as http:
+        for path in CACHED_PATHS:
+            url = path.format(slug=slug)
+            status_page_cache.clear()
+            before = status_page_cache.rebuilds
+            responses = await asyncio.gather(*(http.get(url) for _ in range(requests)))
+            rebuilds = status_page_cache.rebuilds - before
+            statuses = {response.status_code for response in responses}
+            bodies = {response.content for response in responses}
+            ok = statuses == {200} and len(bodies) == 1 and rebuilds == 1
+            failures += not ok
+            print(
+                f"{'✅' if ok else '❌'} {requests} x GET {url}: "
+                f"statuses {sorted(statuses)}, {len(bodies)} distinct bodies, "
+                f"{rebuilds} rebuilds"
+            )
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    os.environ["STATUS_CACHE_ENABLED"] = "true"
+    try:
+        from benchmarks.socketio_scalability import seed_database
+
+        seed_database(f"sqlite:///{scratch.name}", 1)
+        from app.db.session import async_engine
+
+        async def run() -> int:
+            try:
+                return await stampede("bench-0", args.requests)
+            finally:
+                await async_engine.dispose()
+
+        failures = asyncio.run(run())
+    finally:
+        os.unlink(scratch.name)
+
+    if failures:
+        sys.exit(1)
+    print("✅ Each cache miss was built once")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Measure subscription bookkeeping cost in ``app.websocket`` at scale.
+
+Registers synthetic Socket.IO sessions (no network), subscribes them evenly
+across tenants through the real event handlers, then times:
+
+* ``emit_to_organization`` for one tenant (fan-out is a single room emit)
+* ``disconnect`` for a sample of sessions (touches only the sid's tenants)
+
+and finally reports how many tenant entries survive once every client is gone.
+
+The same operations are timed against the previous layout, a global
+``{tenant_id: {sid}}`` dict that was scanned on every disconnect and copied
+into a list on every emit, for comparison.
+
+    python benchmarks/websocket_rooms_benchmark.py --connections 50000 --tenants 5000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app import websocket  # noqa: E402
+from app.websocket import sio  # noqa: E402
+
+delivered = 0
+
+
+async def _count_packet(eio_sid, eio_pkt):
+    """Stand-in for the engine.io transport: count packets instead of sending."""
+    global delivered
+    delivered += 1
+
+
+async def setup_rooms(connections: int, tenants: int) -> List[str]:
+    sids = []
+    for i in range(connections):
+        sid = await sio.manager.connect(f"eio-{i}", "/")
+        await websocket.subscribe_organization(sid, {"tenant_id": i % tenants + 1})
+        sids.append(sid)
+    return sids
+
+
+def setup_legacy(sids: List[str], tenants: int) -> Dict[int, Set[str]]:
+    subscribers: Dict[int, Set[str]] = {}
+    for i, sid in enumerate(sids):
+        subscribers.setdefault(i % tenants + 1, set()).add(sid)
+    return subscribers
+
+
+async def time_async(operation, repeat: int) -> float:
+    start = time.perf_counter()
+    for i in range(repeat):
+        await operation(i)
+    return (time.perf_counter() - start) / repeat
+
+
+async def run(connections: int, tenants: int, emits: int, disconnects: int):
+    global delivered
+    sio._send_eio_packet = _count_packet
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        sids = await setup_rooms(connections, tenants)
+        subscribe_seconds = time.perf_counter() - start
+    legacy = setup_legacy(sids, tenants)
+    per_tenant = connections // tenants
+
+    async def rooms_emit(i):
+        await websocket.emit_to_organization(i % tenants + 1, "service_update", {})
+
+    async def legacy_emit(i):
+        # Previous fan-out: copy the subscriber set into a list of rooms
+        tenant_id = i % tenants + 1
+        message = {"type": "service_update", "data": {}, "tenant_id": tenant_id}
+        await sio.emit("status_update", message, room=list(legacy[tenant_id]))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        delivered = 0
+        rooms_emit_seconds = await time_async(rooms_emit, emits)
+        rooms_delivered = delivered
+        delivered = 0
+        legacy_emit_seconds = await time_async(legacy_emit, emits)
+        legacy_delivered = delivered
+
+    sample = sids[:disconnects]
+
+    def legacy_disconnect(sid):
+        for subscribers in legacy.values():
+            subscribers.discard(sid)
+
+    start = time.perf_counter()
+    for sid in sample:
+        legacy_disconnect(sid)
+    legacy_disconnect_seconds = (time.perf_counter() - start) / len(sample)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for sid in sample:
+            await websocket.disconnect(sid)
+        rooms_disconnect_seconds = (time.perf_counter() - start) / len(sample)
+
+        # Drop everyone else (untimed) to see what each layout keeps around
+        for sid in sids[disconnects:]:
+            legacy_disconnect(sid)
+            await websocket.disconnect(sid)
+
+    print(f"Connections: {connections}, tenants: {tenants} ({per_tenant} per tenant)")
+    print(f"Subscribe all: {subscribe_seconds:.2f}s")
+    print()
+    print(f"{'operation':<12} {'legacy dict':>14} {'rooms':>14} {'speedup':>9}")
+    for name, old, new in (
+        ("emit", legacy_emit_seconds, rooms_emit_seconds),
+        ("disconnect", legacy_disconnect_seconds, rooms_disconnect_seconds),
+    ):
+        print(
+            f"{name:<12} {old * 1e6:>11.1f} us {new * 1e6:>11.1f} us {old / new:>8.1f}x"
+        )
+    print()
+    print(
+        f"Packets per emit: legacy {legacy_delivered // emits}, rooms {rooms_delivered // emits}"
+    )
+    print(
+        "Tenant entries left after all clients disconnected: "
+        f"legacy {len(legacy)}, rooms {len(websocket.organization_subscriber_counts)}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=50000)
+    parser.add_argument("--tenants", type=int, default=5000)
+    parser.add_argument("--emits", type=int, default=2000)
+    parser.add_argument("--disconnects", type=int, default=2000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.connections, args.tenants, args.emits, args.disconnects))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ echo "🚀 Starting backend build process..."
 echo "📦 Installing Python dependencies..."
 pip install -r requirements.txt
 
-# Note: Database migrations are now handled at application startup
+# Note: Database migrations (alembic upgrade head) run at application startup
 # This prevents build failures when database is not available during build time
 echo "ℹ️  Database migrations will be handled at application startup"
 
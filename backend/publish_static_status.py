@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Publish static JSON/HTML status pages for every organization."""
+
+import argparse
+import asyncio
+import sys
+import logging
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Rebuild published status pages."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only rewrite organizations whose content changed since the last publish",
+    )
+    parser.add_argument("--output-dir", help="Override STATIC_PUBLISH_DIR for this run")
+    args = parser.parse_args()
+
+    try:
+        # Import after path setup
+        from app.core.config import settings
+        from app.db.session import AsyncSessionLocal, async_engine
+        from app.services.static_publisher import publish_all
+
+        if args.output_dir:
+            settings.STATIC_PUBLISH_DIR = args.output_dir
+
+        mode = "incremental" if args.incremental else "full"
+        logger.info(
+            f"🚀 Publishing status pages ({mode}) to {settings.STATIC_PUBLISH_DIR}"
+        )
+
+        async def run():
+            try:
+                async with AsyncSessionLocal() as db:
+                    return await publish_all(db, incremental=args.incremental)
+            finally:
+                # Pooled connections must be closed before the loop goes away
+                await async_engine.dispose()
+
+        result = asyncio.run(run())
+
+        logger.info(
+            f"✅ Published {result['published']}, skipped {result['skipped']}, "
+            f"failed {result['failed']}"
+        )
+        if result["failed"]:
+            sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"❌ Static publish failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ import type {
   OrganizationCreateRequest,
   UserCheckResponse,
   StatusPageResponse,
+  StatusPageBootstrapResponse,
   PublicService,
   PublicIncident,
   PublicMaintenance,
@@ -250,6 +251,16 @@ class ApiClient {
     return this.request<StatusPageResponse>(`/api/status/${orgSlug}`);
   }
 
+  async getPublicStatusBootstrap(
+    orgSlug: string,
+    timelineLimit = 5,
+    maintenanceLimit = 5
+  ): Promise<StatusPageBootstrapResponse> {
+    return this.request<StatusPageBootstrapResponse>(
+      `/api/status/${orgSlug}/bootstrap?timeline_limit=${timelineLimit}&maintenance_limit=${maintenanceLimit}`
+    );
+  }
+
   async getPublicServices(orgSlug: string): Promise<PublicService[]> {
     return this.request<PublicService[]>(`/api/status/${orgSlug}/services`);
   }
@@ -8,24 +8,63 @@ interface WebSocketMessage {
   type: string;
   data: Record<string, unknown>;
   tenant_id: number;
+  seq?: number;
+  epoch?: string;
+  event_id?: number | null;
+}
+
+// Outbox ids remembered to drop redelivered events (delivery is at-least-once)
+const RECENT_EVENT_IDS = 1000;
+
+// Last event seen per organization, sent back on resubscribe so the server
+// can replay only what was missed while disconnected
+interface StreamPosition {
+  epoch: string;
+  seq: number;
+}
+
+// Coalesced burst: the latest event per entity, in the order they happened
+interface BatchedEvents {
+  events: {
+    type: string;
+    data: Record<string, unknown>;
+    event_id?: number | null;
+  }[];
 }
 
 interface ServerToClientEvents {
   status_update: (data: WebSocketMessage) => void;
   connected: (data: { message: string }) => void;
-  subscribed: (data: { message: string; tenant_id: number }) => void;
+  subscribed: (
+    data: { message: string; tenant_id: number } & StreamPosition
+  ) => void;
+  resync_required: (data: { tenant_id: number } & StreamPosition) => void;
   unsubscribed: (data: { message: string; tenant_id: number }) => void;
   error: (data: { message: string }) => void;
 }
 
+// Only receive events about these services and/or of these types
+export interface SubscriptionTopics {
+  serviceIds?: number[];
+  eventTypes?: string[];
+}
+
 interface ClientToServerEvents {
-  subscribe_organization: (data: { tenant_id: number }) => void;
+  subscribe_organization: (data: {
+    tenant_id: number;
+    service_ids?: number[];
+    event_types?: string[];
+    last_seq?: number;
+    epoch?: string;
+  }) => void;
   unsubscribe_organization: (data: { tenant_id: number }) => void;
 }
 
 class SocketClient {
   private socket: Socket<ServerToClientEvents, ClientToServerEvents>;
   private listeners: Map<string, Set<EventCallback<unknown>>>;
+  private positions: Map<number, StreamPosition>;
+  private recentEventIds: Set<number>;
 
   constructor(url: string) {
     this.socket = io(url, {
@@ -39,6 +78,8 @@ class SocketClient {
       timeout: 20000,
     });
     this.listeners = new Map();
+    this.positions = new Map();
+    this.recentEventIds = new Set();
 
     // Set up reconnection handling
     this.socket.on("connect", () => {
@@ -54,7 +95,28 @@ class SocketClient {
     });
 
     // Set up event listeners
+    this.socket.on("subscribed", ({ tenant_id, epoch, seq }) => {
+      const position = this.positions.get(tenant_id);
+      if (position?.epoch === epoch && position.seq > seq) return;
+      this.positions.set(tenant_id, { epoch, seq });
+    });
+
+    // Too much was missed to replay: listeners should refetch from the API
+    this.socket.on("resync_required", (data) => {
+      this.positions.set(data.tenant_id, { epoch: data.epoch, seq: data.seq });
+      this.emit("resync_required", data);
+    });
+
     this.socket.on("status_update", (message: WebSocketMessage) => {
+      if (!this.advance(message)) return;
+      if (message.type === "batch") {
+        const { events } = message.data as unknown as BatchedEvents;
+        events
+          .filter((event) => this.firstDelivery(event.event_id))
+          .forEach((event) => this.emit(event.type, event.data));
+        return;
+      }
+      if (!this.firstDelivery(message.event_id)) return;
       // Route to specific event based on type
       this.emit(message.type, message.data);
     });
@@ -72,11 +134,21 @@ class SocketClient {
     return this.socket.connected;
   }
 
-  subscribeToOrganization(organizationId: number) {
-    this.socket.emit("subscribe_organization", { tenant_id: organizationId });
+  subscribeToOrganization(
+    organizationId: number,
+    topics?: SubscriptionTopics
+  ) {
+    const position = this.positions.get(organizationId);
+    this.socket.emit("subscribe_organization", {
+      tenant_id: organizationId,
+      ...(topics?.serviceIds && { service_ids: topics.serviceIds }),
+      ...(topics?.eventTypes && { event_types: topics.eventTypes }),
+      ...(position && { last_seq: position.seq, epoch: position.epoch }),
+    });
   }
 
   unsubscribeFromOrganization(organizationId: number) {
+    this.positions.delete(organizationId);
     this.socket.emit("unsubscribe_organization", { tenant_id: organizationId });
   }
 
@@ -91,6 +163,32 @@ class SocketClient {
     this.listeners.get(event)?.delete(callback as EventCallback<unknown>);
   }
 
+  // Record a sequenced message; false when it was already seen (replay overlap)
+  private advance(message: WebSocketMessage) {
+    if (message.seq === undefined || !message.epoch) return true;
+    const position = this.positions.get(message.tenant_id);
+    if (position?.epoch === message.epoch && message.seq <= position.seq) {
+      return false;
+    }
+    this.positions.set(message.tenant_id, {
+      epoch: message.epoch,
+      seq: message.seq,
+    });
+    return true;
+  }
+
+  // False when this outbox event was already delivered (dispatcher retry)
+  private firstDelivery(eventId?: number | null) {
+    if (eventId === undefined || eventId === null) return true;
+    if (this.recentEventIds.has(eventId)) return false;
+    this.recentEventIds.add(eventId);
+    if (this.recentEventIds.size > RECENT_EVENT_IDS) {
+      const oldest = this.recentEventIds.values().next().value as number;
+      this.recentEventIds.delete(oldest);
+    }
+    return true;
+  }
+
   private emit<T>(event: string, data: T) {
     this.listeners.get(event)?.forEach((callback) => {
       callback(data);
@@ -11,40 +11,28 @@ import {
 } from "lucide-react";
 import { api } from "../../lib/api";
 import { socket } from "../../lib/socket";
-import type { StatusPageResponse, ServiceStatus } from "../../types";
+import type { StatusPageBootstrapResponse, ServiceStatus } from "../../types";
 
 const StatusPage = () => {
   const { orgSlug } = useParams<{ orgSlug: string }>();
   const [isConnected, setIsConnected] = useState(false);
 
+  // Status page, recent incidents and recent maintenance in a single request
   const {
     data: statusData,
     refetch,
     isLoading,
     error,
     isError,
-  } = useQuery<StatusPageResponse>({
+  } = useQuery<StatusPageBootstrapResponse>({
     queryKey: ["public-status", orgSlug],
-    queryFn: () => api.getPublicStatusPage(orgSlug!),
+    queryFn: () => api.getPublicStatusBootstrap(orgSlug!, 5, 5),
     enabled: !!orgSlug,
     retry: 1, // Only retry once
   });
 
-  // Fetch recent incidents for timeline
-  const { data: recentIncidents } = useQuery({
-    queryKey: ["public-timeline", orgSlug],
-    queryFn: () => api.getPublicTimeline(orgSlug!, 5),
-    enabled: !!orgSlug && !!statusData,
-    retry: 1,
-  });
-
-  // Fetch recent maintenance for timeline
-  const { data: recentMaintenances } = useQuery({
-    queryKey: ["public-maintenances", orgSlug],
-    queryFn: () => api.getPublicMaintenances(orgSlug!, false),
-    enabled: !!orgSlug && !!statusData,
-    retry: 1,
-  });
+  const recentIncidents = statusData?.timeline;
+  const recentMaintenances = statusData?.recent_maintenances;
 
   useEffect(() => {
     if (orgSlug && statusData?.organization.id) {
@@ -66,8 +54,17 @@ const StatusPage = () => {
         setIsConnected(false);
       };
 
-      // Create a function to get the current refetch function
-      const getCurrentRefetch = () => refetch;
+      // Create a function to get the current refetch function. A batched
+      // status_update fires several handlers at once; refetch only once.
+      let refetchQueued = false;
+      const getCurrentRefetch = () => () => {
+        if (refetchQueued) return;
+        refetchQueued = true;
+        queueMicrotask(() => {
+          refetchQueued = false;
+          refetch();
+        });
+      };
 
       const handleStatusUpdate = () => {
         console.log("Received generic status update, refetching data");
@@ -100,6 +97,11 @@ const StatusPage = () => {
         getCurrentRefetch()(); // Refetch to show new maintenance
       };
 
+      const handleResyncRequired = () => {
+        console.log("Missed too many updates while disconnected, refetching");
+        getCurrentRefetch()();
+      };
+
       // Set up event listeners
       socket.on("connect", handleConnect);
       socket.on("disconnect", handleDisconnect);
@@ -111,6 +113,7 @@ const StatusPage = () => {
       socket.on("incident_created", handleIncidentCreated);
       socket.on("maintenance_update", handleMaintenanceUpdate);
       socket.on("maintenance_created", handleMaintenanceCreated);
+      socket.on("resync_required", handleResyncRequired);
 
       // Check initial connection status and set up periodic checks
       const checkConnection = () => {
@@ -159,6 +162,7 @@ const StatusPage = () => {
         socket.off("incident_created", handleIncidentCreated);
         socket.off("maintenance_update", handleMaintenanceUpdate);
         socket.off("maintenance_created", handleMaintenanceCreated);
+        socket.off("resync_required", handleResyncRequired);
         socket.unsubscribeFromOrganization(statusData.organization.id);
         socket.disconnect();
         setIsConnected(false);
@@ -185,11 +185,18 @@ export interface StatusPageResponse {
   active_maintenances: PublicMaintenance[];
 }
 
+export interface StatusPageBootstrapResponse extends StatusPageResponse {
+  timeline: PublicIncident[];
+  recent_maintenances: PublicMaintenance[];
+}
+
 // WebSocket message types
 export interface WebSocketMessage {
   type: string;
   data: Record<string, unknown>;
   tenant_id: number;
+  seq?: number;
+  epoch?: string;
 }
 
 // Auth check response